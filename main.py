@@ -17,6 +17,9 @@ from astrbot.api import AstrBotConfig
 from astrbot.api import logger
 
 
+STICKER_EXTENSIONS = frozenset({".png", ".jpg", ".jpeg", ".gif"})
+
+
 @dataclass
 class StickerPackMetadata:
     """Sticker pack metadata"""
@@ -191,14 +194,15 @@ class StickerPackManager:
             with open(metadata_file, 'r', encoding='utf-8') as f:
                 metadata_data = json.load(f)
                 
-            # Load sticker files
-            stickers = []
+            # Load sticker files (a stem shared by several formats is listed once)
+            stickers: Dict[str, None] = {}
             stickers_dir = pack_dir / "stickers"
             if stickers_dir.exists():
-                stickers = [
-                    f.stem for f in stickers_dir.iterdir()
-                    if f.is_file() and f.suffix in ['.png', '.jpg', '.jpeg', '.gif']
-                ]
+                with os.scandir(stickers_dir) as entries:
+                    for entry in entries:
+                        stem, dot, ext = entry.name.rpartition(".")
+                        if dot and stem and f".{ext.lower()}" in STICKER_EXTENSIONS and entry.is_file():
+                            stickers[stem] = None
                 
             pack = StickerPackMetadata(
                 name=metadata_data.get("name", pack_dir.name),
@@ -0,0 +1,12 @@
+"""Interpreter compatibility shims shared across the Meme Stickers plugin.
+
+Kept free of package imports so any module can use it without pulling in
+the rest of the plugin.
+"""
+
+import sys
+from typing import Any, Dict
+
+# ``slots=True`` drops the per-instance __dict__ (packs can hold thousands of
+# StickerInfo objects); the keyword only exists on Python 3.10+.
+_DATACLASS_SLOTS: Dict[str, Any] = {"slots": True} if sys.version_info >= (3, 10) else {}
@@ -0,0 +1,24 @@
+"""Hash object construction shared by the hub client and checksum utilities.
+
+Kept free of package imports so ``utils`` does not pull in the hub client.
+"""
+
+import hashlib
+from typing import Any
+
+try:
+    import blake3 as _blake3
+except ImportError:
+    _blake3 = None
+
+
+def _new_hash(algorithm: str) -> Any:
+    """Create a hash object for ``algorithm`` (hashlib names or blake3)"""
+    if algorithm == "blake3":
+        if _blake3 is None:
+            raise ValueError("Unsupported algorithm: blake3 (install the blake3 package)")
+        return _blake3.blake3(max_threads=_blake3.blake3.AUTO)
+    try:
+        return hashlib.new(algorithm)
+    except ValueError as e:
+        raise ValueError(f"Unsupported algorithm: {algorithm}") from e
@@ -21,8 +21,9 @@ Notes
 
 from __future__ import annotations
 
-from dataclasses import dataclass, field
-from typing import Any, Dict, Mapping, Optional, Sequence, Tuple, Union, TYPE_CHECKING, cast
+from dataclasses import dataclass, fields
+from functools import lru_cache
+from typing import Any, Callable, Dict, Mapping, Optional, Sequence, Tuple, Union, TYPE_CHECKING, cast
 from collections.abc import Mapping as ABCMapping
 
 from .consts import (
@@ -51,6 +52,7 @@ from .consts import (
     DEFAULT_TEXT_COLOR,
     PLUGIN_NAME,
 )
+from ._compat import _DATACLASS_SLOTS
 
 if TYPE_CHECKING:  # pragma: no cover - type checking only
     from astrbot.api.config import AstrBotConfig
@@ -61,24 +63,31 @@ else:  # pragma: no cover - fallback for test environments
 ColorTuple = Tuple[int, int, int, int]
 ColorValue = Union[str, Sequence[int]]
 
-_HEX_DIGITS = {"0", "1", "2", "3", "4", "5", "6", "7", "8", "9",
-               "a", "b", "c", "d", "e", "f", "A", "B", "C", "D", "E", "F"}
-
-_COLOR_FIELD_NAMES = (
-    "render_background_color",
-    "render_text_color",
-    "render_accent_color",
-    "render_shadow_color",
-    "render_outline_color",
-    "grid_background_color",
-    "grid_text_color",
-    "grid_border_color",
-)
+_COLOR_POOL: Dict[ColorTuple, ColorTuple] = {
+    color: color
+    for color in (
+        DEFAULT_BACKGROUND_COLOR,
+        DEFAULT_TEXT_COLOR,
+        DEFAULT_ACCENT_COLOR,
+        DEFAULT_SHADOW_COLOR,
+        DEFAULT_OUTLINE_COLOR,
+        DEFAULT_GRID_BACKGROUND_COLOR,
+        DEFAULT_GRID_TEXT_COLOR,
+        DEFAULT_GRID_BORDER_COLOR,
+    )
+}
+
+_BOOL_TRUE = frozenset({"true", "1", "yes", "on"})
+_BOOL_FALSE = frozenset({"false", "0", "no", "off"})
 
 
 def resolve_color_to_tuple(color: ColorValue) -> ColorTuple:
     """Normalise a colour value into an RGBA tuple.
 
+    Results are memoised, so resolving the same colour again (as every
+    configuration refresh does) is a cache lookup. Sequence inputs are
+    converted to tuples first so lists share cache entries with tuples.
+
     Args:
         color: The colour expressed either as a hex string (``#RGB``,
             ``#RGBA``, ``#RRGGBB`` or ``#RRGGBBAA``) or as a 3/4 element
@@ -91,6 +100,19 @@ def resolve_color_to_tuple(color: ColorValue) -> ColorTuple:
         ValueError: If the input cannot be interpreted as a valid colour.
     """
 
+    if not isinstance(color, str) and isinstance(color, Sequence):
+        color = tuple(color)
+
+    try:
+        return _resolve_color_cached(color)
+    except TypeError:
+        # Unhashable contents (e.g. nested lists) cannot be cached
+        return _resolve_color(color)
+
+
+def _resolve_color(color: ColorValue) -> ColorTuple:
+    """Uncached implementation of :func:`resolve_color_to_tuple`."""
+
     if isinstance(color, str):
         value = color.strip()
         if not value.startswith("#"):
@@ -99,8 +121,6 @@ def resolve_color_to_tuple(color: ColorValue) -> ColorTuple:
         hex_value = value[1:]
         if not hex_value:
             raise ValueError("Hex colour string cannot be empty")
-        if not all(ch in _HEX_DIGITS for ch in hex_value):
-            raise ValueError(f"Invalid hex colour string: {color!r}")
 
         if len(hex_value) in (3, 4):
             hex_value = "".join(ch * 2 for ch in hex_value)
@@ -113,16 +133,16 @@ def resolve_color_to_tuple(color: ColorValue) -> ColorTuple:
             hex_value += "FF"
 
         try:
-            components = tuple(
-                int(hex_value[i : i + 2], 16) for i in range(0, len(hex_value), 2)
-            )
-        except ValueError as exc:  # pragma: no cover - guarded above, safety net
+            components = bytes.fromhex(hex_value)
+        except ValueError as exc:
             raise ValueError(f"Invalid hex colour string: {color!r}") from exc
 
+        # fromhex skips whitespace between digit pairs, which leaves fewer
+        # than four channels
         if len(components) != 4:
-            raise ValueError("Hex colour must resolve to four channels")
+            raise ValueError(f"Invalid hex colour string: {color!r}")
 
-        return cast(ColorTuple, components)
+        return _intern_color(cast(ColorTuple, tuple(components)))
 
     if isinstance(color, Sequence):
         try:
@@ -130,21 +150,116 @@ def resolve_color_to_tuple(color: ColorValue) -> ColorTuple:
         except (TypeError, ValueError) as exc:
             raise ValueError(f"Colour sequence must contain integers: {color!r}") from exc
 
-        if len(components) not in (3, 4):
+        if len(components) == 3:
+            components = components + (255,)
+        elif len(components) != 4:
             raise ValueError("Colour sequence must have 3 (RGB) or 4 (RGBA) values")
 
-        if any(component < 0 or component > 255 for component in components):
+        # OR-ing the channels checks all of them at once: the result is
+        # negative if any channel is, and above 0xFF if any channel exceeds it
+        red, green, blue, alpha = components
+        if not 0 <= (red | green | blue | alpha) <= 0xFF:
             raise ValueError("Colour components must be between 0 and 255")
 
-        if len(components) == 3:
-            components = components + (255,)
-
-        return cast(ColorTuple, components)
+        return _intern_color(cast(ColorTuple, components))
 
     raise ValueError(f"Unsupported colour value: {color!r}")
 
 
-@dataclass(frozen=True)
+_resolve_color_cached = lru_cache(maxsize=256)(_resolve_color)
+
+
+def _intern_color(color: ColorTuple) -> ColorTuple:
+    """Return the shared instance of ``color`` from the colour pool.
+
+    Different spellings of a colour (``#fff``, ``#FFFFFFFF``, ``(255, 255, 255)``)
+    all resolve to the same tuple object, so configurations share it.
+    """
+
+    return _COLOR_POOL.setdefault(color, color)
+
+
+def _coerce_optional_str(value: Any, name: str, default: Optional[str]) -> Optional[str]:
+    if value is None:
+        return default
+    if isinstance(value, str):
+        stripped = value.strip()
+        if not stripped:
+            return None
+        return stripped
+    return str(value)
+
+
+def _coerce_required_str(value: Any, name: str, default: str) -> str:
+    if value is None:
+        value = default
+    if isinstance(value, str):
+        stripped = value.strip()
+        if not stripped:
+            raise ValueError(f"{name} cannot be empty")
+        return stripped
+    return str(value)
+
+
+def _coerce_int(value: Any, name: str, default: int, *, minimum: Optional[int] = None) -> int:
+    try:
+        as_int = int(value)
+    except (TypeError, ValueError) as exc:
+        raise ValueError(f"{name} must be an integer") from exc
+    if minimum is not None and as_int < minimum:
+        raise ValueError(f"{name} must be >= {minimum}")
+    return as_int
+
+
+def _coerce_float(
+    value: Any, name: str, default: float, *, minimum: Optional[float] = None
+) -> float:
+    try:
+        as_float = float(value)
+    except (TypeError, ValueError) as exc:
+        raise ValueError(f"{name} must be a number") from exc
+    if minimum is not None and as_float < minimum:
+        raise ValueError(f"{name} must be >= {minimum}")
+    return as_float
+
+
+def _coerce_bool(value: Any, name: str, default: bool) -> bool:
+    if isinstance(value, bool):
+        return value
+    if isinstance(value, str):
+        lowered = value.strip().lower()
+        if lowered in _BOOL_TRUE:
+            return True
+        if lowered in _BOOL_FALSE:
+            return False
+        raise ValueError(f"{name} must be a boolean value")
+    if isinstance(value, (int, float)):
+        return bool(value)
+    raise ValueError(f"{name} must be a boolean value")
+
+
+# (field name, coercer, default, coercer options) for every non-colour field
+# resolved by Config.from_mapping
+_FIELD_SPEC: Tuple[Tuple[str, Callable[..., Any], Any, Dict[str, Any]], ...] = (
+    ("hub_url", _coerce_required_str, DEFAULT_HUB_URL, {}),
+    ("hub_enable", _coerce_bool, DEFAULT_HUB_ENABLE, {}),
+    ("proxy", _coerce_optional_str, DEFAULT_PROXY, {}),
+    ("github_raw_template", _coerce_required_str, DEFAULT_GITHUB_RAW_TEMPLATE, {}),
+    ("github_release_template", _coerce_required_str, DEFAULT_GITHUB_RELEASE_TEMPLATE, {}),
+    ("max_concurrent_downloads", _coerce_int, DEFAULT_MAX_CONCURRENCY, {"minimum": 1}),
+    ("request_timeout", _coerce_float, DEFAULT_HTTP_TIMEOUT, {"minimum": 0.0}),
+    ("retry_attempts", _coerce_int, DEFAULT_RETRY_ATTEMPTS, {"minimum": 0}),
+    ("retry_delay", _coerce_float, DEFAULT_RETRY_DELAY, {"minimum": 0.0}),
+    ("retry_backoff", _coerce_float, DEFAULT_RETRY_BACKOFF, {"minimum": 0.0}),
+    ("auto_update", _coerce_bool, DEFAULT_AUTO_UPDATE, {}),
+    ("force_update", _coerce_bool, DEFAULT_FORCE_UPDATE, {}),
+    ("prompt_timeout", _coerce_float, DEFAULT_PROMPT_TIMEOUT, {"minimum": 0.0}),
+    ("render_font_family", _coerce_required_str, DEFAULT_FONT_FAMILY, {}),
+    ("render_font_size", _coerce_int, DEFAULT_FONT_SIZE, {"minimum": 1}),
+)
+
+
+@dataclass(frozen=True, **_DATACLASS_SLOTS)
 class Config:
     """Resolved configuration for the Meme Stickers plugin."""
 
@@ -164,14 +279,14 @@ class Config:
     prompt_timeout: float = DEFAULT_PROMPT_TIMEOUT
     render_font_family: str = DEFAULT_FONT_FAMILY
     render_font_size: int = DEFAULT_FONT_SIZE
-    render_background_color: ColorTuple = field(default_factory=lambda: DEFAULT_BACKGROUND_COLOR)
-    render_text_color: ColorTuple = field(default_factory=lambda: DEFAULT_TEXT_COLOR)
-    render_accent_color: ColorTuple = field(default_factory=lambda: DEFAULT_ACCENT_COLOR)
-    render_shadow_color: ColorTuple = field(default_factory=lambda: DEFAULT_SHADOW_COLOR)
-    render_outline_color: ColorTuple = field(default_factory=lambda: DEFAULT_OUTLINE_COLOR)
-    grid_background_color: ColorTuple = field(default_factory=lambda: DEFAULT_GRID_BACKGROUND_COLOR)
-    grid_text_color: ColorTuple = field(default_factory=lambda: DEFAULT_GRID_TEXT_COLOR)
-    grid_border_color: ColorTuple = field(default_factory=lambda: DEFAULT_GRID_BORDER_COLOR)
+    render_background_color: ColorTuple = DEFAULT_BACKGROUND_COLOR
+    render_text_color: ColorTuple = DEFAULT_TEXT_COLOR
+    render_accent_color: ColorTuple = DEFAULT_ACCENT_COLOR
+    render_shadow_color: ColorTuple = DEFAULT_SHADOW_COLOR
+    render_outline_color: ColorTuple = DEFAULT_OUTLINE_COLOR
+    grid_background_color: ColorTuple = DEFAULT_GRID_BACKGROUND_COLOR
+    grid_text_color: ColorTuple = DEFAULT_GRID_TEXT_COLOR
+    grid_border_color: ColorTuple = DEFAULT_GRID_BORDER_COLOR
 
     @classmethod
     def from_mapping(
@@ -193,154 +308,116 @@ class Config:
             A fully realised :class:`Config` instance.
 
         Raises:
-            ValueError: If the provided configuration is invalid.
+            ValueError: If the provided configuration is invalid. The message
+                lists every invalid field.
         """
 
         combined: Dict[str, Any] = {}
         if mapping:
-            combined.update(dict(mapping))
+            combined.update(mapping)
         if overrides:
-            combined.update(dict(overrides))
-
-        def _get_optional_str(name: str, default: Optional[str]) -> Optional[str]:
-            value = combined.get(name, default)
-            if value is None:
-                return default
-            if isinstance(value, str):
-                stripped = value.strip()
-                if not stripped:
-                    return None
-                return stripped
-            return str(value)
-
-        def _get_required_str(name: str, default: str) -> str:
-            value = combined.get(name, default)
-            if value is None:
-                value = default
-            if isinstance(value, str):
-                stripped = value.strip()
-                if not stripped:
-                    raise ValueError(f"{name} cannot be empty")
-                return stripped
-            return str(value)
-
-        def _get_int(name: str, default: int, *, minimum: Optional[int] = None) -> int:
-            value = combined.get(name, default)
-            try:
-                as_int = int(value)
-            except (TypeError, ValueError) as exc:
-                raise ValueError(f"{name} must be an integer") from exc
-            if minimum is not None and as_int < minimum:
-                raise ValueError(f"{name} must be >= {minimum}")
-            return as_int
-
-        def _get_float(name: str, default: float, *, minimum: Optional[float] = None) -> float:
-            value = combined.get(name, default)
+            combined.update(overrides)
+
+        # Every field is validated so a misconfiguration reports all of its
+        # problems in one go rather than one per attempt
+        resolved: Dict[str, Any] = {"plugin_name": plugin_name}
+        errors: list[str] = []
+        for name, coercer, default, options in _FIELD_SPEC:
             try:
-                as_float = float(value)
-            except (TypeError, ValueError) as exc:
-                raise ValueError(f"{name} must be a number") from exc
-            if minimum is not None and as_float < minimum:
-                raise ValueError(f"{name} must be >= {minimum}")
-            return as_float
-
-        def _get_bool(name: str, default: bool) -> bool:
-            value = combined.get(name, default)
-            if isinstance(value, bool):
-                return value
-            if isinstance(value, str):
-                lowered = value.strip().lower()
-                if lowered in {"true", "1", "yes", "on"}:
-                    return True
-                if lowered in {"false", "0", "no", "off"}:
-                    return False
-                raise ValueError(f"{name} must be a boolean value")
-            if isinstance(value, (int, float)):
-                return bool(value)
-            raise ValueError(f"{name} must be a boolean value")
-
-        color_defaults: Dict[str, ColorTuple] = {
-            "render_background_color": DEFAULT_BACKGROUND_COLOR,
-            "render_text_color": DEFAULT_TEXT_COLOR,
-            "render_accent_color": DEFAULT_ACCENT_COLOR,
-            "render_shadow_color": DEFAULT_SHADOW_COLOR,
-            "render_outline_color": DEFAULT_OUTLINE_COLOR,
-            "grid_background_color": DEFAULT_GRID_BACKGROUND_COLOR,
-            "grid_text_color": DEFAULT_GRID_TEXT_COLOR,
-            "grid_border_color": DEFAULT_GRID_BORDER_COLOR,
-        }
-
-        resolved_colors: Dict[str, ColorTuple] = {}
+                resolved[name] = coercer(combined.get(name, default), name, default, **options)
+            except ValueError as exc:
+                errors.append(str(exc))
+
         for field_name in _COLOR_FIELD_NAMES:
             if field_name in combined:
-                resolved_colors[field_name] = resolve_color_to_tuple(combined[field_name])
+                try:
+                    resolved[field_name] = resolve_color_to_tuple(combined[field_name])
+                except ValueError as exc:
+                    errors.append(f"{field_name}: {exc}")
             else:
-                resolved_colors[field_name] = color_defaults[field_name]
-
-        return cls(
-            plugin_name=plugin_name,
-            hub_url=_get_required_str("hub_url", DEFAULT_HUB_URL),
-            hub_enable=_get_bool("hub_enable", DEFAULT_HUB_ENABLE),
-            proxy=_get_optional_str("proxy", DEFAULT_PROXY),
-            github_raw_template=_get_required_str(
-                "github_raw_template", DEFAULT_GITHUB_RAW_TEMPLATE
-            ),
-            github_release_template=_get_required_str(
-                "github_release_template", DEFAULT_GITHUB_RELEASE_TEMPLATE
-            ),
-            max_concurrent_downloads=_get_int(
-                "max_concurrent_downloads", DEFAULT_MAX_CONCURRENCY, minimum=1
-            ),
-            request_timeout=_get_float("request_timeout", DEFAULT_HTTP_TIMEOUT, minimum=0.0),
-            retry_attempts=_get_int("retry_attempts", DEFAULT_RETRY_ATTEMPTS, minimum=0),
-            retry_delay=_get_float("retry_delay", DEFAULT_RETRY_DELAY, minimum=0.0),
-            retry_backoff=_get_float("retry_backoff", DEFAULT_RETRY_BACKOFF, minimum=0.0),
-            auto_update=_get_bool("auto_update", DEFAULT_AUTO_UPDATE),
-            force_update=_get_bool("force_update", DEFAULT_FORCE_UPDATE),
-            prompt_timeout=_get_float("prompt_timeout", DEFAULT_PROMPT_TIMEOUT, minimum=0.0),
-            render_font_family=_get_required_str(
-                "render_font_family", DEFAULT_FONT_FAMILY
-            ),
-            render_font_size=_get_int("render_font_size", DEFAULT_FONT_SIZE, minimum=1),
-            render_background_color=resolved_colors["render_background_color"],
-            render_text_color=resolved_colors["render_text_color"],
-            render_accent_color=resolved_colors["render_accent_color"],
-            render_shadow_color=resolved_colors["render_shadow_color"],
-            render_outline_color=resolved_colors["render_outline_color"],
-            grid_background_color=resolved_colors["grid_background_color"],
-            grid_text_color=resolved_colors["grid_text_color"],
-            grid_border_color=resolved_colors["grid_border_color"],
-        )
+                resolved[field_name] = _COLOR_DEFAULTS[field_name]
+
+        if errors:
+            raise ValueError("Invalid configuration: " + "; ".join(errors))
+
+        return cls(**resolved)
 
     def to_dict(self) -> Dict[str, Any]:
         """Copiable representation of the configuration."""
 
-        return {
-            "plugin_name": self.plugin_name,
-            "hub_url": self.hub_url,
-            "hub_enable": self.hub_enable,
-            "proxy": self.proxy,
-            "github_raw_template": self.github_raw_template,
-            "github_release_template": self.github_release_template,
-            "max_concurrent_downloads": self.max_concurrent_downloads,
-            "request_timeout": self.request_timeout,
-            "retry_attempts": self.retry_attempts,
-            "retry_delay": self.retry_delay,
-            "retry_backoff": self.retry_backoff,
-            "auto_update": self.auto_update,
-            "force_update": self.force_update,
-            "prompt_timeout": self.prompt_timeout,
-            "render_font_family": self.render_font_family,
-            "render_font_size": self.render_font_size,
-            "render_background_color": self.render_background_color,
-            "render_text_color": self.render_text_color,
-            "render_accent_color": self.render_accent_color,
-            "render_shadow_color": self.render_shadow_color,
-            "render_outline_color": self.render_outline_color,
-            "grid_background_color": self.grid_background_color,
-            "grid_text_color": self.grid_text_color,
-            "grid_border_color": self.grid_border_color,
-        }
+        return {name: getattr(self, name) for name in _CONFIG_FIELD_NAMES}
+
+
+_CONFIG_FIELD_NAMES: Tuple[str, ...] = tuple(f.name for f in fields(Config))
+# Colour fields are the ones annotated as ColorTuple (a string under
+# postponed annotations)
+_COLOR_FIELD_NAMES: Tuple[str, ...] = tuple(
+    f.name for f in fields(Config) if f.type in ("ColorTuple", ColorTuple)
+)
+_COLOR_DEFAULTS: Dict[str, ColorTuple] = {
+    f.name: f.default for f in fields(Config) if f.name in _COLOR_FIELD_NAMES
+}
+
+
+_ConfigProbe = Callable[[Any, str], Any]
+
+
+def _is_mapping(value: Any) -> bool:
+    """Mapping check with a fast path for plain dicts.
+
+    ``isinstance`` against the ``Mapping`` ABC goes through ABC subclass
+    hooks; AstrBot config sections are normally plain dicts, which a direct
+    type check handles far faster.
+    """
+    return isinstance(value, dict) or isinstance(value, ABCMapping)
+
+
+def _probe_plugins(astrbot_config: Any, plugin_name: str) -> Any:
+    """``astrbot_config.plugins[plugin_name]``"""
+    plugins_section = getattr(astrbot_config, "plugins", None)
+    if _is_mapping(plugins_section):
+        return plugins_section.get(plugin_name)
+    return None
+
+
+def _probe_plugin_config(astrbot_config: Any, plugin_name: str) -> Any:
+    """``astrbot_config.plugin_config[plugin_name]`` (or its nested ``plugins``)"""
+    plugin_config = getattr(astrbot_config, "plugin_config", None)
+    if _is_mapping(plugin_config):
+        if plugin_name in plugin_config:
+            return plugin_config.get(plugin_name)
+        nested_plugins = plugin_config.get("plugins")
+        if _is_mapping(nested_plugins):
+            return nested_plugins.get(plugin_name)
+    return None
+
+
+def _probe_dashboard_config(astrbot_config: Any, plugin_name: str) -> Any:
+    """``astrbot_config.config['plugins'][plugin_name]`` (dashboard export)"""
+    full_config = getattr(astrbot_config, "config", None)
+    if _is_mapping(full_config):
+        nested_plugins = full_config.get("plugins")
+        if _is_mapping(nested_plugins):
+            return nested_plugins.get(plugin_name)
+    return None
+
+
+def _probe_get(astrbot_config: Any, plugin_name: str) -> Any:
+    """``astrbot_config.get(plugin_name)``"""
+    if hasattr(astrbot_config, "get"):
+        try:
+            return astrbot_config.get(plugin_name)
+        except TypeError:
+            return None
+    return None
+
+
+_CONFIG_PROBES: Tuple[_ConfigProbe, ...] = (
+    _probe_plugins,
+    _probe_plugin_config,
+    _probe_dashboard_config,
+    _probe_get,
+)
 
 
 class ConfigWrapper:
@@ -350,8 +427,12 @@ class ConfigWrapper:
     ``AstrBotConfig`` instance and exposes both the raw mapping as well as the
     validated :class:`Config`. This mirrors the ergonomics of the original
     NoneBot-based implementation without depending on any of its helpers.
+    The :class:`Config` itself is only resolved (and validated) when it is
+    first accessed after a change.
     """
 
+    __slots__ = ("_astrbot_config", "plugin_name", "_raw_cache", "_config")
+
     def __init__(
         self,
         astrbot_config: "AstrBotConfig",
@@ -385,17 +466,31 @@ class ConfigWrapper:
                 configuration. These overrides are applied on each refresh call.
         """
 
-        self._raw_cache = self._extract_plugin_config()
+        raw = self._extract_plugin_config()
         if overrides:
-            self._raw_cache.update(dict(overrides))
-        self._config = Config.from_mapping(self._raw_cache, plugin_name=self.plugin_name)
+            raw.update(overrides)
+
+        # The resolved Config is derived purely from the raw mapping, so an
+        # unchanged mapping means there is nothing to invalidate
+        if raw == self._raw_cache:
+            return
+
+        self._raw_cache = raw
+        self._config = None
 
     def apply_overrides(self, overrides: Mapping[str, Any]) -> Config:
         """Update the current configuration using the provided overrides."""
 
-        self._raw_cache.update(dict(overrides))
-        self._config = Config.from_mapping(self._raw_cache, plugin_name=self.plugin_name)
-        return self._config
+        raw = {**self._raw_cache, **overrides}
+        if raw != self._raw_cache:
+            self._raw_cache = raw
+            self._config = None
+        return self.config
+
+    def invalidate(self) -> None:
+        """Drop the resolved :class:`Config` so it is rebuilt on next use."""
+
+        self._config = None
 
     def _extract_plugin_config(self) -> Dict[str, Any]:
         """Extract the plugin configuration from ``AstrBotConfig``.
@@ -410,40 +505,20 @@ class ConfigWrapper:
         4. ``astrbot_config.get(plugin_name)`` if the object implements ``get``
 
         All discovered mappings are merged, with later entries taking priority.
+        Every lookup runs on each refresh, so sections added later are seen.
         """
 
-        candidates: list[Mapping[str, Any]] = []
-
-        def _maybe_add(mapping: Any) -> None:
-            if isinstance(mapping, ABCMapping):
+        candidates = []
+        for probe in _CONFIG_PROBES:
+            mapping = probe(self._astrbot_config, self.plugin_name)
+            if _is_mapping(mapping):
                 candidates.append(mapping)
 
-        plugins_section = getattr(self._astrbot_config, "plugins", None)
-        if isinstance(plugins_section, ABCMapping):
-            plugin_specific = plugins_section.get(self.plugin_name)
-            _maybe_add(plugin_specific)
-
-        plugin_config = getattr(self._astrbot_config, "plugin_config", None)
-        if isinstance(plugin_config, ABCMapping):
-            if self.plugin_name in plugin_config:
-                _maybe_add(plugin_config.get(self.plugin_name))
-            else:
-                nested_plugins = plugin_config.get("plugins")
-                if isinstance(nested_plugins, ABCMapping):
-                    _maybe_add(nested_plugins.get(self.plugin_name))
-
-        full_config = getattr(self._astrbot_config, "config", None)
-        if isinstance(full_config, ABCMapping):
-            nested_plugins = full_config.get("plugins")
-            if isinstance(nested_plugins, ABCMapping):
-                _maybe_add(nested_plugins.get(self.plugin_name))
+        return self._merge_candidates(candidates)
 
-        if hasattr(self._astrbot_config, "get"):
-            try:
-                candidate = self._astrbot_config.get(self.plugin_name)  # type: ignore[misc]
-            except TypeError:
-                candidate = None
-            _maybe_add(candidate)
+    @staticmethod
+    def _merge_candidates(candidates: Sequence[Mapping[str, Any]]) -> Dict[str, Any]:
+        """Merge discovered mappings, later entries taking priority."""
 
         merged: Dict[str, Any] = {}
         for mapping in candidates:
@@ -1,40 +1,45 @@
 """
 Drawing utilities for Meme Stickers plugin.
 Provides Skia-based rendering for stickers, grids, and help images.
+
+Submodules are imported on first attribute access so that importing the
+package (or anything under it) does not load Skia until a renderer is used.
 """
 
-from .tools import (
-    FontCollection,
-    SurfaceManager,
-    DrawingHelpers,
-    load_image_from_path,
-    scale_image,
-)
-from .sticker import (
-    StickerParams,
-    StickerRenderer,
-    create_simple_sticker,
-)
-from .grid import (
-    GridRenderer,
-    create_simple_grid,
-)
-from .pack_list import (
-    PackListRenderer,
-    create_help_text_image,
-)
-
-__all__ = [
-    "FontCollection",
-    "SurfaceManager",
-    "DrawingHelpers",
-    "load_image_from_path",
-    "scale_image",
-    "StickerParams",
-    "StickerRenderer",
-    "create_simple_sticker",
-    "GridRenderer",
-    "create_simple_grid",
-    "PackListRenderer",
-    "create_help_text_image",
-]
+import importlib
+from typing import Any, List
+
+_LAZY_ATTRS = {
+    "FontCollection": "tools",
+    "SurfaceManager": "tools",
+    "DrawingHelpers": "tools",
+    "load_image_from_path": "tools",
+    "scale_image": "tools",
+    "StickerParams": "sticker",
+    "StickerRenderer": "sticker",
+    "create_simple_sticker": "sticker",
+    "GridRenderer": "grid",
+    "create_simple_grid": "grid",
+    "PackListRenderer": "pack_list",
+    "create_help_text_image": "pack_list",
+}
+
+__all__ = list(_LAZY_ATTRS)
+
+
+def __getattr__(name: str) -> Any:
+    """Import the submodule providing ``name`` on first access."""
+    try:
+        module_name = _LAZY_ATTRS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+
+    module = importlib.import_module(f".{module_name}", __name__)
+    value = getattr(module, name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    """List lazily exported names alongside the module globals."""
+    return sorted(set(globals()) | set(_LAZY_ATTRS))
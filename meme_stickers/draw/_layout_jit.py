@@ -0,0 +1,41 @@
+"""
+Grid layout kernel for large grids.
+Compiled with Numba when it is installed, otherwise evaluated with NumPy.
+"""
+
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+
+def _grid_layout_loop(n: int, cols: int, cell_size: int, padding: int,
+                      title_offset: int) -> np.ndarray:
+    """Compute cell positions with an explicit loop (Numba kernel body)."""
+    out = np.empty((n, 2), dtype=np.int32)
+    for idx in range(n):
+        row = idx // cols
+        col = idx % cols
+        out[idx, 0] = col * cell_size + (col + 1) * padding
+        out[idx, 1] = title_offset + row * cell_size + (row + 1) * padding
+    return out
+
+
+def _grid_layout_numpy(n: int, cols: int, cell_size: int, padding: int,
+                       title_offset: int) -> np.ndarray:
+    """Compute cell positions with vectorized NumPy operations."""
+    rows, cols_i = np.divmod(np.arange(n, dtype=np.int32), cols)
+    out = np.empty((n, 2), dtype=np.int32)
+    out[:, 0] = cols_i * cell_size + (cols_i + 1) * padding
+    out[:, 1] = title_offset + rows * cell_size + (rows + 1) * padding
+    return out
+
+
+# Public entry point: ``grid_layout(n, cols, cell_size, padding, title_offset)``
+# returns an ``(n, 2)`` int32 array of ``[x, y]`` cell positions.
+if njit is not None:
+    grid_layout = njit(cache=True)(_grid_layout_loop)
+else:
+    grid_layout = _grid_layout_numpy
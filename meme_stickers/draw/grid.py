@@ -3,10 +3,14 @@ Sticker grid rendering utilities using Skia.
 Handles drawing grids of stickers and preview layouts.
 """
 
+import threading
+import numpy as np
 import skia
 from pathlib import Path
-from typing import List, Optional, Tuple
-from .tools import FontCollection, SurfaceManager, DrawingHelpers, load_image_from_path, scale_image
+from concurrent.futures import Future
+from contextlib import contextmanager
+from typing import Dict, Iterator, List, Optional, Tuple
+from .tools import FontCollection, SurfaceManager, DrawingHelpers, surface_scope, _FONTS, _load_scaled
 
 
 class GridRenderer:
@@ -17,9 +21,28 @@ class GridRenderer:
     TITLE_HEIGHT = 40
     FONT_SIZE = 14.0
     
-    def __init__(self):
-        """Initialize grid renderer."""
-        self.font_collection = FontCollection()
+    BORDER_COLOR = (200, 200, 200, 255)
+    LAYOUT_JIT_THRESHOLD = 64
+    EMPTY_GRID_CACHE_SIZE = 32
+    
+    # Encoded "no images" placeholders shared by all renderers, keyed by
+    # (font collection, title); renders can run on pool worker threads
+    _empty_grid_cache: Dict[Tuple[FontCollection, Optional[str]], bytes] = {}
+    _empty_grid_lock = threading.Lock()
+    
+    def __init__(self, font_collection: Optional[FontCollection] = None):
+        """
+        Initialize grid renderer.
+        
+        Args:
+            font_collection: Font collection to share; a new one is created if omitted
+        """
+        self.font_collection = font_collection if font_collection is not None else FontCollection()
+        self._border_paint = skia.Paint(
+            Style=skia.Paint.kStroke_Style,
+            StrokeWidth=1.0,
+            Color=skia.Color(*self.BORDER_COLOR),
+        )
     
     def render_grid(self, images: List[Path], cols: int = 4, title: Optional[str] = None) -> bytes:
         """
@@ -34,37 +57,10 @@ class GridRenderer:
             PNG image bytes
         """
         if not images:
-            return self._create_empty_grid(title)
-        
-        # Calculate grid dimensions
-        rows = (len(images) + cols - 1) // cols
-        title_offset = self.TITLE_HEIGHT if title else 0
-        width = cols * self.CELL_SIZE + (cols + 1) * self.PADDING
-        height = title_offset + rows * self.CELL_SIZE + (rows + 1) * self.PADDING
+            return self._empty_grid_png(title)
         
-        # Create surface
-        surface = SurfaceManager.create_raster_surface(width, height)
-        canvas = surface.getCanvas()
-        
-        # Fill white background
-        bg_color = (255, 255, 255, 255)
-        bg_rect = skia.Rect.MakeWH(width, height)
-        DrawingHelpers.fill_rect(canvas, bg_rect, bg_color)
-        
-        # Draw title if provided
-        if title:
-            self._draw_title(canvas, title, width)
-        
-        # Draw grid cells
-        for idx, image_path in enumerate(images):
-            row = idx // cols
-            col = idx % cols
-            x = col * self.CELL_SIZE + (col + 1) * self.PADDING
-            y = title_offset + row * self.CELL_SIZE + (row + 1) * self.PADDING
-            
-            self._draw_grid_cell(canvas, image_path, x, y)
-        
-        return SurfaceManager.get_png_bytes(surface)
+        with self._grid_surface(images, cols, title) as surface:
+            return SurfaceManager.get_png_bytes(surface)
     
     def render_grid_to_file(self, images: List[Path], output_path: Path, 
                            cols: int = 4, title: Optional[str] = None) -> bool:
@@ -81,23 +77,131 @@ class GridRenderer:
             True if successful, False otherwise
         """
         try:
-            if not images:
-                bytes_data = self._create_empty_grid(title)
-            else:
-                bytes_data = self.render_grid(images, cols, title)
-            
-            if output_path.suffix.lower() in ['.jpg', '.jpeg']:
-                temp_surface = SurfaceManager.create_raster_surface(1, 1)
-                # Use get_jpeg_bytes to encode
-                image = skia.Image.MakeFromEncoded(skia.Data.MakeWithoutCopy(bytes_data))
-                SurfaceManager.save_jpeg(temp_surface, output_path)
-            else:
-                output_path.write_bytes(bytes_data)
+            with self._grid_surface(images, cols, title) as surface:
+                # Encode the rendered surface straight to the requested format
+                suffix = output_path.suffix.lower()
+                if suffix == '.jpg' or suffix == '.jpeg':
+                    SurfaceManager.save_jpeg(surface, output_path)
+                elif suffix == '.webp':
+                    SurfaceManager.save_webp(surface, output_path)
+                else:
+                    SurfaceManager.save_png(surface, output_path)
             
             return True
         except Exception:
             return False
     
+    def submit_render_grid(self, images: List[Path], cols: int = 4,
+                           title: Optional[str] = None) -> "Future[bytes]":
+        """
+        Render a grid of images on the render thread pool.
+        
+        Draw calls are recorded into a picture on the calling thread; the
+        picture is rasterized and PNG-encoded on a worker thread.
+        
+        Args:
+            images: List of image paths to render
+            cols: Number of columns in grid
+            title: Optional title for the grid
+            
+        Returns:
+            Future resolving to PNG image bytes
+        """
+        width, height = self._grid_size(images, cols, title)
+        picture = SurfaceManager.record_picture(
+            width, height, lambda canvas: self._draw_grid(canvas, images, cols, title, width)
+        )
+        return SurfaceManager.submit_picture_png(picture, width, height)
+    
+    @contextmanager
+    def _grid_surface(self, images: List[Path], cols: int = 4,
+                      title: Optional[str] = None) -> Iterator[skia.Surface]:
+        """
+        Render a grid of images onto a pooled surface.
+        
+        Args:
+            images: List of image paths to render
+            cols: Number of columns in grid
+            title: Optional title for the grid
+            
+        Yields:
+            Skia Surface holding the rendered grid, valid inside the block
+        """
+        width, height = self._grid_size(images, cols, title)
+        with surface_scope(width, height) as surface:
+            self._draw_grid(surface.getCanvas(), images, cols, title, width)
+            yield surface
+    
+    def _grid_size(self, images: List[Path], cols: int, title: Optional[str]) -> Tuple[int, int]:
+        """
+        Calculate the pixel size of a grid image.
+        
+        Args:
+            images: List of image paths to render
+            cols: Number of columns in grid
+            title: Optional title for the grid
+            
+        Returns:
+            (width, height) tuple
+        """
+        title_offset = self.TITLE_HEIGHT if title else 0
+        if not images:
+            return 400, 200 + title_offset
+        
+        rows = (len(images) + cols - 1) // cols
+        width = cols * self.CELL_SIZE + (cols + 1) * self.PADDING
+        height = title_offset + rows * self.CELL_SIZE + (rows + 1) * self.PADDING
+        return width, height
+    
+    def _draw_grid(self, canvas: skia.Canvas, images: List[Path], cols: int,
+                   title: Optional[str], width: int) -> None:
+        """
+        Draw a grid of images.
+        
+        Args:
+            canvas: Skia Canvas to draw on
+            images: List of image paths to render
+            cols: Number of columns in grid
+            title: Optional title for the grid
+            width: Canvas width
+        """
+        if not images:
+            self._draw_empty_grid(canvas, title)
+            return
+        
+        title_offset = self.TITLE_HEIGHT if title else 0
+        
+        # Fill white background
+        bg_color = (255, 255, 255, 255)
+        DrawingHelpers.clear_opaque(canvas, bg_color)
+        
+        # Draw title if provided
+        if title:
+            self._draw_title(canvas, title, width)
+        
+        # Compute all cell positions at once
+        if len(images) > self.LAYOUT_JIT_THRESHOLD:
+            # Imported lazily so small grids never pay the kernel's import cost
+            from ._layout_jit import grid_layout
+            layout = grid_layout(len(images), cols, self.CELL_SIZE, self.PADDING, title_offset)
+            xs, ys = layout[:, 0], layout[:, 1]
+        else:
+            idxs = np.arange(len(images))
+            cell_rows, cell_cols = np.divmod(idxs, cols)
+            xs = cell_cols * self.CELL_SIZE + (cell_cols + 1) * self.PADDING
+            ys = title_offset + cell_rows * self.CELL_SIZE + (cell_rows + 1) * self.PADDING
+        
+        # Draw grid cells, collecting every cell border into one path
+        border_path = skia.Path()
+        cell_rect = skia.Rect.MakeWH(self.CELL_SIZE, self.CELL_SIZE)
+        for image_path, x, y in zip(images, xs.tolist(), ys.tolist()):
+            cell_rect.offsetTo(x, y)
+            self._draw_grid_cell(canvas, image_path, x, y, cell_rect)
+            border_path.addRect(cell_rect)
+        
+        # Stroke all cell borders in a single draw call
+        canvas.drawPath(border_path, self._border_paint)
+    
     def _draw_title(self, canvas: skia.Canvas, title: str, width: int) -> None:
         """
         Draw title on canvas.
@@ -118,38 +222,42 @@ class GridRenderer:
         y = self.TITLE_HEIGHT - 10
         DrawingHelpers.draw_text(canvas, title, x, y, font, (0, 0, 0, 255))
     
-    def _draw_grid_cell(self, canvas: skia.Canvas, image_path: Path, x: float, y: float) -> None:
+    def _draw_grid_cell(self, canvas: skia.Canvas, image_path: Path, x: float, y: float,
+                        cell_rect: Optional[skia.Rect] = None) -> None:
         """
         Draw a single grid cell with image.
         
+        The cell border is not drawn here; ``render_grid`` strokes the borders
+        of all cells together in one path.
+        
         Args:
             canvas: Skia Canvas to draw on
             image_path: Path to image file
             x: X position of cell
             y: Y position of cell
+            cell_rect: Optional reusable rect already positioned at the cell
         """
         # Draw cell background
-        cell_rect = skia.Rect.MakeXYWH(x, y, self.CELL_SIZE, self.CELL_SIZE)
+        if cell_rect is None:
+            cell_rect = skia.Rect.MakeXYWH(x, y, self.CELL_SIZE, self.CELL_SIZE)
         DrawingHelpers.fill_rect(canvas, cell_rect, (255, 255, 255, 255))
         
-        # Draw cell border
-        DrawingHelpers.draw_line(canvas, x, y, x + self.CELL_SIZE, y, 1.0, (200, 200, 200, 255))
-        DrawingHelpers.draw_line(canvas, x + self.CELL_SIZE, y, x + self.CELL_SIZE, y + self.CELL_SIZE, 1.0, (200, 200, 200, 255))
-        DrawingHelpers.draw_line(canvas, x + self.CELL_SIZE, y + self.CELL_SIZE, x, y + self.CELL_SIZE, 1.0, (200, 200, 200, 255))
-        DrawingHelpers.draw_line(canvas, x, y + self.CELL_SIZE, x, y, 1.0, (200, 200, 200, 255))
-        
-        # Load and draw image
-        image = load_image_from_path(image_path)
-        if image:
-            # Scale image to fit cell
-            scaled_image = scale_image(image, self.CELL_SIZE - 4, self.CELL_SIZE - 4)
-            img_x = x + 2 + (self.CELL_SIZE - 4 - scaled_image.width()) / 2
-            img_y = y + 2 + (self.CELL_SIZE - 4 - scaled_image.height()) / 2
+        # Load and draw image, scaled to fit the cell
+        try:
+            mtime_ns = image_path.stat().st_mtime_ns
+        except OSError:
+            return
+        
+        scaled_image = _load_scaled(str(image_path), mtime_ns, self.CELL_SIZE - 4, self.CELL_SIZE - 4)
+        if scaled_image:
+            # Snap to whole pixels so Skia can blit without resampling
+            img_x = int(x + 2 + (self.CELL_SIZE - 4 - scaled_image.width()) // 2)
+            img_y = int(y + 2 + (self.CELL_SIZE - 4 - scaled_image.height()) // 2)
             canvas.drawImage(scaled_image, img_x, img_y)
     
-    def _create_empty_grid(self, title: Optional[str] = None) -> bytes:
+    def _empty_grid_png(self, title: Optional[str] = None) -> bytes:
         """
-        Create an empty grid placeholder.
+        Get the encoded empty grid placeholder, rendering it once per title.
         
         Args:
             title: Optional title
@@ -157,13 +265,33 @@ class GridRenderer:
         Returns:
             PNG image bytes
         """
+        cache = GridRenderer._empty_grid_cache
+        key = (self.font_collection, title)
+        with GridRenderer._empty_grid_lock:
+            png_bytes = cache.get(key)
+        if png_bytes is None:
+            with self._grid_surface([], title=title) as surface:
+                png_bytes = SurfaceManager.get_png_bytes(surface)
+            
+            with GridRenderer._empty_grid_lock:
+                # Evict the oldest placeholder once the cache is full
+                if key not in cache and len(cache) >= self.EMPTY_GRID_CACHE_SIZE:
+                    cache.pop(next(iter(cache)))
+                cache[key] = png_bytes
+        return png_bytes
+    
+    def _draw_empty_grid(self, canvas: skia.Canvas, title: Optional[str] = None) -> None:
+        """
+        Draw an empty grid placeholder.
+        
+        Args:
+            canvas: Skia Canvas to draw on
+            title: Optional title
+        """
         title_offset = self.TITLE_HEIGHT if title else 0
-        surface = SurfaceManager.create_raster_surface(400, 200 + title_offset)
-        canvas = surface.getCanvas()
         
         # Fill background
-        bg_rect = skia.Rect.MakeWH(400, 200 + title_offset)
-        DrawingHelpers.fill_rect(canvas, bg_rect, (255, 255, 255, 255))
+        DrawingHelpers.clear_opaque(canvas, (255, 255, 255, 255))
         
         # Draw title if provided
         if title:
@@ -172,8 +300,6 @@ class GridRenderer:
         # Draw "No images" text
         font = self.font_collection.create_font(size=14.0)
         DrawingHelpers.draw_text(canvas, "No images to display", 50, 120 + title_offset, font, (128, 128, 128, 255))
-        
-        return SurfaceManager.get_png_bytes(surface)
 
 
 def create_simple_grid(num_cells: int = 4, cell_color: Tuple[int, int, int, int] = (200, 200, 255, 255),
@@ -198,34 +324,38 @@ def create_simple_grid(num_cells: int = 4, cell_color: Tuple[int, int, int, int]
     width = cols * cell_size + (cols + 1) * padding
     height = title_offset + rows * cell_size + (rows + 1) * padding
     
-    surface = SurfaceManager.create_raster_surface(width, height)
-    canvas = surface.getCanvas()
+    with surface_scope(width, height) as surface:
+        canvas = surface.getCanvas()
     
-    # Fill background
-    bg_rect = skia.Rect.MakeWH(width, height)
-    DrawingHelpers.fill_rect(canvas, bg_rect, (255, 255, 255, 255))
+        # Fill background
+        DrawingHelpers.clear_opaque(canvas, (255, 255, 255, 255))
     
-    # Draw title if provided
-    if title:
-        font = FontCollection().create_font(size=18.0)
-        title_bg = skia.Rect.MakeWH(width, 40)
-        DrawingHelpers.fill_rect(canvas, title_bg, (240, 240, 240, 255))
-        DrawingHelpers.draw_text(canvas, title, padding, 30, font, (0, 0, 0, 255))
+        # Draw title if provided
+        if title:
+            font = _FONTS.create_font(size=18.0)
+            title_bg = skia.Rect.MakeWH(width, 40)
+            DrawingHelpers.fill_rect(canvas, title_bg, (240, 240, 240, 255))
+            DrawingHelpers.draw_text(canvas, title, padding, 30, font, (0, 0, 0, 255))
     
-    # Draw grid cells
-    for idx in range(num_cells):
-        row = idx // cols
-        col = idx % cols
-        x = col * cell_size + (col + 1) * padding
-        y = title_offset + row * cell_size + (row + 1) * padding
-        
-        cell_rect = skia.Rect.MakeXYWH(x, y, cell_size, cell_size)
-        DrawingHelpers.fill_rect(canvas, cell_rect, cell_color)
+        # Draw grid cells, collecting every cell border into one path
+        border_path = skia.Path()
+        cell_rect = skia.Rect.MakeWH(cell_size, cell_size)
+        for idx in range(num_cells):
+            row = idx // cols
+            col = idx % cols
+            x = col * cell_size + (col + 1) * padding
+            y = title_offset + row * cell_size + (row + 1) * padding
         
-        # Draw cell border
-        DrawingHelpers.draw_line(canvas, x, y, x + cell_size, y, 1.0, (100, 100, 100, 255))
-        DrawingHelpers.draw_line(canvas, x + cell_size, y, x + cell_size, y + cell_size, 1.0, (100, 100, 100, 255))
-        DrawingHelpers.draw_line(canvas, x + cell_size, y + cell_size, x, y + cell_size, 1.0, (100, 100, 100, 255))
-        DrawingHelpers.draw_line(canvas, x, y + cell_size, x, y, 1.0, (100, 100, 100, 255))
+            cell_rect.offsetTo(x, y)
+            DrawingHelpers.fill_rect(canvas, cell_rect, cell_color)
+            border_path.addRect(cell_rect)
+    
+        # Stroke all cell borders in a single draw call
+        border_paint = skia.Paint(
+            Style=skia.Paint.kStroke_Style,
+            StrokeWidth=1.0,
+            Color=skia.ColorSetARGB(255, 100, 100, 100),
+        )
+        canvas.drawPath(border_path, border_paint)
     
-    return SurfaceManager.get_png_bytes(surface)
+        return SurfaceManager.get_png_bytes(surface)
@@ -4,9 +4,43 @@ Handles drawing help images and pack listings.
 """
 
 import skia
+import threading
+import unicodedata
 from pathlib import Path
-from typing import List, Optional, Tuple
-from .tools import FontCollection, SurfaceManager, DrawingHelpers
+from concurrent.futures import Future
+from typing import Callable, Dict, Hashable, List, Optional, Tuple
+from .tools import FontCollection, SurfaceManager, DrawingHelpers, surface_scope, _FONTS
+
+
+_ZERO_WIDTH_JOINER = "\u200d"
+
+
+def _truncate_text(text: str, limit: int) -> str:
+    """
+    Truncate text to at most ``limit`` characters without splitting a cluster.
+    
+    Combining marks, variation selectors and zero-width-joined characters
+    stay with the character they attach to, so the cut moves back to the
+    start of the cluster that would otherwise be split.
+    
+    Args:
+        text: Text to truncate
+        limit: Maximum number of characters
+        
+    Returns:
+        Truncated text
+    """
+    if len(text) <= limit:
+        return text
+    
+    end = limit
+    while end > 0 and (
+        unicodedata.category(text[end]) in ("Mn", "Mc", "Me")
+        or text[end] == _ZERO_WIDTH_JOINER
+        or text[end - 1] == _ZERO_WIDTH_JOINER
+    ):
+        end -= 1
+    return text[:end]
 
 
 class PackListRenderer:
@@ -16,10 +50,21 @@ class PackListRenderer:
     LINE_HEIGHT = 20
     FONT_SIZE = 12.0
     TITLE_FONT_SIZE = 18.0
+    PICTURE_CACHE_SIZE = 64
     
-    def __init__(self):
-        """Initialize pack list renderer."""
-        self.font_collection = FontCollection()
+    # Recorded draw sequences shared by all renderers, keyed by their inputs;
+    # submit_* methods reach the cache from pool worker threads
+    _picture_cache: Dict[Hashable, skia.Picture] = {}
+    _picture_lock = threading.Lock()
+    
+    def __init__(self, font_collection: Optional[FontCollection] = None):
+        """
+        Initialize pack list renderer.
+        
+        Args:
+            font_collection: Font collection to share; a new one is created if omitted
+        """
+        self.font_collection = font_collection if font_collection is not None else FontCollection()
     
     def render_pack_list(self, pack_names: List[str], pack_descriptions: Optional[List[str]] = None,
                         title: str = "Available Packs") -> bytes:
@@ -40,65 +85,231 @@ class PackListRenderer:
         height = 50 + (num_packs * self.LINE_HEIGHT) + self.PADDING * 3
         
         # Create surface
-        surface = SurfaceManager.create_raster_surface(width, height)
-        canvas = surface.getCanvas()
+        with surface_scope(width, height) as surface:
+            canvas = surface.getCanvas()
         
-        # Fill background
-        bg_rect = skia.Rect.MakeWH(width, height)
-        DrawingHelpers.fill_rect(canvas, bg_rect, (255, 255, 255, 255))
+            # Fill background
+            DrawingHelpers.clear_opaque(canvas, (255, 255, 255, 255))
         
-        # Draw title
-        title_font = self.font_collection.create_font(size=self.TITLE_FONT_SIZE)
-        title_y = self.PADDING + 15
-        DrawingHelpers.draw_text(canvas, title, self.PADDING, title_y, title_font, (0, 0, 0, 255))
+            # Draw title
+            title_font = self.font_collection.create_font(size=self.TITLE_FONT_SIZE)
+            title_y = self.PADDING + 15
+            DrawingHelpers.draw_text(canvas, title, self.PADDING, title_y, title_font, (0, 0, 0, 255))
         
-        # Draw separator line
-        sep_y = self.PADDING + 25
-        DrawingHelpers.draw_line(canvas, self.PADDING, sep_y, width - self.PADDING, sep_y, 
-                                1.0, (200, 200, 200, 255))
+            # Draw separator line
+            sep_y = self.PADDING + 25
+            DrawingHelpers.draw_line(canvas, self.PADDING, sep_y, width - self.PADDING, sep_y, 
+                                    1.0, (200, 200, 200, 255))
         
-        # Draw pack list
-        font = self.font_collection.create_font(size=self.FONT_SIZE)
-        y = sep_y + 20
+            # Draw pack list
+            font = self.font_collection.create_font(size=self.FONT_SIZE)
+            small_font = self.font_collection.create_font(size=10.0)
+            y = sep_y + 20
         
-        for idx, pack_name in enumerate(pack_names):
-            # Draw pack name
-            DrawingHelpers.draw_text(canvas, f"• {pack_name}", self.PADDING + 10, y, font, (0, 0, 0, 255))
+            # Loop invariants
+            name_x = self.PADDING + 10
+            desc_x = self.PADDING + 20
+            line_height = self.LINE_HEIGHT
+            black = (0, 0, 0, 255)
+            grey = (128, 128, 128, 255)
+            truncated = [_truncate_text(desc, 50) if desc else "" for desc in (pack_descriptions or [])]
+            num_descriptions = len(truncated)
+        
+            # Collect names and descriptions, then draw each group in one call
+            name_runs = []
+            desc_runs = []
+            for idx, pack_name in enumerate(pack_names):
+                name_runs.append((f"• {pack_name}", name_x, y))
             
-            # Draw description if provided
-            if pack_descriptions and idx < len(pack_descriptions):
-                desc = pack_descriptions[idx]
-                if desc:
-                    small_font = self.font_collection.create_font(size=10.0)
-                    DrawingHelpers.draw_text(canvas, f"  {desc[:50]}...", self.PADDING + 20, y + 12, 
-                                           small_font, (128, 128, 128, 255))
+                # Add description if provided
+                if idx < num_descriptions and truncated[idx]:
+                    desc_runs.append((f"  {truncated[idx]}...", desc_x, y + 12))
             
-            y += self.LINE_HEIGHT
+                y += line_height
         
-        return SurfaceManager.get_png_bytes(surface)
+            DrawingHelpers.draw_text_batch(canvas, name_runs, font, black)
+            DrawingHelpers.draw_text_batch(canvas, desc_runs, small_font, grey)
+        
+            return SurfaceManager.get_png_bytes(surface)
     
     def render_help_image(self, commands: List[Tuple[str, str]], title: str = "Help") -> bytes:
         """
         Render a help image with command descriptions.
         
+        The draw sequence is recorded once per distinct input and replayed
+        on later calls.
+        
+        Args:
+            commands: List of (command, description) tuples
+            title: Help title
+            
+        Returns:
+            PNG image bytes
+        """
+        picture, width, height = self._help_picture(commands, title)
+        return SurfaceManager.encode_picture_png(picture, width, height)
+    
+    def submit_help_image(self, commands: List[Tuple[str, str]], title: str = "Help") -> "Future[bytes]":
+        """
+        Render a help image on the render thread pool.
+        
         Args:
             commands: List of (command, description) tuples
             title: Help title
             
+        Returns:
+            Future resolving to PNG image bytes
+        """
+        return SurfaceManager.submit_picture_png(*self._help_picture(commands, title))
+    
+    def render_pack_details(self, name: str, display_name: str, description: str, 
+                           version: str, author: str, num_stickers: int) -> bytes:
+        """
+        Render detailed pack information.
+        
+        The draw sequence is recorded once per distinct input and replayed
+        on later calls.
+        
+        Args:
+            name: Pack internal name
+            display_name: Pack display name
+            description: Pack description
+            version: Pack version
+            author: Pack author
+            num_stickers: Number of stickers in pack
+            
         Returns:
             PNG image bytes
         """
+        picture, width, height = self._pack_details_picture(
+            name, display_name, description, version, author, num_stickers
+        )
+        return SurfaceManager.encode_picture_png(picture, width, height)
+    
+    def submit_pack_details(self, name: str, display_name: str, description: str,
+                            version: str, author: str, num_stickers: int) -> "Future[bytes]":
+        """
+        Render detailed pack information on the render thread pool.
+        
+        Args:
+            name: Pack internal name
+            display_name: Pack display name
+            description: Pack description
+            version: Pack version
+            author: Pack author
+            num_stickers: Number of stickers in pack
+            
+        Returns:
+            Future resolving to PNG image bytes
+        """
+        return SurfaceManager.submit_picture_png(*self._pack_details_picture(
+            name, display_name, description, version, author, num_stickers
+        ))
+    
+    def _help_picture(self, commands: List[Tuple[str, str]],
+                      title: str) -> Tuple[skia.Picture, int, int]:
+        """
+        Get the recorded help image picture and its size.
+        
+        Args:
+            commands: List of (command, description) tuples
+            title: Help title
+            
+        Returns:
+            (picture, width, height) tuple
+        """
         # Calculate dimensions
         width = 700
         height = 60 + len(commands) * 25 + self.PADDING * 2
         
-        # Create surface
-        surface = SurfaceManager.create_raster_surface(width, height)
-        canvas = surface.getCanvas()
+        # Rows may be lists; tuples make the key hashable
+        key = ("help", tuple(map(tuple, commands)), title, width, height)
+        picture = self._get_picture(
+            key, width, height,
+            lambda canvas: self._draw_help_image(canvas, commands, title, width, height),
+        )
+        return picture, width, height
+    
+    def _pack_details_picture(self, name: str, display_name: str, description: str,
+                              version: str, author: str,
+                              num_stickers: int) -> Tuple[skia.Picture, int, int]:
+        """
+        Get the recorded pack details picture and its size.
         
+        Args:
+            name: Pack internal name
+            display_name: Pack display name
+            description: Pack description
+            version: Pack version
+            author: Pack author
+            num_stickers: Number of stickers in pack
+            
+        Returns:
+            (picture, width, height) tuple
+        """
+        width = 600
+        height = 300
+        
+        key = ("details", name, display_name, description, version, author, num_stickers)
+        picture = self._get_picture(
+            key, width, height,
+            lambda canvas: self._draw_pack_details(
+                canvas, name, display_name, description, version, author,
+                num_stickers, width, height,
+            ),
+        )
+        return picture, width, height
+    
+    def _get_picture(self, key: Hashable, width: int, height: int,
+                     draw: Callable[[skia.Canvas], None]) -> skia.Picture:
+        """
+        Get the cached picture for ``key``, recording it with ``draw`` on a miss.
+        
+        Recordings are also keyed by this renderer's font collection. Keys
+        that cannot be hashed are recorded without caching.
+        
+        Args:
+            key: Description of everything else the drawing depends on
+            width: Image width
+            height: Image height
+            draw: Callable issuing the draw calls onto a canvas
+            
+        Returns:
+            Recorded Skia Picture
+        """
+        key = (self.font_collection, key)
+        try:
+            hash(key)
+        except TypeError:
+            return SurfaceManager.record_picture(width, height, draw)
+        
+        cache = PackListRenderer._picture_cache
+        with PackListRenderer._picture_lock:
+            picture = cache.get(key)
+        if picture is None:
+            picture = SurfaceManager.record_picture(width, height, draw)
+            
+            with PackListRenderer._picture_lock:
+                # Evict the oldest recording once the cache is full
+                if key not in cache and len(cache) >= self.PICTURE_CACHE_SIZE:
+                    cache.pop(next(iter(cache)))
+                cache[key] = picture
+        return picture
+    
+    def _draw_help_image(self, canvas: skia.Canvas, commands: List[Tuple[str, str]],
+                         title: str, width: int, height: int) -> None:
+        """
+        Draw a help image with command descriptions.
+        
+        Args:
+            canvas: Skia Canvas to draw on
+            commands: List of (command, description) tuples
+            title: Help title
+            width: Image width
+            height: Image height
+        """
         # Fill background
-        bg_rect = skia.Rect.MakeWH(width, height)
-        DrawingHelpers.fill_rect(canvas, bg_rect, (245, 245, 245, 255))
+        DrawingHelpers.clear_opaque(canvas, (245, 245, 245, 255))
         
         # Draw title
         title_font = self.font_collection.create_font(size=self.TITLE_FONT_SIZE)
@@ -111,46 +322,34 @@ class PackListRenderer:
         
         # Draw commands
         font = self.font_collection.create_font(size=self.FONT_SIZE)
+        small_font = self.font_collection.create_font(size=10.0)
         y = sep_y + 20
         
-        for command, description in commands:
-            # Draw command
-            DrawingHelpers.draw_text(canvas, command, self.PADDING + 10, y, font, (0, 0, 100, 255))
-            
-            # Draw description
-            small_font = self.font_collection.create_font(size=10.0)
-            DrawingHelpers.draw_text(canvas, description, self.PADDING + 120, y, small_font, (100, 100, 100, 255))
-            
-            y += 25
-        
-        return SurfaceManager.get_png_bytes(surface)
+        # Draw each column as one text blob
+        DrawingHelpers.draw_text_lines(canvas, [command for command, _ in commands],
+                                       self.PADDING + 10, y, 25, font, (0, 0, 100, 255))
+        DrawingHelpers.draw_text_lines(canvas, [description for _, description in commands],
+                                       self.PADDING + 120, y, 25, small_font, (100, 100, 100, 255))
     
-    def render_pack_details(self, name: str, display_name: str, description: str, 
-                           version: str, author: str, num_stickers: int) -> bytes:
+    def _draw_pack_details(self, canvas: skia.Canvas, name: str, display_name: str,
+                           description: str, version: str, author: str, num_stickers: int,
+                           width: int, height: int) -> None:
         """
-        Render detailed pack information.
+        Draw detailed pack information.
         
         Args:
+            canvas: Skia Canvas to draw on
             name: Pack internal name
             display_name: Pack display name
             description: Pack description
             version: Pack version
             author: Pack author
             num_stickers: Number of stickers in pack
-            
-        Returns:
-            PNG image bytes
+            width: Image width
+            height: Image height
         """
-        width = 600
-        height = 300
-        
-        # Create surface
-        surface = SurfaceManager.create_raster_surface(width, height)
-        canvas = surface.getCanvas()
-        
         # Fill background
-        bg_rect = skia.Rect.MakeWH(width, height)
-        DrawingHelpers.fill_rect(canvas, bg_rect, (255, 255, 255, 255))
+        DrawingHelpers.clear_opaque(canvas, (255, 255, 255, 255))
         
         # Draw title (display name)
         title_font = self.font_collection.create_font(size=self.TITLE_FONT_SIZE)
@@ -169,11 +368,7 @@ class PackListRenderer:
             f"Description: {description}"
         ]
         
-        for detail in details:
-            DrawingHelpers.draw_text(canvas, detail, self.PADDING, y, font, (0, 0, 0, 255))
-            y += 25
-        
-        return SurfaceManager.get_png_bytes(surface)
+        DrawingHelpers.draw_text_lines(canvas, details, self.PADDING, y, 25, font, (0, 0, 0, 255))
 
 
 def create_help_text_image(text: str, title: str = "Information") -> bytes:
@@ -188,29 +383,28 @@ def create_help_text_image(text: str, title: str = "Information") -> bytes:
         PNG image bytes
     """
     lines = text.split('\n')
-    width = max(400, min(800, max(len(line) * 8 for line in lines if line)))
+    title_font = _FONTS.create_font(size=16.0)
+    font = _FONTS.create_font(size=11.0)
+    
+    # Size the canvas from the measured text plus horizontal padding
+    max_w = max((font.measureText(line) for line in lines if line), default=0)
+    max_w = max(max_w, title_font.measureText(title))
+    width = int(max(400, min(800, max_w + 32)))
     height = 60 + len(lines) * 15 + 20
     
-    surface = SurfaceManager.create_raster_surface(width, height)
-    canvas = surface.getCanvas()
+    with surface_scope(width, height) as surface:
+        canvas = surface.getCanvas()
     
-    # Fill background
-    bg_rect = skia.Rect.MakeWH(width, height)
-    DrawingHelpers.fill_rect(canvas, bg_rect, (255, 255, 255, 255))
+        # Fill background
+        DrawingHelpers.clear_opaque(canvas, (255, 255, 255, 255))
     
-    # Draw title
-    font_collection = FontCollection()
-    title_font = font_collection.create_font(size=16.0)
-    DrawingHelpers.draw_text(canvas, title, 16, 25, title_font, (0, 0, 0, 255))
+        # Draw title
+        DrawingHelpers.draw_text(canvas, title, 16, 25, title_font, (0, 0, 0, 255))
     
-    # Draw separator
-    DrawingHelpers.draw_line(canvas, 16, 35, width - 16, 35, 1.0, (200, 200, 200, 255))
+        # Draw separator
+        DrawingHelpers.draw_line(canvas, 16, 35, width - 16, 35, 1.0, (200, 200, 200, 255))
     
-    # Draw text lines
-    font = font_collection.create_font(size=11.0)
-    y = 55
-    for line in lines:
-        DrawingHelpers.draw_text(canvas, line, 16, y, font, (50, 50, 50, 255))
-        y += 15
+        # Draw text lines
+        DrawingHelpers.draw_text_lines(canvas, lines, 16, 55, 15, font, (50, 50, 50, 255))
     
-    return SurfaceManager.get_png_bytes(surface)
+        return SurfaceManager.get_png_bytes(surface)
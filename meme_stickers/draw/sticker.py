@@ -5,9 +5,11 @@ Handles drawing individual stickers with parameters and effects.
 
 import skia
 from pathlib import Path
-from typing import Optional, Tuple
+from typing import Iterator, Optional, Tuple
+from contextlib import contextmanager
 from dataclasses import dataclass
-from .tools import FontCollection, SurfaceManager, DrawingHelpers, load_image_from_path, scale_image
+from functools import lru_cache
+from .tools import FontCollection, SurfaceManager, DrawingHelpers, surface_scope, _FONTS, _load_scaled
 
 
 @dataclass
@@ -27,9 +29,14 @@ class StickerParams:
 class StickerRenderer:
     """Renders stickers with configurable parameters."""
     
-    def __init__(self):
-        """Initialize sticker renderer."""
-        self.font_collection = FontCollection()
+    def __init__(self, font_collection: Optional[FontCollection] = None):
+        """
+        Initialize sticker renderer.
+        
+        Args:
+            font_collection: Font collection to share; a new one is created if omitted
+        """
+        self.font_collection = font_collection if font_collection is not None else FontCollection()
     
     def render_sticker(self, params: StickerParams) -> bytes:
         """
@@ -41,24 +48,8 @@ class StickerRenderer:
         Returns:
             PNG image bytes
         """
-        # Create surface
-        surface = SurfaceManager.create_raster_surface(params.width, params.height)
-        canvas = surface.getCanvas()
-        
-        # Fill background
-        background_rect = skia.Rect.MakeWH(params.width, params.height)
-        DrawingHelpers.fill_rect(canvas, background_rect, params.background_color)
-        
-        # Draw base image if provided
-        if params.base_image and params.base_image.exists():
-            self._draw_base_image(canvas, params)
-        
-        # Draw overlay text if provided
-        if params.overlay_text:
-            self._draw_overlay_text(canvas, params)
-        
-        # Return PNG bytes
-        return SurfaceManager.get_png_bytes(surface)
+        with self._render_to_surface(params) as surface:
+            return SurfaceManager.get_png_bytes(surface)
     
     def render_sticker_to_file(self, params: StickerParams, output_path: Path) -> bool:
         """
@@ -72,12 +63,36 @@ class StickerRenderer:
             True if successful, False otherwise
         """
         try:
-            surface = SurfaceManager.create_raster_surface(params.width, params.height)
+            with self._render_to_surface(params) as surface:
+                # Save to file
+                suffix = output_path.suffix.lower()
+                if suffix == '.jpg' or suffix == '.jpeg':
+                    SurfaceManager.save_jpeg(surface, output_path)
+                elif suffix == '.webp':
+                    SurfaceManager.save_webp(surface, output_path)
+                else:
+                    SurfaceManager.save_png(surface, output_path)
+            
+            return True
+        except Exception:
+            return False
+    
+    @contextmanager
+    def _render_to_surface(self, params: StickerParams) -> Iterator[skia.Surface]:
+        """
+        Render a sticker onto a pooled surface.
+        
+        Args:
+            params: StickerParams configuration
+            
+        Yields:
+            Skia Surface holding the rendered sticker, valid inside the block
+        """
+        with surface_scope(params.width, params.height) as surface:
             canvas = surface.getCanvas()
             
             # Fill background
-            background_rect = skia.Rect.MakeWH(params.width, params.height)
-            DrawingHelpers.fill_rect(canvas, background_rect, params.background_color)
+            DrawingHelpers.clear_opaque(canvas, params.background_color)
             
             # Draw base image if provided
             if params.base_image and params.base_image.exists():
@@ -87,15 +102,7 @@ class StickerRenderer:
             if params.overlay_text:
                 self._draw_overlay_text(canvas, params)
             
-            # Save to file
-            if output_path.suffix.lower() == '.jpg' or output_path.suffix.lower() == '.jpeg':
-                SurfaceManager.save_jpeg(surface, output_path)
-            else:
-                SurfaceManager.save_png(surface, output_path)
-            
-            return True
-        except Exception:
-            return False
+            yield surface
     
     def _draw_base_image(self, canvas: skia.Canvas, params: StickerParams) -> None:
         """
@@ -105,19 +112,24 @@ class StickerRenderer:
             canvas: Skia Canvas to draw on
             params: StickerParams configuration
         """
-        image = load_image_from_path(params.base_image)
-        if not image:
+        try:
+            mtime_ns = params.base_image.stat().st_mtime_ns
+        except OSError:
             return
         
         # Scale image to fit within bounds
         max_size = params.width - 2 * params.padding
-        scaled_image = scale_image(image, max_size, max_size)
+        if max_size <= 0:
+            return
         
-        # Center image
-        x = (params.width - scaled_image.width()) / 2
-        y = (params.height - scaled_image.height()) / 2
+        image = _load_scaled(str(params.base_image), mtime_ns, max_size, max_size)
+        if not image:
+            return
         
-        canvas.drawImage(scaled_image, x, y)
+        # Center image, snapped to whole pixels so Skia can blit without resampling
+        x = (params.width - image.width()) // 2
+        y = (params.height - image.height()) // 2
+        canvas.drawImage(image, x, y)
     
     def _draw_overlay_text(self, canvas: skia.Canvas, params: StickerParams) -> None:
         """
@@ -143,6 +155,9 @@ def create_simple_sticker(width: int = 256, height: int = 256,
     """
     Create a simple sticker with text.
     
+    Results are memoized by their arguments; call
+    ``create_simple_sticker.cache_clear()`` to drop them.
+    
     Args:
         width: Width in pixels
         height: Height in pixels
@@ -153,6 +168,17 @@ def create_simple_sticker(width: int = 256, height: int = 256,
     Returns:
         PNG image bytes
     """
+    return _create_simple_sticker_cached(
+        width, height, tuple(background_color), text, tuple(text_color)
+    )
+
+
+@lru_cache(maxsize=128)
+def _create_simple_sticker_cached(width: int, height: int,
+                                  background_color: Tuple[int, int, int, int],
+                                  text: Optional[str],
+                                  text_color: Tuple[int, int, int, int]) -> bytes:
+    """Render a simple sticker; memoized backend of ``create_simple_sticker``."""
     params = StickerParams(
         width=width,
         height=height,
@@ -161,5 +187,9 @@ def create_simple_sticker(width: int = 256, height: int = 256,
         text_color=text_color
     )
     
-    renderer = StickerRenderer()
+    renderer = StickerRenderer(_FONTS)
     return renderer.render_sticker(params)
+
+
+create_simple_sticker.cache_clear = _create_simple_sticker_cached.cache_clear
+create_simple_sticker.cache_info = _create_simple_sticker_cached.cache_info
@@ -3,12 +3,40 @@ Skia drawing utilities for sticker rendering.
 Provides font management, surface creation, and image encoding utilities.
 """
 
+import os
+import numpy as np
 import skia
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import contextmanager
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional, Tuple, List
+from typing import Callable, Dict, Iterator, Optional, Tuple, List
 import io
 
 
+# Worker threads for rasterizing recorded pictures off the caller's thread.
+# Threads are only spawned once work is submitted.
+_RENDER_WORKERS = os.cpu_count() or 1
+_RENDER_POOL = ThreadPoolExecutor(max_workers=_RENDER_WORKERS,
+                                  thread_name_prefix="meme-stickers-render")
+
+# Idle raster surfaces kept for reuse, keyed by (width, height). Each size
+# keeps enough surfaces for every render worker, so batch renders of one
+# pack recycle the same pixel buffers instead of allocating per sticker.
+_SURFACE_POOL: Dict[Tuple[int, int], List[skia.Surface]] = {}
+_SURFACE_POOL_LOCK = threading.Lock()
+_SURFACE_POOL_MAX_PER_SIZE = max(4, _RENDER_WORKERS)
+
+# Recently encoded surfaces, keyed by (id, generation ID, format, quality).
+# Skia bumps a surface's generation ID whenever its pixels change, so a key
+# only matches while the surface still holds the content that was encoded.
+_ENCODE_CACHE: "OrderedDict[Tuple[int, int, skia.EncodedImageFormat, int], skia.Data]" = OrderedDict()
+_ENCODE_CACHE_LOCK = threading.Lock()
+_ENCODE_CACHE_SIZE = 16
+
+
 class FontCollection:
     """Manages Skia font collection with fallback fonts."""
     
@@ -16,7 +44,11 @@ class FontCollection:
         """Initialize font collection with system fonts and fallbacks."""
         self.font_mgr = skia.FontMgr.RefDefault()
         self.typeface_cache = {}
+        self._font_cache: Dict[Tuple[str, float], skia.Font] = {}
+        self._fallback_typeface: Optional[skia.Typeface] = None
         self._setup_fallback_fonts()
+        # Resolve the fallback up front so the first render skips the lookups
+        self._get_fallback_typeface()
     
     def _setup_fallback_fonts(self) -> None:
         """Setup fallback font list for platform-agnostic font discovery."""
@@ -32,6 +64,27 @@ class FontCollection:
             "Verdana",
         ]
     
+    def _get_fallback_typeface(self) -> skia.Typeface:
+        """
+        Resolve the first available fallback typeface.
+        
+        The fallback list is walked once, when the collection is created;
+        the result is reused afterwards.
+        
+        Returns:
+            First matching fallback Typeface, or Skia's default typeface
+        """
+        if self._fallback_typeface is None:
+            for fallback in self.fallback_fonts:
+                typeface = self.font_mgr.matchFamilyStyle(fallback, skia.FontStyle())
+                if typeface:
+                    self.typeface_cache[fallback] = typeface
+                    self._fallback_typeface = typeface
+                    break
+            else:
+                self._fallback_typeface = skia.Typeface.MakeDefault()
+        return self._fallback_typeface
+    
     def get_typeface(self, font_family: Optional[str] = None, size: float = 14.0) -> Tuple[skia.Typeface, float]:
         """
         Get a typeface with fallback support.
@@ -43,31 +96,26 @@ class FontCollection:
         Returns:
             Tuple of (Typeface, size)
         """
-        if font_family and font_family in self.typeface_cache:
-            return self.typeface_cache[font_family], size
-        
-        # Try requested font first
+        # Try requested font first; misses are cached as None so an
+        # unavailable family is only looked up once
         if font_family:
-            typeface = self.font_mgr.matchFamilyStyle(font_family, skia.FontStyle())
-            if typeface:
+            if font_family in self.typeface_cache:
+                typeface = self.typeface_cache[font_family]
+            else:
+                typeface = self.font_mgr.matchFamilyStyle(font_family, skia.FontStyle())
                 self.typeface_cache[font_family] = typeface
-                return typeface, size
-        
-        # Try fallback fonts
-        for fallback in self.fallback_fonts:
-            typeface = self.font_mgr.matchFamilyStyle(fallback, skia.FontStyle())
             if typeface:
-                self.typeface_cache[fallback] = typeface
                 return typeface, size
         
-        # Return default font
-        default_typeface = skia.Typeface.MakeDefault()
-        return default_typeface, size
+        return self._get_fallback_typeface(), size
     
     def create_font(self, font_family: Optional[str] = None, size: float = 14.0) -> skia.Font:
         """
         Create a Skia Font with fallback support.
         
+        Fonts are memoized per ``(font_family, size)``, so repeated calls
+        return the same object; callers must not mutate it.
+        
         Args:
             font_family: Preferred font family name
             size: Font size in points
@@ -75,8 +123,17 @@ class FontCollection:
         Returns:
             Skia Font object
         """
-        typeface, font_size = self.get_typeface(font_family, size)
-        return skia.Font(typeface, font_size)
+        key = (font_family or "", size)
+        font = self._font_cache.get(key)
+        if font is None:
+            typeface, font_size = self.get_typeface(font_family, size)
+            font = skia.Font(typeface, font_size)
+            self._font_cache[key] = font
+        return font
+
+
+# Shared font collection for module-level helpers that have no renderer instance
+_FONTS = FontCollection()
 
 
 class SurfaceManager:
@@ -95,9 +152,8 @@ class SurfaceManager:
         Returns:
             Skia Surface object
         """
-        return skia.Surface.MakeRasterDirect(
-            skia.ImageInfo.Make(width, height, color_type),
-            bytearray(width * height * 4)
+        return skia.Surface.MakeRaster(
+            skia.ImageInfo.Make(width, height, color_type, skia.kPremul_AlphaType)
         )
     
     @staticmethod
@@ -114,6 +170,98 @@ class SurfaceManager:
         """
         return skia.Surface.MakeRasterN32Premul(width, height)
     
+    @staticmethod
+    def acquire_surface(width: int, height: int) -> skia.Surface:
+        """
+        Get a cleared raster surface, reusing a pooled one of the same size.
+        
+        Return it with ``release_surface`` once its contents have been
+        encoded, or use ``surface_scope`` to do so automatically.
+        
+        Args:
+            width: Surface width in pixels
+            height: Surface height in pixels
+            
+        Returns:
+            Transparent Skia Surface
+        """
+        with _SURFACE_POOL_LOCK:
+            idle = _SURFACE_POOL.get((width, height))
+            surface = idle.pop() if idle else None
+        
+        if surface is None:
+            return SurfaceManager.create_raster_surface(width, height)
+        
+        canvas = surface.getCanvas()
+        canvas.restoreToCount(1)
+        canvas.resetMatrix()
+        canvas.clear(skia.ColorTRANSPARENT)
+        return surface
+    
+    @staticmethod
+    def release_surface(surface: skia.Surface) -> None:
+        """
+        Return a surface obtained from ``acquire_surface`` to the pool.
+        
+        Args:
+            surface: Skia Surface no longer in use by the caller
+        """
+        key = (surface.width(), surface.height())
+        with _SURFACE_POOL_LOCK:
+            idle = _SURFACE_POOL.setdefault(key, [])
+            if len(idle) < _SURFACE_POOL_MAX_PER_SIZE:
+                idle.append(surface)
+    
+    @staticmethod
+    def record_picture(width: int, height: int,
+                       draw: Callable[[skia.Canvas], None]) -> skia.Picture:
+        """
+        Record draw calls into a picture without allocating pixels.
+        
+        Args:
+            width: Picture width in pixels
+            height: Picture height in pixels
+            draw: Callable issuing the draw calls onto a canvas
+            
+        Returns:
+            Recorded Skia Picture
+        """
+        recorder = skia.PictureRecorder()
+        draw(recorder.beginRecording(skia.Rect.MakeWH(width, height)))
+        return recorder.finishRecordingAsPicture()
+    
+    @staticmethod
+    def submit_picture_png(picture: skia.Picture, width: int, height: int) -> "Future[bytes]":
+        """
+        Rasterize and PNG-encode a recorded picture on the render thread pool.
+        
+        Args:
+            picture: Recorded Skia Picture
+            width: Image width in pixels
+            height: Image height in pixels
+            
+        Returns:
+            Future resolving to PNG image bytes
+        """
+        return _RENDER_POOL.submit(SurfaceManager.encode_picture_png, picture, width, height)
+    
+    @staticmethod
+    def encode_picture_png(picture: skia.Picture, width: int, height: int) -> bytes:
+        """
+        Rasterize a recorded picture on a pooled surface and PNG-encode it.
+        
+        Args:
+            picture: Recorded Skia Picture
+            width: Image width in pixels
+            height: Image height in pixels
+            
+        Returns:
+            PNG image bytes
+        """
+        with surface_scope(width, height) as surface:
+            surface.getCanvas().drawPicture(picture)
+            return SurfaceManager.get_png_bytes(surface)
+    
     @staticmethod
     def save_png(surface: skia.Surface, output_path: Path) -> None:
         """
@@ -123,9 +271,7 @@ class SurfaceManager:
             surface: Skia Surface to save
             output_path: Path where PNG should be saved
         """
-        image = surface.makeImageSnapshot()
-        data = image.encodeToData(skia.EncodedImageFormat.kPNG, 100)
-        output_path.write_bytes(data.bytes())
+        SurfaceManager._encode_to_file(surface, output_path, skia.EncodedImageFormat.kPNG, 100)
     
     @staticmethod
     def save_jpeg(surface: skia.Surface, output_path: Path, quality: int = 90) -> None:
@@ -137,9 +283,114 @@ class SurfaceManager:
             output_path: Path where JPEG should be saved
             quality: JPEG quality (0-100)
         """
-        image = surface.makeImageSnapshot()
-        data = image.encodeToData(skia.EncodedImageFormat.kJPEG, quality)
-        output_path.write_bytes(data.bytes())
+        SurfaceManager._encode_to_file(surface, output_path, skia.EncodedImageFormat.kJPEG, quality)
+    
+    @staticmethod
+    def save_webp(surface: skia.Surface, output_path: Path, quality: int = 100) -> None:
+        """
+        Save surface as WebP image.
+        
+        WebP encodes considerably faster than PNG; quality 100 produces a
+        lossless image.
+        
+        Args:
+            surface: Skia Surface to save
+            output_path: Path where WebP should be saved
+            quality: WebP quality (0-100, 100 is lossless)
+        """
+        SurfaceManager._encode_to_file(surface, output_path, skia.EncodedImageFormat.kWEBP, quality)
+    
+    @staticmethod
+    def _encode_to_file(surface: skia.Surface, output_path: Path,
+                        encoded_format: skia.EncodedImageFormat, quality: int) -> None:
+        """
+        Encode a surface snapshot and stream it straight into a file.
+        
+        The encoded data is handed to a Skia file stream, so it is never
+        copied into a Python bytes object.
+        
+        Args:
+            surface: Skia Surface to save
+            output_path: Path where the image should be saved
+            encoded_format: Skia encoded image format
+            quality: Encoder quality (0-100)
+            
+        Raises:
+            OSError: If encoding fails or the file cannot be written
+        """
+        data = SurfaceManager._encode_cached(surface, encoded_format, quality)
+        if data is None:
+            raise OSError(f"Failed to encode image for {output_path}")
+        
+        stream = skia.FILEWStream(str(output_path))
+        if not stream.isValid():
+            raise OSError(f"Cannot open {output_path} for writing")
+        try:
+            if not stream.write(data):
+                raise OSError(f"Failed to write {output_path}")
+            stream.flush()
+        finally:
+            # Release the stream now so the file is closed before returning
+            del stream
+    
+    @staticmethod
+    def snapshot_and_encode(surface: skia.Surface,
+                            encoded_format: skia.EncodedImageFormat = skia.EncodedImageFormat.kPNG,
+                            quality: int = 100) -> bytes:
+        """
+        Snapshot a surface once and encode it without writing to disk.
+        
+        Args:
+            surface: Skia Surface
+            encoded_format: Skia encoded image format
+            quality: Encoder quality (0-100)
+            
+        Returns:
+            Encoded image bytes
+            
+        Raises:
+            ValueError: If the surface could not be encoded
+        """
+        data = SurfaceManager._encode_cached(surface, encoded_format, quality)
+        if data is None:
+            raise ValueError(f"Failed to encode surface as {encoded_format}")
+        return data.bytes()
+    
+    @staticmethod
+    def _encode_cached(surface: skia.Surface, encoded_format: skia.EncodedImageFormat,
+                       quality: int) -> Optional[skia.Data]:
+        """
+        Encode a surface snapshot, reusing the result for unchanged surfaces.
+        
+        Encoding the same surface content again with the same format and
+        quality (for example to bytes and then to a file) skips the encoder.
+        
+        Args:
+            surface: Skia Surface
+            encoded_format: Skia encoded image format
+            quality: Encoder quality (0-100)
+            
+        Returns:
+            Encoded Skia Data, or None if encoding failed
+        """
+        key = (id(surface), surface.generationID(), encoded_format, quality)
+        with _ENCODE_CACHE_LOCK:
+            data = _ENCODE_CACHE.get(key)
+            if data is not None:
+                _ENCODE_CACHE.move_to_end(key)
+                return data
+        
+        # skia-python exposes no PNG/JPEG encoder options, so Skia's built-in
+        # settings apply; quality is ignored for PNG
+        data = surface.makeImageSnapshot().encodeToData(encoded_format, quality)
+        if data is None:
+            return None
+        
+        with _ENCODE_CACHE_LOCK:
+            _ENCODE_CACHE[key] = data
+            while len(_ENCODE_CACHE) > _ENCODE_CACHE_SIZE:
+                _ENCODE_CACHE.popitem(last=False)
+        return data
     
     @staticmethod
     def get_png_bytes(surface: skia.Surface) -> bytes:
@@ -152,9 +403,30 @@ class SurfaceManager:
         Returns:
             PNG image bytes
         """
-        image = surface.makeImageSnapshot()
-        data = image.encodeToData(skia.EncodedImageFormat.kPNG, 100)
-        return data.bytes()
+        return SurfaceManager.snapshot_and_encode(surface, skia.EncodedImageFormat.kPNG, 100)
+    
+    @staticmethod
+    def get_png_view(surface: skia.Surface) -> Tuple[skia.Data, memoryview]:
+        """
+        Get PNG data from surface as a read-only view, without copying it.
+        
+        The view points into the returned Skia Data, so keep the Data alive
+        for as long as the view is used. Anything accepting the buffer
+        protocol (file writes, sockets, ``BytesIO``) can consume the view.
+        
+        Args:
+            surface: Skia Surface
+            
+        Returns:
+            Tuple of (encoded Skia Data, read-only memoryview over it)
+            
+        Raises:
+            ValueError: If the surface could not be encoded
+        """
+        data = SurfaceManager._encode_cached(surface, skia.EncodedImageFormat.kPNG, 100)
+        if data is None:
+            raise ValueError("Failed to encode surface as PNG")
+        return data, memoryview(data).toreadonly()
     
     @staticmethod
     def get_jpeg_bytes(surface: skia.Surface, quality: int = 90) -> bytes:
@@ -168,9 +440,68 @@ class SurfaceManager:
         Returns:
             JPEG image bytes
         """
-        image = surface.makeImageSnapshot()
-        data = image.encodeToData(skia.EncodedImageFormat.kJPEG, quality)
-        return data.bytes()
+        return SurfaceManager.snapshot_and_encode(surface, skia.EncodedImageFormat.kJPEG, quality)
+    
+    @staticmethod
+    def get_webp_bytes(surface: skia.Surface, quality: int = 100) -> bytes:
+        """
+        Get WebP bytes from surface without writing to disk.
+        
+        Args:
+            surface: Skia Surface
+            quality: WebP quality (0-100, 100 is lossless)
+            
+        Returns:
+            WebP image bytes
+        """
+        return SurfaceManager.snapshot_and_encode(surface, skia.EncodedImageFormat.kWEBP, quality)
+
+
+@contextmanager
+def surface_scope(width: int, height: int) -> Iterator[skia.Surface]:
+    """
+    Borrow a pooled raster surface for the duration of a ``with`` block.
+    
+    Everything needed from the surface (encoded bytes, saved files) must be
+    produced inside the block; the surface is reused afterwards.
+    
+    Args:
+        width: Surface width in pixels
+        height: Surface height in pixels
+        
+    Yields:
+        Transparent Skia Surface
+    """
+    surface = SurfaceManager.acquire_surface(width, height)
+    try:
+        yield surface
+    finally:
+        SurfaceManager.release_surface(surface)
+
+
+@lru_cache(maxsize=64)
+def _paint_for(color: Tuple[int, int, int, int],
+               style: skia.Paint.Style = skia.Paint.kFill_Style,
+               stroke_width: float = 0.0) -> skia.Paint:
+    """
+    Get a shared Skia Paint for an RGBA color.
+    
+    Paints are memoized by their arguments; callers must not mutate the
+    returned paint.
+    
+    Args:
+        color: RGBA color tuple
+        style: Paint style
+        stroke_width: Stroke width in pixels (0 is a hairline)
+        
+    Returns:
+        Skia Paint object
+    """
+    paint = skia.Paint()
+    paint.setColor(skia.Color(*color))
+    paint.setStyle(style)
+    paint.setStrokeWidth(stroke_width)
+    return paint
 
 
 class DrawingHelpers:
@@ -186,10 +517,29 @@ class DrawingHelpers:
             rect: Rectangle bounds
             color: RGBA color tuple
         """
-        paint = skia.Paint()
-        paint.setColor(skia.Color4f(color[0]/255, color[1]/255, color[2]/255, color[3]/255))
+        paint = _paint_for(tuple(color))
         canvas.drawRect(rect, paint)
     
+    @staticmethod
+    def clear_opaque(canvas: skia.Canvas, color: Tuple[int, int, int, int]) -> None:
+        """
+        Fill the whole canvas with a background color.
+        
+        Opaque colors are written with ``canvas.clear``, which replaces the
+        pixels without going through blending; translucent colors are
+        blended over the existing contents like ``fill_rect``.
+        
+        Args:
+            canvas: Skia Canvas to fill
+            color: RGBA color tuple
+        """
+        if color[3] == 255:
+            canvas.clear(skia.Color(*color))
+            return
+        
+        paint = _paint_for(tuple(color))
+        canvas.drawPaint(paint)
+    
     @staticmethod
     def draw_text(canvas: skia.Canvas, text: str, x: float, y: float, font: skia.Font, 
                   color: Tuple[int, int, int, int] = (0, 0, 0, 255)) -> None:
@@ -204,10 +554,57 @@ class DrawingHelpers:
             font: Skia Font to use
             color: RGBA color tuple
         """
-        paint = skia.Paint()
-        paint.setColor(skia.Color4f(color[0]/255, color[1]/255, color[2]/255, color[3]/255))
+        paint = _paint_for(tuple(color))
         canvas.drawString(text, x, y, font, paint)
     
+    @staticmethod
+    def draw_text_lines(canvas: skia.Canvas, lines: List[str], x: float, y: float,
+                        line_height: float, font: skia.Font,
+                        color: Tuple[int, int, int, int] = (0, 0, 0, 255)) -> None:
+        """
+        Draw several lines of text with a single text blob.
+        
+        Args:
+            canvas: Skia Canvas to draw on
+            lines: Lines of text, drawn top to bottom
+            x: X coordinate shared by every line
+            y: Baseline Y coordinate of the first line
+            line_height: Distance between consecutive baselines
+            font: Skia Font to use
+            color: RGBA color tuple
+        """
+        runs = [(line, x, y + idx * line_height) for idx, line in enumerate(lines)]
+        DrawingHelpers.draw_text_batch(canvas, runs, font, color)
+    
+    @staticmethod
+    def draw_text_batch(canvas: skia.Canvas, runs: List[Tuple[str, float, float]],
+                        font: skia.Font,
+                        color: Tuple[int, int, int, int] = (0, 0, 0, 255)) -> None:
+        """
+        Draw several pieces of text with a single text blob.
+        
+        Callers collect their captions and submit them in one draw call
+        instead of calling ``draw_text`` for each.
+        
+        Args:
+            canvas: Skia Canvas to draw on
+            runs: ``(text, x, y)`` tuples, with ``y`` as the baseline; empty
+                texts are skipped
+            font: Skia Font shared by every run
+            color: RGBA color tuple
+        """
+        builder = skia.TextBlobBuilder()
+        for text, x, y in runs:
+            if text:
+                builder.allocRun(text, font, x, y)
+        
+        blob = builder.make()
+        if blob is None:
+            return
+        
+        paint = _paint_for(tuple(color))
+        canvas.drawTextBlob(blob, 0, 0, paint)
+    
     @staticmethod
     def draw_circle(canvas: skia.Canvas, cx: float, cy: float, radius: float,
                     color: Tuple[int, int, int, int] = (0, 0, 0, 255)) -> None:
@@ -221,8 +618,7 @@ class DrawingHelpers:
             radius: Circle radius
             color: RGBA color tuple
         """
-        paint = skia.Paint()
-        paint.setColor(skia.Color4f(color[0]/255, color[1]/255, color[2]/255, color[3]/255))
+        paint = _paint_for(tuple(color))
         canvas.drawCircle(cx, cy, radius, paint)
     
     @staticmethod
@@ -240,16 +636,38 @@ class DrawingHelpers:
             stroke_width: Line width
             color: RGBA color tuple
         """
-        paint = skia.Paint()
-        paint.setColor(skia.Color4f(color[0]/255, color[1]/255, color[2]/255, color[3]/255))
-        paint.setStrokeWidth(stroke_width)
+        paint = _paint_for(tuple(color), skia.Paint.kFill_Style, stroke_width)
         canvas.drawLine(x1, y1, x2, y2, paint)
+    
+    @staticmethod
+    def prepare_palette(colors: "np.ndarray") -> List[int]:
+        """
+        Pack many RGBA colors into Skia ARGB color values at once.
+        
+        The packing runs as a single vectorized NumPy operation, which is
+        cheaper than converting colors one by one when a pass draws hundreds
+        of differently colored primitives. The results can be passed to
+        ``skia.Paint.setColor`` or ``canvas.clear`` and indexed by callers.
+        
+        Args:
+            colors: ``(N, 4)`` array-like of RGBA values in 0-255
+            
+        Returns:
+            List of packed ARGB colors, one per row
+        """
+        rgba = np.asarray(colors, dtype=np.uint32).reshape(-1, 4)
+        argb = (rgba[:, 3] << 24) | (rgba[:, 0] << 16) | (rgba[:, 1] << 8) | rgba[:, 2]
+        return argb.tolist()
 
 
 def load_image_from_path(image_path: Path) -> Optional[skia.Image]:
     """
     Load an image from file path.
     
+    The file is mapped by Skia rather than read into Python memory, and the
+    image is decoded straight away so it does not depend on the mapping
+    staying valid if the file is later replaced.
+    
     Args:
         image_path: Path to image file
         
@@ -260,14 +678,19 @@ def load_image_from_path(image_path: Path) -> Optional[skia.Image]:
         return None
     
     try:
-        with open(image_path, 'rb') as f:
-            data = f.read()
-        return skia.Image.MakeFromEncoded(skia.Data.MakeWithoutCopy(data))
+        data = skia.Data.MakeFromFileName(str(image_path))
+        if data is None:
+            return None
+        image = skia.Image.MakeFromEncoded(data)
+        if image is None:
+            return None
+        return image.makeRasterImage()
     except Exception:
         return None
 
 
-def scale_image(image: skia.Image, target_width: int, target_height: int) -> skia.Image:
+def scale_image(image: skia.Image, target_width: int, target_height: int,
+                fast: bool = False) -> skia.Image:
     """
     Scale an image to target dimensions.
     
@@ -275,6 +698,8 @@ def scale_image(image: skia.Image, target_width: int, target_height: int) -> ski
         image: Skia Image to scale
         target_width: Target width
         target_height: Target height
+        fast: Use nearest-neighbour sampling (for previews) instead of
+            Mitchell cubic resampling
         
     Returns:
         Scaled Skia Image
@@ -282,8 +707,38 @@ def scale_image(image: skia.Image, target_width: int, target_height: int) -> ski
     surface = SurfaceManager.create_raster_surface(target_width, target_height)
     canvas = surface.getCanvas()
     
+    if fast:
+        sampling = skia.SamplingOptions(skia.FilterMode.kNearest)
+    else:
+        sampling = skia.SamplingOptions(skia.CubicResampler.Mitchell())
+    
     src_rect = skia.Rect.MakeWH(image.width(), image.height())
     dst_rect = skia.Rect.MakeWH(target_width, target_height)
-    canvas.drawImageRect(image, src_rect, dst_rect)
+    # The source rect is the whole image, so there are no outside texels to guard
+    canvas.drawImageRect(image, src_rect, dst_rect, sampling, None,
+                         skia.Canvas.kFast_SrcRectConstraint)
     
     return surface.makeImageSnapshot()
+
+
+@lru_cache(maxsize=256)
+def _load_scaled(path_str: str, mtime_ns: int, width: int, height: int) -> Optional[skia.Image]:
+    """
+    Load an image file and scale it to the given size, with caching.
+    
+    Keyed on the file modification time so an edited file is reloaded.
+    Skia images are immutable, so the cached instance is shared by renders.
+    
+    Args:
+        path_str: Path to image file
+        mtime_ns: File modification time in nanoseconds
+        width: Target width
+        height: Target height
+        
+    Returns:
+        Scaled Skia Image or None if loading failed
+    """
+    image = load_image_from_path(Path(path_str))
+    if image is None:
+        return None
+    return scale_image(image, width, height)
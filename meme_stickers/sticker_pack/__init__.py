@@ -20,6 +20,8 @@ from .hub import (
     HubIndex,
     fetch_hub_index,
     fetch_pack_manifest,
+    fetch_all_pack_manifests,
+    parse_checksum,
     construct_github_raw_url,
 )
 from .update import PackUpdater, UpdateError
@@ -47,6 +49,8 @@ __all__ = [
     "HubIndex",
     "fetch_hub_index",
     "fetch_pack_manifest",
+    "fetch_all_pack_manifests",
+    "parse_checksum",
     "construct_github_raw_url",
     "PackUpdater",
     "UpdateError",
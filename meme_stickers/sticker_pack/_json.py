@@ -0,0 +1,48 @@
+"""
+JSON helpers for pack metadata and hub responses.
+Uses orjson when it is installed and falls back to the standard library.
+"""
+
+import json
+from typing import Any, Union
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def loads(data: Union[bytes, str]) -> Any:
+    """
+    Parse a JSON document.
+    
+    Args:
+        data: JSON text or UTF-8 encoded bytes
+        
+    Returns:
+        Parsed object
+        
+    Raises:
+        json.JSONDecodeError: If the document is invalid
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def dumps_indented(obj: Any) -> bytes:
+    """
+    Serialize an object as UTF-8 JSON indented by two spaces.
+    
+    Non-ASCII characters are written as-is, matching
+    ``json.dump(obj, f, ensure_ascii=False, indent=2)``.
+    
+    Args:
+        obj: Object to serialize
+        
+    Returns:
+        UTF-8 encoded JSON
+    """
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    return json.dumps(obj, ensure_ascii=False, indent=2).encode("utf-8")
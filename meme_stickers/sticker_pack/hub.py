@@ -5,24 +5,67 @@ Handles HTTP communication with the pack hub server.
 
 import asyncio
 import hashlib
+import os
+import string
+import time
 from dataclasses import dataclass
-from typing import List, Optional, Dict, Any, Literal
-from datetime import datetime, timedelta
+from functools import lru_cache
+from typing import Callable, List, Optional, Dict, Any, Literal, Tuple
 
 from .models import HubPackInfo
+from .._compat import _DATACLASS_SLOTS
+from .._hashing import _new_hash
+from ._json import loads as _json_loads
 
 try:
     import httpx
 except ImportError:
     httpx = None
 
+try:
+    import h2  # noqa: F401  # enables HTTP/2 in httpx
+    _HTTP2_AVAILABLE = True
+except ImportError:
+    _HTTP2_AVAILABLE = False
+
+
+_DOWNLOAD_CHUNK_SIZE = 1 << 20
+
+
+def _write_all(fd: int, data: bytes) -> None:
+    """Write all of ``data`` to a file descriptor"""
+    view = memoryview(data)
+    while view:
+        written = os.write(fd, view)
+        view = view[written:]
+
+
+def _write_and_hash(fd: int, data: bytes, hash_obj: Any) -> None:
+    """Write all of ``data`` to a file descriptor and feed it to ``hash_obj``"""
+    _write_all(fd, data)
+    hash_obj.update(data)
+
+
+def parse_checksum(checksum: str) -> Tuple[str, str]:
+    """
+    Split a published checksum into (algorithm, hex digest).
+    
+    Checksums may be prefixed with their algorithm, e.g. ``"sha256:<hex>"``
+    or ``"blake3:<hex>"``. Unprefixed values are MD5, the format hub
+    manifests have always used.
+    """
+    algorithm, sep, digest = checksum.partition(":")
+    if not sep:
+        return "md5", checksum.strip().lower()
+    return algorithm.strip().lower(), digest.strip().lower()
+
 
 class HubError(Exception):
     """Raised when hub communication fails"""
     pass
 
 
-@dataclass
+@dataclass(frozen=True, **_DATACLASS_SLOTS)
 class GitHubSource:
     """GitHub source configuration for a pack"""
     type: Literal["github"] = "github"
@@ -53,7 +96,7 @@ class GitHubSource:
         )
 
 
-@dataclass
+@dataclass(frozen=True, **_DATACLASS_SLOTS)
 class HubPackReference:
     """Reference to a pack in the Hub"""
     slug: str
@@ -78,7 +121,7 @@ class HubPackReference:
         )
 
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class HubIndex:
     """Index of packs available in the Hub"""
     packs: List[HubPackReference]
@@ -118,7 +161,46 @@ class HubClient:
         self.timeout = timeout
         self.cache_ttl = cache_ttl
         self._pack_cache: Optional[List[HubPackInfo]] = None
-        self._cache_time: Optional[datetime] = None
+        self._cache_time: Optional[float] = None
+        self._pack_index: Dict[str, HubPackInfo] = {}
+        self._client: Optional[Any] = None
+    
+    async def __aenter__(self) -> "HubClient":
+        self.get_client()
+        return self
+    
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        await self.aclose()
+    
+    def get_client(self) -> "httpx.AsyncClient":
+        """
+        Get the shared HTTP client, creating it on first use.
+        
+        Reusing one client keeps connections (and TLS sessions) alive
+        across requests instead of reconnecting for every call.
+        
+        Returns:
+            Shared httpx.AsyncClient instance
+            
+        Raises:
+            HubError: If httpx is not installed
+        """
+        if httpx is None:
+            raise HubError("httpx is not installed")
+        
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.AsyncClient(
+                timeout=self.timeout,
+                http2=_HTTP2_AVAILABLE,
+                limits=httpx.Limits(max_keepalive_connections=20),
+            )
+        return self._client
+    
+    async def aclose(self) -> None:
+        """Close the shared HTTP client if it was created"""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
     
     async def fetch_packs(self, force_refresh: bool = False) -> List[HubPackInfo]:
         """
@@ -136,32 +218,34 @@ class HubClient:
         # Check cache
         if not force_refresh and self._pack_cache is not None:
             if self._cache_time is not None:
-                age = datetime.now() - self._cache_time
-                if age < timedelta(seconds=self.cache_ttl):
+                age = time.monotonic() - self._cache_time
+                if age < self.cache_ttl:
                     return self._pack_cache
         
-        if httpx is None:
-            raise HubError("httpx is not installed")
+        client = self.get_client()
         
         try:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                response = await client.get(f"{self.hub_url}/packs")
-                response.raise_for_status()
-                data = response.json()
-                
-                if data.get("status") != "success":
-                    raise HubError(f"Hub returned error: {data.get('error', 'Unknown error')}")
-                
-                packs = [
-                    HubPackInfo.from_dict(pack_data)
-                    for pack_data in data.get("packs", [])
-                ]
-                
-                # Update cache
-                self._pack_cache = packs
-                self._cache_time = datetime.now()
-                
-                return packs
+            response = await client.get(f"{self.hub_url}/packs")
+            response.raise_for_status()
+            data = _json_loads(response.content)
+            
+            if data.get("status") != "success":
+                raise HubError(f"Hub returned error: {data.get('error', 'Unknown error')}")
+            
+            packs = [
+                HubPackInfo.from_dict(pack_data)
+                for pack_data in data.get("packs", [])
+            ]
+            
+            # Update cache; the first pack wins if a name is listed twice
+            pack_index: Dict[str, HubPackInfo] = {}
+            for pack in packs:
+                pack_index.setdefault(pack.name, pack)
+            self._pack_cache = packs
+            self._pack_index = pack_index
+            self._cache_time = time.monotonic()
+            
+            return packs
         
         except httpx.HTTPError as e:
             raise HubError(f"Failed to fetch packs from hub: {e}")
@@ -179,11 +263,8 @@ class HubClient:
         Returns:
             HubPackInfo or None if not found
         """
-        packs = await self.fetch_packs(force_refresh=force_refresh)
-        for pack in packs:
-            if pack.name == pack_name:
-                return pack
-        return None
+        await self.fetch_packs(force_refresh=force_refresh)
+        return self._pack_index.get(pack_name)
     
     async def download_pack(self, url: str, output_path: str) -> str:
         """
@@ -199,17 +280,62 @@ class HubClient:
         Raises:
             HubError: If download fails
         """
-        if httpx is None:
-            raise HubError("httpx is not installed")
+        await self._download(url, output_path)
+        return output_path
+    
+    async def download_and_hash(
+        self,
+        url: str,
+        output_path: str,
+        algorithm: str = "md5",
+    ) -> Tuple[str, str]:
+        """
+        Download a pack from URL, hashing it as it is written.
+        
+        Saves re-reading the file with calculate_checksum afterwards.
+        
+        Args:
+            url: URL to download from
+            output_path: Path to save the file to
+            algorithm: Any algorithm accepted by calculate_checksum
+            
+        Returns:
+            Tuple of (path to downloaded file, hex digest of its contents)
+            
+        Raises:
+            ValueError: If the algorithm is not supported
+            HubError: If download fails
+        """
+        hash_obj = _new_hash(algorithm)
+        
+        await self._download(url, output_path, hash_obj)
+        return output_path, hash_obj.hexdigest()
+    
+    async def _download(self, url: str, output_path: str, hash_obj: Any = None) -> None:
+        """Stream ``url`` to ``output_path``, updating ``hash_obj`` if given"""
+        client = self.get_client()
         
         try:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                async with client.stream("GET", url) as response:
-                    response.raise_for_status()
-                    with open(output_path, "wb") as f:
-                        async for chunk in response.aiter_bytes():
-                            f.write(chunk)
-                return output_path
+            async with client.stream("GET", url) as response:
+                response.raise_for_status()
+                # Pack archives are already compressed; only decode when the
+                # server actually applied a content encoding.
+                encoding = response.headers.get("content-encoding", "identity")
+                if encoding.strip().lower() == "identity":
+                    chunks = response.aiter_raw(chunk_size=_DOWNLOAD_CHUNK_SIZE)
+                else:
+                    chunks = response.aiter_bytes(chunk_size=_DOWNLOAD_CHUNK_SIZE)
+                
+                fd = os.open(output_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+                try:
+                    if hash_obj is None:
+                        async for chunk in chunks:
+                            await asyncio.to_thread(_write_all, fd, chunk)
+                    else:
+                        async for chunk in chunks:
+                            await asyncio.to_thread(_write_and_hash, fd, chunk, hash_obj)
+                finally:
+                    os.close(fd)
         
         except httpx.HTTPError as e:
             raise HubError(f"Failed to download pack: {e}")
@@ -229,14 +355,12 @@ class HubClient:
         Raises:
             HubError: If fetch fails
         """
-        if httpx is None:
-            raise HubError("httpx is not installed")
+        client = self.get_client()
         
         try:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                response = await client.get(url)
-                response.raise_for_status()
-                return response.json()
+            response = await client.get(url)
+            response.raise_for_status()
+            return _json_loads(response.content)
         
         except httpx.HTTPError as e:
             raise HubError(f"Failed to fetch manifest: {e}")
@@ -247,31 +371,58 @@ class HubClient:
         """
         Calculate checksum for a file.
         
+        Unprefixed hub checksums are MD5, so MD5 stays the default. See
+        parse_checksum for the prefixed form used by other algorithms.
+        
         Args:
             file_path: Path to file
-            algorithm: Hash algorithm (md5, sha1, sha256)
+            algorithm: Any algorithm supported by ``hashlib.new``
+                (e.g. md5, sha1, sha256, blake2b), or blake3 when the
+                ``blake3`` package is installed
             
         Returns:
             Hex digest of file
+            
+        Raises:
+            ValueError: If the algorithm is not supported
         """
-        if algorithm == "md5":
-            hash_obj = hashlib.md5()
-        elif algorithm == "sha1":
-            hash_obj = hashlib.sha1()
-        elif algorithm == "sha256":
-            hash_obj = hashlib.sha256()
-        else:
-            raise ValueError(f"Unsupported algorithm: {algorithm}")
+        hash_obj = _new_hash(algorithm)
         
         with open(file_path, "rb") as f:
-            while chunk := f.read(8192):
-                hash_obj.update(chunk)
+            if hasattr(hashlib, "file_digest"):
+                # Python 3.11+: hashing runs in C without per-chunk bytes objects
+                return hashlib.file_digest(f, lambda: hash_obj).hexdigest()
+            
+            buffer = bytearray(1 << 20)
+            view = memoryview(buffer)
+            while size := f.readinto(buffer):
+                hash_obj.update(view[:size])
         
         return hash_obj.hexdigest()
     
+    async def calculate_checksum_async(self, file_path: str, algorithm: str = "md5") -> str:
+        """
+        Calculate checksum for a file in a worker thread.
+        
+        Hashing releases the GIL, so this keeps the event loop responsive
+        and lets concurrent verifications run on separate cores.
+        
+        Args:
+            file_path: Path to file
+            algorithm: Any algorithm accepted by calculate_checksum
+            
+        Returns:
+            Hex digest of file
+            
+        Raises:
+            ValueError: If the algorithm is not supported
+        """
+        return await asyncio.to_thread(self.calculate_checksum, file_path, algorithm)
+    
     def clear_cache(self) -> None:
         """Clear the pack cache"""
         self._pack_cache = None
+        self._pack_index = {}
         self._cache_time = None
 
 
@@ -301,7 +452,7 @@ async def fetch_hub_index(hub_url: str, client: Optional[Any] = None) -> List[Hu
         try:
             response = await client.get(hub_url)
             response.raise_for_status()
-            data = response.json()
+            data = _json_loads(response.content)
             
             hub_index = HubIndex.from_dict(data)
             return hub_index.packs
@@ -353,7 +504,7 @@ async def fetch_pack_manifest(source: GitHubSource, github_raw_template: str, cl
         try:
             response = await client.get(url)
             response.raise_for_status()
-            return response.json()
+            return _json_loads(response.content)
         finally:
             if should_close_client:
                 await client.aclose()
@@ -366,6 +517,90 @@ async def fetch_pack_manifest(source: GitHubSource, github_raw_template: str, cl
         raise HubError(f"Unexpected error fetching pack manifest: {e}")
 
 
+async def fetch_all_pack_manifests(
+    sources: List[GitHubSource],
+    github_raw_template: str,
+    client: Optional[Any] = None,
+    max_concurrent: int = 16,
+) -> List[Dict[str, Any]]:
+    """
+    Fetch several packs' manifest.json files concurrently.
+    
+    Requests share one client so they reuse its connections, and at most
+    ``max_concurrent`` of them are in flight at once.
+    
+    Args:
+        sources: GitHubSource configurations to fetch
+        github_raw_template: Template for GitHub raw URLs
+        client: Optional httpx.AsyncClient to use for the requests
+        max_concurrent: Maximum number of simultaneous requests
+        
+    Returns:
+        Pack manifest dictionaries, in the same order as ``sources``
+        
+    Raises:
+        HubError: If any manifest cannot be fetched
+    """
+    if httpx is None:
+        raise HubError("httpx is not installed")
+    
+    should_close_client = False
+    if client is None:
+        client = httpx.AsyncClient(timeout=30, http2=_HTTP2_AVAILABLE)
+        should_close_client = True
+    
+    semaphore = asyncio.Semaphore(max_concurrent)
+    
+    async def fetch_one(source: GitHubSource) -> Dict[str, Any]:
+        async with semaphore:
+            return await fetch_pack_manifest(source, github_raw_template, client)
+    
+    tasks = [asyncio.ensure_future(fetch_one(source)) for source in sources]
+    try:
+        return list(await asyncio.gather(*tasks))
+    except BaseException:
+        # Stop the remaining requests before their client is closed
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        raise
+    finally:
+        if should_close_client:
+            await client.aclose()
+
+
+@lru_cache(maxsize=8)
+def _compile_url_template(template: str) -> Callable[..., str]:
+    """
+    Compile a URL template into a function that joins its pieces directly.
+    
+    Templates using anything beyond plain ``{name}`` fields (format specs,
+    conversions, indexing) fall back to ``str.format``.
+    
+    Args:
+        template: URL template with ``{name}`` placeholders
+        
+    Returns:
+        Function taking the placeholder values as keyword arguments
+    """
+    parts = list(string.Formatter().parse(template))
+    for _, field_name, format_spec, conversion in parts:
+        if field_name is not None and (
+            format_spec or conversion or not field_name.isidentifier()
+        ):
+            return template.format
+    
+    def build(**fields: str) -> str:
+        pieces = []
+        for literal, field_name, _, _ in parts:
+            pieces.append(literal)
+            if field_name is not None:
+                pieces.append(str(fields[field_name]))
+        return "".join(pieces)
+    
+    return build
+
+
 def construct_github_raw_url(owner: str, repo: str, ref: str, path: str, filename: str, template: str) -> str:
     """
     Construct a GitHub raw content URL from source information.
@@ -381,6 +616,6 @@ def construct_github_raw_url(owner: str, repo: str, ref: str, path: str, filenam
     Returns:
         Constructed GitHub raw URL
     """
-    full_path = f"{path}/{filename}".lstrip("/")
-    url = template.format(owner=owner, repo=repo, ref=ref, path=full_path)
-    return url
+    path = "/".join(part for part in path.split("/") if part)
+    full_path = f"{path}/{filename}" if path else filename
+    return _compile_url_template(template)(owner=owner, repo=repo, ref=ref, path=full_path)
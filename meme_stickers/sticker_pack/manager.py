@@ -3,20 +3,45 @@ Sticker pack manager for orchestrating pack lifecycle.
 Manages loading, installing, updating, and deleting sticker packs.
 """
 
-import json
+import os
 import shutil
 import asyncio
+import tempfile
+import time
 from pathlib import Path
-from typing import Dict, List, Optional, Callable, Any
+from typing import Dict, List, Optional, Callable, Any, Tuple
 from dataclasses import dataclass
 from enum import Enum
 
 from .models import PackManifest, PackConfig, HubPackInfo
+from .._compat import _DATACLASS_SLOTS
+from . import _json
 from .pack import Pack, PackError
-from .hub import HubClient, HubError
+from .hub import (
+    HubClient,
+    HubError,
+    HubPackReference,
+    fetch_hub_index,
+    fetch_pack_manifest,
+)
 from .update import PackUpdater, UpdateError
 
 
+def _write_atomic(path: Path, data: bytes) -> None:
+    """Write ``data`` to a sibling temp file and rename it over ``path``."""
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.replace(tmp_name, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_name)
+        except FileNotFoundError:
+            pass
+        raise
+
+
 class PackState(str, Enum):
     """Pack state enumeration"""
     LOADING = "loading"
@@ -30,7 +55,7 @@ class PackState(str, Enum):
     ERROR = "error"
 
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class PackEvent:
     """Event for pack state changes"""
     pack_name: str
@@ -47,6 +72,11 @@ class ManagerError(Exception):
 class StickerPackManager:
     """Manages sticker pack lifecycle"""
     
+    # Number of packs loaded concurrently during reload
+    RELOAD_BATCH_SIZE = 32
+    # Seconds a fetched hub index is reused by get_hub_packs/install_from_hub
+    HUB_INDEX_TTL = 60.0
+    
     def __init__(self, base_path: Path, hub_url: str = "http://localhost:8888"):
         """
         Initialize pack manager.
@@ -65,17 +95,49 @@ class StickerPackManager:
         self.packs: Dict[str, Pack] = {}
         self.manifests: Dict[str, PackManifest] = {}
         self.configs: Dict[str, PackConfig] = {}
+        # Bytes last written to config_file, used to skip no-op saves
+        self._config_payload: Optional[bytes] = None
+        # (time.monotonic() of fetch, hub index)
+        self._hub_index_cache: Optional[Tuple[float, List[HubPackReference]]] = None
         
-        self._state_callbacks: List[Callable[[PackEvent], Any]] = []
+        # Insertion-ordered set of callbacks
+        self._state_callbacks: Dict[Callable[[PackEvent], Any], None] = {}
+    
+    async def __aenter__(self) -> "StickerPackManager":
+        return self
+    
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        await self.aclose()
+    
+    async def aclose(self) -> None:
+        """
+        Release network resources held by the manager.
+        
+        Closes the hub client's pooled HTTP connections. Call this (or use
+        the manager as an async context manager) when done with it; the
+        client is recreated if the manager is used again.
+        """
+        await self.hub_client.aclose()
     
     def on_pack_state_change(self, callback: Callable[[PackEvent], Any]) -> None:
         """
         Register a callback for pack state changes.
         
+        Registering the same callback again has no effect.
+        
         Args:
             callback: Function to call on state change
         """
-        self._state_callbacks.append(callback)
+        self._state_callbacks[callback] = None
+    
+    def off_pack_state_change(self, callback: Callable[[PackEvent], Any]) -> None:
+        """
+        Unregister a callback added with ``on_pack_state_change``.
+        
+        Args:
+            callback: Previously registered callback; unknown callbacks are ignored
+        """
+        self._state_callbacks.pop(callback, None)
     
     def _emit_event(self, event: PackEvent) -> None:
         """
@@ -84,10 +146,14 @@ class StickerPackManager:
         Args:
             event: PackEvent to emit
         """
-        for callback in self._state_callbacks:
+        if not self._state_callbacks:
+            return
+        
+        # Iterate a snapshot so callbacks may unregister themselves
+        for callback in tuple(self._state_callbacks):
             try:
                 callback(event)
-            except Exception as e:
+            except Exception:
                 pass  # Silently ignore callback errors
     
     async def reload(self) -> None:
@@ -101,14 +167,33 @@ class StickerPackManager:
         
         self.packs_dir.mkdir(parents=True, exist_ok=True)
         
-        # Scan packs directory
-        for pack_dir in self.packs_dir.iterdir():
-            if pack_dir.is_dir() and not pack_dir.name.startswith("."):
-                await self._load_pack(pack_dir)
+        # Scan packs directory, loading packs concurrently in batches so a
+        # large directory neither builds one huge task list nor starves the loop
+        batch: List[Path] = []
+        with os.scandir(self.packs_dir) as entries:
+            for entry in entries:
+                if entry.is_dir() and not entry.name.startswith("."):
+                    batch.append(Path(entry.path))
+                    if len(batch) >= self.RELOAD_BATCH_SIZE:
+                        await self._load_pack_batch(batch)
+                        batch = []
+        if batch:
+            await self._load_pack_batch(batch)
         
         # Load configuration
         await self._load_config()
     
+    async def _load_pack_batch(self, pack_dirs: List[Path]) -> None:
+        """
+        Load several packs concurrently, then yield to the event loop.
+        
+        Args:
+            pack_dirs: Paths to pack directories
+        """
+        await asyncio.gather(*(self._load_pack(pack_dir) for pack_dir in pack_dirs),
+                             return_exceptions=True)
+        await asyncio.sleep(0)
+    
     async def _load_pack(self, pack_dir: Path) -> None:
         """
         Load a single pack from directory.
@@ -121,10 +206,11 @@ class StickerPackManager:
         
         try:
             pack = Pack(pack_dir)
-            manifest = await pack.load_manifest()
+            # File reads run in worker threads so concurrent loads overlap
+            manifest = await asyncio.to_thread(pack.read_manifest)
             
             # Discover stickers
-            stickers = await pack.discover_stickers()
+            stickers = await asyncio.to_thread(pack.scan_stickers)
             manifest.stickers = stickers
             
             self.packs[pack_name] = pack
@@ -137,12 +223,13 @@ class StickerPackManager:
     
     async def _load_config(self) -> None:
         """Load configuration from file"""
-        if not self.config_file.exists():
-            return
+        try:
+            raw = await asyncio.to_thread(self.config_file.read_bytes)
+        except OSError:
+            return  # No config yet, or unreadable
         
         try:
-            with open(self.config_file, "r", encoding="utf-8") as f:
-                data = json.load(f)
+            data = _json.loads(raw)
             
             packs_config = data.get("packs", {})
             for pack_name, config_data in packs_config.items():
@@ -163,8 +250,12 @@ class StickerPackManager:
             }
         }
         
-        with open(self.config_file, "w", encoding="utf-8") as f:
-            json.dump(config_data, f, ensure_ascii=False, indent=2)
+        payload = _json.dumps_indented(config_data)
+        if payload == self._config_payload:
+            return
+        
+        await asyncio.to_thread(_write_atomic, self.config_file, payload)
+        self._config_payload = payload
     
     def get_pack(self, pack_name: str) -> Optional[Pack]:
         """
@@ -241,25 +332,24 @@ class StickerPackManager:
         self._emit_event(PackEvent(final_name, PackState.INSTALLING))
         
         try:
-            temp_dir = self.base_path / ".temp"
-            temp_dir.mkdir(parents=True, exist_ok=True)
-            
-            # Download pack
-            if progress_callback:
-                progress_callback(f"Downloading {pack_info.display_name}...")
-            
-            pack_zip = await self.updater.download_pack(pack_info, temp_dir, progress_callback)
-            
-            # Install pack
-            install_dir = await self.updater.install_pack(
-                pack_zip,
-                self.packs_dir,
-                final_name,
-                progress_callback,
-            )
-            
-            # Remove zip
-            pack_zip.unlink(missing_ok=True)
+            # Per-operation temp directory so concurrent installs don't collide
+            self.base_path.mkdir(parents=True, exist_ok=True)
+            with tempfile.TemporaryDirectory(dir=self.base_path, prefix=".tmp-") as td:
+                temp_dir = Path(td)
+                
+                # Download pack
+                if progress_callback:
+                    progress_callback(f"Downloading {pack_info.display_name}...")
+                
+                pack_zip = await self.updater.download_pack(pack_info, temp_dir, progress_callback)
+                
+                # Install pack
+                install_dir = await self.updater.install_pack(
+                    pack_zip,
+                    self.packs_dir,
+                    final_name,
+                    progress_callback,
+                )
             
             # Load the installed pack
             await self._load_pack(install_dir)
@@ -269,12 +359,6 @@ class StickerPackManager:
         except Exception as e:
             self._emit_event(PackEvent(final_name, PackState.ERROR, str(e)))
             raise ManagerError(f"Failed to install pack: {e}")
-        
-        finally:
-            # Clean up temp directory
-            temp_dir = self.base_path / ".temp"
-            if temp_dir.exists():
-                shutil.rmtree(temp_dir, ignore_errors=True)
     
     async def update_pack(
         self,
@@ -310,26 +394,20 @@ class StickerPackManager:
                 return
             
             # Download and install update
-            temp_dir = self.base_path / ".temp"
-            temp_dir.mkdir(parents=True, exist_ok=True)
-            
-            pack_zip = await self.updater.download_pack(hub_pack, temp_dir, progress_callback)
-            
-            # Remove old pack
-            old_pack_dir = self.packs_dir / pack_name
-            if old_pack_dir.exists():
-                shutil.rmtree(old_pack_dir)
-            
-            # Install new version
-            install_dir = await self.updater.install_pack(
-                pack_zip,
-                self.packs_dir,
-                pack_name,
-                progress_callback,
-            )
-            
-            # Remove zip
-            pack_zip.unlink(missing_ok=True)
+            self.base_path.mkdir(parents=True, exist_ok=True)
+            with tempfile.TemporaryDirectory(dir=self.base_path, prefix=".tmp-") as td:
+                temp_dir = Path(td)
+                
+                pack_zip = await self.updater.download_pack(hub_pack, temp_dir, progress_callback)
+                
+                # Install new version; install_pack swaps the old pack aside
+                # only after the new one validates, and restores it on failure
+                install_dir = await self.updater.install_pack(
+                    pack_zip,
+                    self.packs_dir,
+                    pack_name,
+                    progress_callback,
+                )
             
             # Load the updated pack
             await self._load_pack(install_dir)
@@ -339,12 +417,6 @@ class StickerPackManager:
         except Exception as e:
             self._emit_event(PackEvent(pack_name, PackState.ERROR, str(e)))
             raise ManagerError(f"Failed to update pack: {e}")
-        
-        finally:
-            # Clean up temp directory
-            temp_dir = self.base_path / ".temp"
-            if temp_dir.exists():
-                shutil.rmtree(temp_dir, ignore_errors=True)
     
     async def delete_pack(self, pack_name: str) -> None:
         """
@@ -361,7 +433,7 @@ class StickerPackManager:
         try:
             pack_dir = self.packs_dir / pack_name
             if pack_dir.exists():
-                shutil.rmtree(pack_dir)
+                await asyncio.to_thread(shutil.rmtree, pack_dir)
             
             # Remove from caches
             self.packs.pop(pack_name, None)
@@ -395,19 +467,44 @@ class StickerPackManager:
         except HubError as e:
             raise ManagerError(f"Failed to fetch hub packs: {e}")
     
-    async def get_hub_packs(self) -> List["HubPackReference"]:
+    async def _fetch_hub_index(self, refresh: bool = False) -> List[HubPackReference]:
+        """
+        Fetch the hub index, reusing a copy younger than HUB_INDEX_TTL.
+        
+        Raises:
+            HubError: If fetch fails (the cached copy is dropped)
+        """
+        cache = self._hub_index_cache
+        if not refresh and cache is not None and time.monotonic() - cache[0] < self.HUB_INDEX_TTL:
+            return list(cache[1])
+        
+        try:
+            packs = await fetch_hub_index(self.hub_client.hub_url, self.hub_client.get_client())
+        except HubError:
+            self._hub_index_cache = None
+            raise
+        
+        self._hub_index_cache = (time.monotonic(), list(packs))
+        return list(packs)
+    
+    async def get_hub_packs(self, refresh: bool = False) -> List[HubPackReference]:
         """
         Fetch available packs from GitHub-based hub.
         
+        The index is cached for HUB_INDEX_TTL seconds, so calling this before
+        several install_from_hub calls fetches it only once.
+        
+        Args:
+            refresh: Bypass the cached index
+            
         Returns:
             List of HubPackReference objects
             
         Raises:
             ManagerError: If fetch fails
         """
-        from .hub import fetch_hub_index
         try:
-            return await fetch_hub_index(self.hub_client.hub_url)
+            return await self._fetch_hub_index(refresh)
         except HubError as e:
             raise ManagerError(f"Failed to fetch hub packs: {e}")
     
@@ -425,10 +522,9 @@ class StickerPackManager:
         Raises:
             ManagerError: If installation fails
         """
-        from .hub import fetch_hub_index, fetch_pack_manifest
-        
         try:
-            packs = await fetch_hub_index(self.hub_client.hub_url)
+            client = self.hub_client.get_client()
+            packs = await self._fetch_hub_index()
             
             pack_ref = None
             for ref in packs:
@@ -439,7 +535,7 @@ class StickerPackManager:
             if not pack_ref:
                 raise ManagerError(f"Pack not found in hub: {pack_slug}")
             
-            manifest = await fetch_pack_manifest(pack_ref.source, github_raw_template)
+            manifest = await fetch_pack_manifest(pack_ref.source, github_raw_template, client)
             
             hub_pack_info = HubPackInfo(
                 name=pack_ref.slug,
@@ -8,6 +8,8 @@ from typing import List, Optional, Dict, Any
 from enum import Enum
 from datetime import datetime
 
+from .._compat import _DATACLASS_SLOTS
+
 
 class FileSource(str, Enum):
     """Source of sticker file"""
@@ -16,7 +18,13 @@ class FileSource(str, Enum):
     BUILTIN = "builtin"
 
 
-@dataclass
+# Enum ``.value`` goes through a descriptor; a plain dict lookup is cheaper
+# when serializing packs with many stickers. Plain strings hash and compare
+# equal to their members, so they resolve too.
+_FILE_SOURCE_VALUES: Dict[Any, str] = {member: member.value for member in FileSource}
+
+
+@dataclass(**_DATACLASS_SLOTS)
 class StickerInfo:
     """Information about a single sticker"""
     name: str
@@ -25,7 +33,7 @@ class StickerInfo:
     created_at: Optional[str] = None
 
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class GridSettings:
     """Grid rendering settings for a pack"""
     columns: int = 3
@@ -37,7 +45,7 @@ class GridSettings:
     border_width: int = 1
 
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class PackManifest:
     """Pack manifest metadata (from metadata.json)"""
     name: str
@@ -54,6 +62,7 @@ class PackManifest:
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for JSON serialization"""
+        source_values = _FILE_SOURCE_VALUES
         return {
             "name": self.name,
             "display_name": self.display_name,
@@ -69,7 +78,7 @@ class PackManifest:
                 {
                     "name": s.name,
                     "path": s.path,
-                    "file_source": s.file_source.value,
+                    "file_source": source_values[s.file_source],
                     "created_at": s.created_at,
                 }
                 for s in self.stickers
@@ -104,7 +113,7 @@ class PackManifest:
         )
 
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class PackConfig:
     """Pack configuration (from config.json)"""
     name: str
@@ -173,7 +182,7 @@ class PackConfig:
         )
 
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class HubPackInfo:
     """Information about a pack in the hub"""
     name: str
@@ -3,11 +3,22 @@ Individual sticker pack operations.
 Handles loading, validation, and manipulation of a single pack.
 """
 
+import asyncio
+import dataclasses
 import json
+import os
+from collections import OrderedDict
 from pathlib import Path
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Tuple
 
 from .models import PackManifest, StickerInfo, FileSource
+from . import _json
+
+
+# Parsed manifests keyed by file path, with the (mtime_ns, size) they were read at;
+# least recently used entries are dropped once the cache is full
+_MANIFEST_CACHE: "OrderedDict[str, Tuple[int, int, PackManifest]]" = OrderedDict()
+_MANIFEST_CACHE_SIZE = 128
 
 
 class PackError(Exception):
@@ -21,7 +32,9 @@ class Pack:
     MANIFEST_FILE = "metadata.json"
     CONFIG_FILE = "config.json"
     STICKERS_DIR = "stickers"
-    SUPPORTED_FORMATS = {".png", ".jpg", ".jpeg", ".gif", ".webp"}
+    SUPPORTED_FORMATS = frozenset({".png", ".jpg", ".jpeg", ".gif", ".webp"})
+    # Same suffixes as a tuple, for a single str.endswith check per name
+    _SUPPORTED_SUFFIXES = tuple(sorted(SUPPORTED_FORMATS))
     
     def __init__(self, pack_dir: Path):
         """
@@ -33,11 +46,30 @@ class Pack:
         self.pack_dir = Path(pack_dir)
         self.manifest: Optional[PackManifest] = None
         self.stickers_dir = self.pack_dir / self.STICKERS_DIR
+        # (stickers directory mtime_ns, stickers found in it, {stem: path})
+        self._stickers_cache: Optional[
+            Tuple[int, List[StickerInfo], Dict[str, Path]]
+        ] = None
     
     async def load_manifest(self) -> PackManifest:
         """
         Load and validate pack manifest.
         
+        Returns:
+            Loaded PackManifest
+            
+        Raises:
+            PackError: If manifest is invalid or missing
+        """
+        return await asyncio.to_thread(self.read_manifest)
+    
+    def read_manifest(self) -> PackManifest:
+        """
+        Load and validate pack manifest synchronously.
+        
+        Parsed manifests are cached per process and reused while the file's
+        modification time and size are unchanged.
+        
         Returns:
             Loaded PackManifest
             
@@ -46,21 +78,36 @@ class Pack:
         """
         manifest_file = self.pack_dir / self.MANIFEST_FILE
         
-        if not manifest_file.exists():
+        try:
+            stat = os.stat(manifest_file)
+        except FileNotFoundError:
             raise PackError(f"Manifest not found: {manifest_file}")
         
+        cache_key = str(manifest_file)
+        cached = _MANIFEST_CACHE.get(cache_key)
+        if cached is not None and cached[:2] == (stat.st_mtime_ns, stat.st_size):
+            _MANIFEST_CACHE.move_to_end(cache_key)
+            # Copy so callers replacing fields (e.g. stickers) leave the cache intact
+            self.manifest = dataclasses.replace(cached[2], stickers=list(cached[2].stickers))
+            return self.manifest
+        
         try:
-            with open(manifest_file, "r", encoding="utf-8") as f:
-                data = json.load(f)
+            with open(manifest_file, "rb") as f:
+                data = _json.loads(f.read())
             
-            self.manifest = PackManifest.from_dict(data)
+            manifest = self.manifest = PackManifest.from_dict(data)
             
             # Validate required fields
-            if not self.manifest.name:
+            if not manifest.name:
                 raise PackError("Pack name is required")
-            if not self.manifest.display_name:
+            if not manifest.display_name:
                 raise PackError("Pack display_name is required")
             
+            _MANIFEST_CACHE[cache_key] = (stat.st_mtime_ns, stat.st_size, manifest)
+            _MANIFEST_CACHE.move_to_end(cache_key)
+            while len(_MANIFEST_CACHE) > _MANIFEST_CACHE_SIZE:
+                _MANIFEST_CACHE.popitem(last=False)
+            self.manifest = dataclasses.replace(manifest, stickers=list(manifest.stickers))
             return self.manifest
         
         except json.JSONDecodeError as e:
@@ -75,21 +122,61 @@ class Pack:
         Returns:
             List of discovered StickerInfo objects
         """
-        stickers = []
+        return self.scan_stickers()
+    
+    def scan_stickers(self) -> List[StickerInfo]:
+        """
+        Discover sticker files in the pack synchronously.
         
-        if not self.stickers_dir.exists():
-            return stickers
+        The scan is cached until the stickers directory's modification time
+        changes, which happens whenever a file is added, removed or renamed.
         
-        for sticker_file in sorted(self.stickers_dir.iterdir()):
-            if sticker_file.is_file() and sticker_file.suffix.lower() in self.SUPPORTED_FORMATS:
-                sticker = StickerInfo(
-                    name=sticker_file.stem,
-                    path=str(sticker_file.relative_to(self.pack_dir)),
-                    file_source=FileSource.LOCAL,
-                )
-                stickers.append(sticker)
+        Returns:
+            List of discovered StickerInfo objects
+        """
+        cache = self._refresh_stickers()
+        return list(cache[1]) if cache else []
+    
+    def _refresh_stickers(
+        self,
+    ) -> Optional[Tuple[int, List[StickerInfo], Dict[str, Path]]]:
+        """Rescan the stickers directory if it changed and return the cache."""
+        try:
+            mtime_ns = os.stat(self.stickers_dir).st_mtime_ns
+        except FileNotFoundError:
+            self._stickers_cache = None
+            return None
+        
+        if self._stickers_cache is not None and self._stickers_cache[0] == mtime_ns:
+            return self._stickers_cache
+        
+        # DirEntry caches the file type from the directory listing, so this
+        # avoids a stat per entry
+        with os.scandir(self.stickers_dir) as entries:
+            files = [entry.name for entry in entries if entry.is_file()]
+        
+        stickers = []
+        index: Dict[str, Path] = {}
+        # Same result as os.path.join(STICKERS_DIR, name), minus the call
+        path_prefix = self.STICKERS_DIR + os.sep
+        suffixes = self._SUPPORTED_SUFFIXES
+        for file_name in sorted(files):
+            if not file_name.lower().endswith(suffixes):
+                continue
+            # Skip bare names like ".png", which have no stem
+            stem = file_name.rsplit(".", 1)[0]
+            if not stem:
+                continue
+            sticker = StickerInfo(
+                name=stem,
+                path=path_prefix + file_name,
+                file_source=FileSource.LOCAL,
+            )
+            stickers.append(sticker)
+            index.setdefault(stem, self.stickers_dir / file_name)
         
-        return stickers
+        self._stickers_cache = (mtime_ns, stickers, index)
+        return self._stickers_cache
     
     async def save_manifest(self) -> None:
         """
@@ -102,11 +189,13 @@ class Pack:
             raise PackError("No manifest loaded")
         
         manifest_file = self.pack_dir / self.MANIFEST_FILE
+        self._stickers_cache = None
+        _MANIFEST_CACHE.pop(str(manifest_file), None)
         
         try:
+            payload = _json.dumps_indented(self.manifest.to_dict())
             self.pack_dir.mkdir(parents=True, exist_ok=True)
-            with open(manifest_file, "w", encoding="utf-8") as f:
-                json.dump(self.manifest.to_dict(), f, ensure_ascii=False, indent=2)
+            await asyncio.to_thread(manifest_file.write_bytes, payload)
         
         except Exception as e:
             raise PackError(f"Failed to save manifest: {e}")
@@ -126,17 +215,31 @@ class Pack:
             # Load and validate manifest
             await self.load_manifest()
             
-            # Check stickers directory exists
-            if not self.stickers_dir.exists():
-                return False
-            
             # Check at least one sticker exists
-            stickers = await self.discover_stickers()
-            return len(stickers) > 0
+            return self._has_stickers()
         
         except Exception:
             return False
     
+    def _has_stickers(self) -> bool:
+        """Check for at least one sticker, stopping at the first match."""
+        try:
+            mtime_ns = os.stat(self.stickers_dir).st_mtime_ns
+        except FileNotFoundError:
+            return False
+        
+        cache = self._stickers_cache
+        if cache is not None and cache[0] == mtime_ns:
+            return bool(cache[1])
+        
+        suffixes = self._SUPPORTED_SUFFIXES
+        with os.scandir(self.stickers_dir) as entries:
+            for entry in entries:
+                name = entry.name
+                if name.lower().endswith(suffixes) and name.rsplit(".", 1)[0] and entry.is_file():
+                    return True
+        return False
+    
     def get_sticker_path(self, sticker_name: str) -> Optional[Path]:
         """
         Get full path to a sticker file.
@@ -147,10 +250,8 @@ class Pack:
         Returns:
             Path to sticker file or None if not found
         """
-        for sticker_file in self.stickers_dir.iterdir():
-            if sticker_file.stem == sticker_name and sticker_file.suffix.lower() in self.SUPPORTED_FORMATS:
-                return sticker_file
-        return None
+        cache = self._refresh_stickers()
+        return cache[2].get(sticker_name) if cache else None
     
     def get_sticker_bytes(self, sticker_name: str) -> Optional[bytes]:
         """
@@ -3,18 +3,96 @@ Pack update logic for downloading and updating sticker packs.
 Handles checking for updates, downloading, and validation.
 """
 
+import asyncio
 import json
+import os
 import shutil
+import tempfile
+import threading
 import zipfile
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional, Callable, Any
+from typing import Optional, Callable, Any, List, Tuple
 from datetime import datetime
 
 from .models import PackManifest, HubPackInfo
-from .hub import HubClient, HubError
+from .hub import HubClient, HubError, parse_checksum
 from .pack import Pack, PackError
 
 
+# zlib releases the GIL while inflating, so members extract in parallel.
+# Small archives are not worth the thread start-up.
+_EXTRACT_WORKERS = os.cpu_count() or 1
+_PARALLEL_EXTRACT_MIN_MEMBERS = 16
+
+
+def _member_dir_parts(name: str) -> Optional[List[str]]:
+    """
+    Split a zip member name into the directory parts it extracts under.
+    
+    Returns None for names zipfile would rewrite while sanitizing
+    (absolute, drive letters, backslashes, '.' or '..' components).
+    """
+    if name.startswith("/") or "\\" in name or ":" in name:
+        return None
+    parts = name.rstrip("/").split("/")
+    if any(part in ("", ".", "..") for part in parts):
+        return None
+    return parts if name.endswith("/") else parts[:-1]
+
+
+def _extract_zip(zip_path: Path, extract_dir: Path) -> None:
+    """Extract ``zip_path`` into ``extract_dir``, in parallel for larger archives."""
+    with zipfile.ZipFile(zip_path, "r") as zip_ref:
+        members = zip_ref.infolist()
+        files = [info for info in members if not info.is_dir()]
+        dir_parts = [_member_dir_parts(info.filename) for info in members]
+        
+        if (
+            _EXTRACT_WORKERS < 2
+            or len(files) < _PARALLEL_EXTRACT_MIN_MEMBERS
+            or any(parts is None for parts in dir_parts)
+        ):
+            zip_ref.extractall(extract_dir)
+            return
+    
+    # Create every directory up front so workers never race on mkdir
+    for directory in sorted({os.path.join(extract_dir, *parts) for parts in dir_parts if parts}):
+        os.makedirs(directory, exist_ok=True)
+    
+    # ZipFile handles share a file position, so each worker opens its own
+    local = threading.local()
+    handles: List[zipfile.ZipFile] = []
+    
+    def extract(info: zipfile.ZipInfo) -> None:
+        handle = getattr(local, "zip_ref", None)
+        if handle is None:
+            handle = local.zip_ref = zipfile.ZipFile(zip_path, "r")
+            handles.append(handle)
+        handle.extract(info, extract_dir)
+    
+    try:
+        with ThreadPoolExecutor(
+            max_workers=min(_EXTRACT_WORKERS, len(files)),
+            thread_name_prefix="meme-stickers-extract",
+        ) as pool:
+            for _ in pool.map(extract, files):
+                pass
+    finally:
+        for handle in handles:
+            handle.close()
+
+
+@lru_cache(maxsize=1024)
+def _parse_version(version: str) -> Tuple[int, ...]:
+    """Parse a dotted numeric version; unparseable versions sort as (0,)"""
+    try:
+        return tuple(int(x) for x in version.split("."))
+    except (ValueError, AttributeError):
+        return (0,)
+
+
 class UpdateError(Exception):
     """Raised when update operation fails"""
     pass
@@ -92,16 +170,20 @@ class PackUpdater:
             if progress_callback:
                 progress_callback(f"Downloading {pack_info.display_name}...")
             
-            # Download using hub client
-            await self.hub_client.download_pack(pack_info.url, str(output_file))
-            
-            # Verify checksum if available
-            if pack_info.checksum:
+            # Download using hub client, hashing while writing when a
+            # checksum is published
+            if not pack_info.checksum:
+                await self.hub_client.download_pack(pack_info.url, str(output_file))
+            else:
+                algorithm, expected_checksum = parse_checksum(pack_info.checksum)
+                _, actual_checksum = await self.hub_client.download_and_hash(
+                    pack_info.url, str(output_file), algorithm
+                )
+                
                 if progress_callback:
                     progress_callback("Verifying checksum...")
                 
-                actual_checksum = self.hub_client.calculate_checksum(str(output_file))
-                if actual_checksum != pack_info.checksum:
+                if actual_checksum != expected_checksum:
                     output_file.unlink()
                     raise UpdateError(f"Checksum mismatch for {pack_info.name}")
             
@@ -140,8 +222,7 @@ class PackUpdater:
             if progress_callback:
                 progress_callback("Extracting pack...")
             
-            with zipfile.ZipFile(zip_path, "r") as zip_ref:
-                zip_ref.extractall(extract_dir)
+            await asyncio.to_thread(_extract_zip, zip_path, extract_dir)
             
             # Find pack directory (top-level directory in zip)
             subdirs = [d for d in extract_dir.iterdir() if d.is_dir()]
@@ -178,7 +259,12 @@ class PackUpdater:
         Raises:
             UpdateError: If installation fails
         """
-        temp_extract = install_dir / ".temp_extract"
+        install_dir = Path(install_dir)
+        install_dir.mkdir(parents=True, exist_ok=True)
+        # Unique per install and on the same filesystem as install_dir, so
+        # the final move is a rename
+        temp_extract = Path(tempfile.mkdtemp(dir=install_dir, prefix=".extract-"))
+        stale_dir: Optional[Path] = None
         
         try:
             # Extract to temporary directory
@@ -199,15 +285,21 @@ class PackUpdater:
             final_name = pack_name or manifest.name
             final_dir = install_dir / final_name
             
-            # Remove existing pack if present
-            if final_dir.exists():
-                shutil.rmtree(final_dir)
-            
             # Move pack to final location
             if progress_callback:
                 progress_callback(f"Installing {manifest.display_name}...")
             
-            shutil.move(str(pack_dir), str(final_dir))
+            # Swap out an existing install by rename; it is deleted in the
+            # cleanup below, and restored if the new pack cannot be moved in
+            if final_dir.exists():
+                stale_dir = Path(tempfile.mkdtemp(dir=install_dir, prefix=".stale-"))
+                os.replace(final_dir, stale_dir / final_name)
+            try:
+                os.replace(pack_dir, final_dir)
+            except OSError:
+                if stale_dir is not None:
+                    os.replace(stale_dir / final_name, final_dir)
+                raise
             
             # Save manifest with discovered stickers
             final_pack = Pack(final_dir)
@@ -222,9 +314,10 @@ class PackUpdater:
             raise UpdateError(f"Failed to install pack: {e}")
         
         finally:
-            # Clean up temporary directory
-            if temp_extract.exists():
-                shutil.rmtree(temp_extract)
+            # Clean up temporary directories
+            for leftover in (temp_extract, stale_dir):
+                if leftover is not None and leftover.exists():
+                    await asyncio.to_thread(shutil.rmtree, leftover, True)
     
     def _compare_versions(self, v1: str, v2: str) -> int:
         """
@@ -237,19 +330,9 @@ class PackUpdater:
         Returns:
             Positive if v1 > v2, negative if v1 < v2, zero if equal
         """
-        def parse_version(v: str) -> tuple:
-            try:
-                parts = [int(x) for x in v.split(".")]
-                return tuple(parts)
-            except (ValueError, AttributeError):
-                return (0,)
-        
-        ver1 = parse_version(v1)
-        ver2 = parse_version(v2)
-        
-        if ver1 > ver2:
-            return 1
-        elif ver1 < ver2:
-            return -1
-        else:
+        if v1 == v2:
             return 0
+        
+        ver1 = _parse_version(v1)
+        ver2 = _parse_version(v2)
+        return (ver1 > ver2) - (ver1 < ver2)
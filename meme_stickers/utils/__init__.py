@@ -4,7 +4,6 @@ Provides retry logic, checksum helpers, and other common utilities for AstrBot.
 """
 
 import asyncio
-import hashlib
 import json
 import re
 from contextlib import asynccontextmanager
@@ -22,6 +21,13 @@ from typing import (
 
 from astrbot.api import logger
 
+from .._hashing import _new_hash
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 __all__ = [
     "op_retry",
     "calculate_checksum",
@@ -34,6 +40,9 @@ __all__ = [
 F = TypeVar("F", bound=Callable[..., Any])
 T = TypeVar("T")
 
+# Large reads amortize syscalls and keep readahead effective when hashing
+_CHECKSUM_CHUNK_SIZE = 8 * 1024 * 1024
+
 
 def op_retry(
     max_retries: int = 3,
@@ -119,14 +128,17 @@ def op_retry(
 
 
 def calculate_file_checksum(
-    file_path: Union[str, Path], algorithm: str = "md5"
+    file_path: Union[str, Path],
+    algorithm: str = "md5",
+    chunk_size: int = _CHECKSUM_CHUNK_SIZE,
 ) -> str:
     """
     Calculate checksum for a file.
 
     Args:
         file_path: Path to file
-        algorithm: Hash algorithm (md5, sha1, sha256)
+        algorithm: Hash algorithm (a hashlib name such as md5 or sha256, or blake3 if installed)
+        chunk_size: Bytes read per call (default 8 MiB)
 
     Returns:
         Hex digest of file
@@ -140,18 +152,15 @@ def calculate_file_checksum(
     if not file_path.exists():
         raise FileNotFoundError(f"File not found: {file_path}")
 
-    if algorithm == "md5":
-        hash_obj = hashlib.md5()
-    elif algorithm == "sha1":
-        hash_obj = hashlib.sha1()
-    elif algorithm == "sha256":
-        hash_obj = hashlib.sha256()
-    else:
-        raise ValueError(f"Unsupported algorithm: {algorithm}")
+    hash_obj = _new_hash(algorithm)
 
-    with open(file_path, "rb") as f:
-        while chunk := f.read(8192):
-            hash_obj.update(chunk)
+    # Unbuffered: each readinto is already a large read, and one reused
+    # buffer avoids allocating a bytes object per chunk
+    buffer = bytearray(chunk_size)
+    view = memoryview(buffer)
+    with open(file_path, "rb", buffering=0) as f:
+        while size := f.readinto(buffer):
+            hash_obj.update(view[:size])
 
     return hash_obj.hexdigest()
 
@@ -164,7 +173,7 @@ def calculate_checksum(
 
     Args:
         data: String or bytes data
-        algorithm: Hash algorithm (md5, sha1, sha256)
+        algorithm: Hash algorithm (a hashlib name such as md5 or sha256, or blake3 if installed)
 
     Returns:
         Hex digest of data
@@ -175,14 +184,7 @@ def calculate_checksum(
     if isinstance(data, str):
         data = data.encode("utf-8")
 
-    if algorithm == "md5":
-        hash_obj = hashlib.md5()
-    elif algorithm == "sha1":
-        hash_obj = hashlib.sha1()
-    elif algorithm == "sha256":
-        hash_obj = hashlib.sha256()
-    else:
-        raise ValueError(f"Unsupported algorithm: {algorithm}")
+    hash_obj = _new_hash(algorithm)
 
     hash_obj.update(data)
     return hash_obj.hexdigest()
@@ -239,6 +241,31 @@ def parse_relative_number(value: str) -> int:
     return int(number * multipliers[suffix])
 
 
+_PLAIN_JSON_SCALARS = (str, int, bool, type(None))
+
+
+def _is_plain_json(obj: Any) -> bool:
+    """Check ``obj`` only contains types orjson and json.dumps encode alike."""
+    try:
+        return _check_plain_json(obj)
+    except RecursionError:
+        return False  # Deep or circular; json.dumps reports it properly
+
+
+def _check_plain_json(obj: Any) -> bool:
+    obj_type = type(obj)
+    if obj_type in _PLAIN_JSON_SCALARS:
+        return True
+    if obj_type is dict:
+        return all(
+            type(key) is str and _check_plain_json(value)
+            for key, value in obj.items()
+        )
+    if obj_type is list or obj_type is tuple:
+        return all(_check_plain_json(item) for item in obj)
+    return False
+
+
 def json_dumps(
     obj: Any,
     ensure_ascii: bool = False,
@@ -263,6 +290,24 @@ def json_dumps(
         >>> json_dumps({"name": "test", "value": 123})
         '{\\n  "name": "test",\\n  "value": 123\\n}'
     """
+    # orjson writes the same bytes as json.dumps only for this layout and
+    # only for plain str/int/bool/None/list/tuple/dict data; anything else
+    # (floats, non-str keys, dates, dataclasses, enums, ...) differs
+    if (
+        orjson is not None
+        and indent == 2
+        and not ensure_ascii
+        and not kwargs
+        and _is_plain_json(obj)
+    ):
+        option = orjson.OPT_INDENT_2
+        if sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        try:
+            return orjson.dumps(obj, option=option).decode("utf-8")
+        except TypeError:
+            pass  # e.g. integers beyond 64 bits; let json.dumps handle it
+
     return json.dumps(
         obj,
         ensure_ascii=ensure_ascii,
@@ -5,7 +5,17 @@ from pathlib import Path
 
 sys.path.insert(0, str(Path(__file__).parent))
 
-from meme_stickers.config import Config, resolve_color_to_tuple
+from meme_stickers.config import Config, ConfigWrapper, resolve_color_to_tuple
+
+
+class FakeAstrBotConfig:
+    """Minimal stand-in exposing plugin settings through ``get``."""
+
+    def __init__(self, data=None):
+        self.data = data or {}
+
+    def get(self, key, default=None):
+        return self.data.get(key, default)
 
 
 def test_resolve_color_hex_short_form():
@@ -43,6 +53,30 @@ def test_resolve_color_invalid_string():
         raise AssertionError("Expected ValueError for invalid colour")
 
 
+def test_resolve_color_rejects_int_literal_syntax():
+    """Prefixes and separators accepted by int() are not valid hex digits."""
+
+    for value in ("#0x1234", "#-12345", "#1_2345", "# 12345", "#11 22 33"):
+        try:
+            resolve_color_to_tuple(value)
+        except ValueError:
+            pass
+        else:  # pragma: no cover - defensive
+            raise AssertionError(f"Expected ValueError for {value!r}")
+
+
+def test_resolve_color_rejects_non_hex_digits():
+    """Non-hex and non-ASCII digits are rejected by the hex decoder itself."""
+
+    for value in ("#ggg", "#12345z", "#１２３", "#abcdeg12"):
+        try:
+            resolve_color_to_tuple(value)
+        except ValueError:
+            pass
+        else:  # pragma: no cover - defensive
+            raise AssertionError(f"Expected ValueError for {value!r}")
+
+
 def test_resolve_color_invalid_sequence_size():
     """Sequences with the wrong length should raise a ValueError."""
 
@@ -54,6 +88,18 @@ def test_resolve_color_invalid_sequence_size():
         raise AssertionError("Expected ValueError for invalid colour sequence")
 
 
+def test_resolve_color_sequence_out_of_range():
+    """Any channel outside 0-255 should raise a ValueError."""
+
+    for value in ((256, 0, 0), (-1, 0, 0), (0, 0, 0, -5), (0, 0, 0, 300)):
+        try:
+            resolve_color_to_tuple(value)
+        except ValueError:
+            pass
+        else:  # pragma: no cover - defensive
+            raise AssertionError(f"Expected ValueError for {value!r}")
+
+
 def test_config_from_mapping_normalises_values():
     """Config.from_mapping should coerce types and normalise colours."""
 
@@ -85,6 +131,23 @@ def test_config_from_mapping_invalid_bool():
         raise AssertionError("Expected ValueError for invalid boolean value")
 
 
+def test_config_from_mapping_reports_all_errors():
+    """Every invalid field should be reported in a single ValueError."""
+
+    try:
+        Config.from_mapping(
+            {"retry_attempts": -1, "auto_update": "maybe", "grid_text_color": "#12"}
+        )
+    except ValueError as exc:
+        message = str(exc)
+    else:  # pragma: no cover - defensive
+        raise AssertionError("Expected ValueError for invalid configuration")
+
+    assert "retry_attempts" in message
+    assert "auto_update" in message
+    assert "grid_text_color" in message
+
+
 def test_config_from_mapping_invalid_colour():
     """Invalid colour inputs inside configuration should raise a ValueError."""
 
@@ -94,3 +157,53 @@ def test_config_from_mapping_invalid_colour():
         pass
     else:  # pragma: no cover - defensive
         raise AssertionError("Expected ValueError for invalid colour")
+
+
+def test_config_wrapper_refresh_reuses_unchanged_config():
+    """Refreshing an unchanged mapping should keep the resolved Config."""
+
+    astrbot_config = FakeAstrBotConfig({"meme_stickers": {"render_font_size": 32}})
+    wrapper = ConfigWrapper(astrbot_config)
+    first = wrapper.config
+
+    wrapper.refresh()
+    assert wrapper.config is first
+
+    astrbot_config.data["meme_stickers"]["render_font_size"] = 40
+    wrapper.refresh()
+    assert wrapper.config is not first
+    assert wrapper.config.render_font_size == 40
+
+
+def test_config_wrapper_refresh_sees_sections_added_later():
+    """A higher-priority section added after the first refresh should apply."""
+
+    class SectionedAstrBotConfig:
+        def __init__(self):
+            self.plugins = {"meme_stickers": {"hub_url": "https://old.example.com"}}
+            self.config = {}
+
+    astrbot_config = SectionedAstrBotConfig()
+    wrapper = ConfigWrapper(astrbot_config)
+    assert wrapper.raw["hub_url"] == "https://old.example.com"
+
+    astrbot_config.config["plugins"] = {"meme_stickers": {"hub_url": "https://new.example.com"}}
+    wrapper.refresh()
+    assert wrapper.raw["hub_url"] == "https://new.example.com"
+
+
+def test_config_wrapper_resolves_lazily():
+    """Invalid values should only raise once the Config is accessed."""
+
+    wrapper = ConfigWrapper(FakeAstrBotConfig({"meme_stickers": {"retry_attempts": "many"}}))
+    assert wrapper.raw == {"retry_attempts": "many"}
+
+    try:
+        wrapper.config
+    except ValueError:
+        pass
+    else:  # pragma: no cover - defensive
+        raise AssertionError("Expected ValueError for invalid retry_attempts")
+
+    config = wrapper.apply_overrides({"retry_attempts": 2})
+    assert config.retry_attempts == 2
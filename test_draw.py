@@ -67,6 +67,7 @@ def test_font_collection():
     
     try:
         font_collection = FontCollection()
+        assert font_collection._fallback_typeface is not None, "Fallback not resolved on init"
         print("✓ FontCollection initialized")
         
         # Test typeface retrieval
@@ -81,6 +82,16 @@ def test_font_collection():
         font2 = font_collection.create_font("DejaVu Sans", 16.0)
         print(f"✓ Font with family created: {font2}")
         
+        # Test fonts are memoized per (family, size)
+        assert font_collection.create_font(None, 14.0) is font, "Font not reused"
+        assert font_collection.create_font(None, 15.0) is not font, "Font sizes mixed up"
+        print("✓ Font reused")
+        
+        # Test shared font cache
+        from meme_stickers.draw.tools import _FONTS
+        assert _FONTS.create_font(size=14.0) is _FONTS.create_font(size=14.0)
+        print("✓ Shared font cached")
+        
         print("\n✓ FontCollection tests passed\n")
         return True
     except Exception as e:
@@ -96,6 +107,7 @@ def test_surface_manager():
     print("Test: SurfaceManager")
     print("=" * 60)
     
+    import skia
     from meme_stickers.draw.tools import SurfaceManager
     
     try:
@@ -103,18 +115,58 @@ def test_surface_manager():
         surface = SurfaceManager.create_raster_surface(256, 256)
         print("✓ Raster surface created")
         
+        rgba_surface = SurfaceManager.create_surface(64, 32)
+        assert (rgba_surface.width(), rgba_surface.height()) == (64, 32), "Wrong surface size"
+        assert rgba_surface.imageInfo().colorType() == skia.kRGBA_8888_ColorType, "Wrong color type"
+        print("✓ RGBA surface created")
+        
+        # Test pooled surfaces are reused and come back cleared
+        from meme_stickers.draw.tools import surface_scope
+        with surface_scope(33, 17) as pooled:
+            pooled.getCanvas().clear(0xFFFF0000)
+        with surface_scope(33, 17) as reused:
+            assert reused is pooled, "Pooled surface not reused"
+            pixel = reused.makeImageSnapshot().toarray()[0, 0].tolist()
+            assert pixel == [0, 0, 0, 0], f"Pooled surface not cleared: {pixel}"
+        print("✓ Pooled surface reused")
+        
+        # Test the pool keeps a surface per render worker
+        from meme_stickers.draw.tools import _SURFACE_POOL_MAX_PER_SIZE
+        batch = [SurfaceManager.acquire_surface(19, 23) for _ in range(_SURFACE_POOL_MAX_PER_SIZE + 1)]
+        for pooled in batch:
+            SurfaceManager.release_surface(pooled)
+        reused = [SurfaceManager.acquire_surface(19, 23) for _ in range(_SURFACE_POOL_MAX_PER_SIZE)]
+        assert all(any(r is b for b in batch) for r in reused), "Batch surfaces not reused"
+        print("✓ Batch surfaces reused")
+        
         # Test PNG encoding
         png_bytes = SurfaceManager.get_png_bytes(surface)
         assert len(png_bytes) > 0, "PNG bytes empty"
         assert png_bytes[:8] == b'\x89PNG\r\n\x1a\n', "Invalid PNG header"
         print(f"✓ PNG encoding works (size: {len(png_bytes)} bytes)")
         
+        # Test zero-copy PNG view
+        data, view = SurfaceManager.get_png_view(surface)
+        assert view.readonly and bytes(view) == png_bytes, "PNG view differs from bytes"
+        print("✓ PNG view works")
+        
         # Test JPEG encoding
         jpeg_bytes = SurfaceManager.get_jpeg_bytes(surface, quality=90)
         assert len(jpeg_bytes) > 0, "JPEG bytes empty"
         assert jpeg_bytes[:3] == b'\xff\xd8\xff', "Invalid JPEG header"
         print(f"✓ JPEG encoding works (size: {len(jpeg_bytes)} bytes)")
         
+        # Test WebP encoding
+        webp_bytes = SurfaceManager.get_webp_bytes(surface)
+        assert webp_bytes[:4] == b'RIFF' and webp_bytes[8:12] == b'WEBP', "Invalid WebP header"
+        print(f"✓ WebP encoding works (size: {len(webp_bytes)} bytes)")
+        
+        # Test repeat encodes are reused until the surface changes
+        assert SurfaceManager.get_png_bytes(surface) == png_bytes, "Repeat encode differs"
+        surface.getCanvas().clear(0xFF00FF00)
+        assert SurfaceManager.get_png_bytes(surface) != png_bytes, "Stale encode after drawing"
+        print("✓ Encode cache follows surface changes")
+        
         # Test file saving
         with tempfile.TemporaryDirectory() as temp_dir:
             png_path = Path(temp_dir) / "test.png"
@@ -128,6 +180,12 @@ def test_surface_manager():
             assert jpeg_path.exists(), "JPEG file not created"
             assert jpeg_path.stat().st_size > 0, "JPEG file is empty"
             print(f"✓ JPEG file saved: {jpeg_path}")
+            
+            webp_path = Path(temp_dir) / "test.webp"
+            SurfaceManager.save_webp(surface, webp_path)
+            assert webp_path.exists(), "WebP file not created"
+            assert webp_path.stat().st_size > 0, "WebP file is empty"
+            print(f"✓ WebP file saved: {webp_path}")
         
         print("\n✓ SurfaceManager tests passed\n")
         return True
@@ -151,6 +209,15 @@ def test_drawing_helpers():
         surface = SurfaceManager.create_raster_surface(256, 256)
         canvas = surface.getCanvas()
         
+        # Test clear_opaque
+        DrawingHelpers.clear_opaque(canvas, (10, 20, 30, 255))
+        pixel = surface.makeImageSnapshot().toarray(colorType=skia.kRGBA_8888_ColorType)[255, 255].tolist()
+        assert pixel == [10, 20, 30, 255], f"Unexpected cleared pixel: {pixel}"
+        DrawingHelpers.clear_opaque(canvas, (255, 255, 255, 0))
+        pixel = surface.makeImageSnapshot().toarray(colorType=skia.kRGBA_8888_ColorType)[255, 255].tolist()
+        assert pixel == [10, 20, 30, 255], "Transparent fill should blend, not replace"
+        print("✓ Canvas cleared")
+        
         # Test fill_rect
         rect = skia.Rect.MakeWH(100, 100)
         DrawingHelpers.fill_rect(canvas, rect, (255, 0, 0, 255))
@@ -161,6 +228,16 @@ def test_drawing_helpers():
         DrawingHelpers.draw_text(canvas, "Test", 10, 20, font, (0, 0, 0, 255))
         print("✓ Text drawn")
         
+        # Test draw_text_lines (empty lines and an all-empty list are skipped)
+        DrawingHelpers.draw_text_lines(canvas, ["One", "", "Three"], 10, 40, 15, font, (0, 0, 0, 255))
+        DrawingHelpers.draw_text_lines(canvas, ["", ""], 10, 40, 15, font)
+        print("✓ Text lines drawn")
+        
+        # Test draw_text_batch (runs at arbitrary positions in one blob)
+        DrawingHelpers.draw_text_batch(canvas, [("A", 10, 120), ("", 0, 0), ("B", 60, 140)], font)
+        DrawingHelpers.draw_text_batch(canvas, [], font)
+        print("✓ Text batch drawn")
+        
         # Test draw_circle
         DrawingHelpers.draw_circle(canvas, 128, 128, 50, (0, 255, 0, 255))
         print("✓ Circle drawn")
@@ -169,6 +246,18 @@ def test_drawing_helpers():
         DrawingHelpers.draw_line(canvas, 0, 0, 100, 100, 2.0, (0, 0, 255, 255))
         print("✓ Line drawn")
         
+        # Paints are shared between calls with the same color
+        from meme_stickers.draw.tools import _paint_for
+        assert _paint_for((0, 0, 255, 255)) is _paint_for((0, 0, 255, 255)), "Paint not reused"
+        assert _paint_for((0, 0, 255, 255)) is not _paint_for((0, 0, 255, 128)), "Paint colors mixed up"
+        assert _paint_for((0x11, 0x22, 0x33, 0x44)).getColor() == 0x44112233, "Paint color not packed ARGB"
+        print("✓ Paints reused")
+        
+        # Test palette packing matches skia.Color
+        palette = DrawingHelpers.prepare_palette([(255, 0, 0, 255), (0x11, 0x22, 0x33, 0x44)])
+        assert palette == [skia.Color(255, 0, 0, 255), skia.Color(0x11, 0x22, 0x33, 0x44)], "Palette mismatch"
+        print("✓ Palette prepared")
+        
         # Verify output
         png_bytes = SurfaceManager.get_png_bytes(surface)
         assert png_bytes[:8] == b'\x89PNG\r\n\x1a\n', "Invalid PNG output"
@@ -244,12 +333,34 @@ def test_grid_renderer():
         assert png_bytes[:8] == b'\x89PNG\r\n\x1a\n', "Invalid PNG header"
         print(f"✓ Empty grid rendered ({len(png_bytes)} bytes)")
         
+        # Test rendering on the render thread pool
+        future_bytes = renderer.submit_render_grid([], title="Test Grid").result(timeout=10)
+        assert future_bytes == png_bytes, "Pooled grid render differs"
+        print(f"✓ Grid rendered on thread pool ({len(future_bytes)} bytes)")
+        
+        # Concurrent renders evicting from the shared placeholder cache
+        from concurrent.futures import ThreadPoolExecutor
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            titles = [f"Title {i}" for i in range(GridRenderer.EMPTY_GRID_CACHE_SIZE * 3)]
+            list(pool.map(lambda t: renderer.render_grid([], title=t), titles))
+        assert len(GridRenderer._empty_grid_cache) <= GridRenderer.EMPTY_GRID_CACHE_SIZE
+        assert GridRenderer().render_grid([], title="Test Grid") == png_bytes
+        print("✓ Placeholder cache survives concurrent eviction")
+        
         # Test simple grid without images
         png_bytes = create_simple_grid(num_cells=9, title="Simple Grid")
         assert len(png_bytes) > 0, "Simple grid bytes empty"
         assert png_bytes[:8] == b'\x89PNG\r\n\x1a\n', "Invalid PNG header"
         print(f"✓ Simple grid created ({len(png_bytes)} bytes)")
         
+        # Test large grid layout kernel matches the per-cell formula
+        from meme_stickers.draw._layout_jit import grid_layout
+        layout = grid_layout(70, 4, 120, 10, 40).tolist()
+        expected = [[(i % 4) * 120 + (i % 4 + 1) * 10, 40 + (i // 4) * 120 + (i // 4 + 1) * 10]
+                    for i in range(70)]
+        assert layout == expected, "Grid layout kernel mismatch"
+        print("✓ Large grid layout computed")
+        
         # Test grid with file output
         with tempfile.TemporaryDirectory() as temp_dir:
             output_path = Path(temp_dir) / "grid.png"
@@ -257,6 +368,33 @@ def test_grid_renderer():
             assert result is True, "Grid render to file failed"
             assert output_path.exists(), "Output file not created"
             print(f"✓ Grid saved to file: {output_path}")
+            
+            # Test JPEG output keeps the rendered dimensions
+            import skia
+            jpeg_path = Path(temp_dir) / "grid.jpg"
+            result = renderer.render_grid_to_file([], jpeg_path, title="Test")
+            assert result is True, "Grid render to JPEG failed"
+            jpeg_bytes = jpeg_path.read_bytes()
+            assert jpeg_bytes[:2] == b'\xff\xd8', "Invalid JPEG header"
+            image = skia.Image.MakeFromEncoded(skia.Data.MakeWithCopy(jpeg_bytes))
+            assert image.width() > 1 and image.height() > 1, "JPEG grid is blank"
+            print(f"✓ Grid saved as JPEG ({image.width()}x{image.height()})")
+            
+            # Test JPEG output of a grid with images matches its PNG render
+            from meme_stickers.draw.sticker import create_simple_sticker
+            sticker_path = Path(temp_dir) / "cell.png"
+            sticker_path.write_bytes(create_simple_sticker(width=64, height=64,
+                                                           background_color=(255, 0, 0, 255)))
+            cells = [sticker_path] * 5
+            png_image = skia.Image.MakeFromEncoded(
+                skia.Data.MakeWithCopy(renderer.render_grid(cells, cols=3))
+            )
+            assert renderer.render_grid_to_file(cells, jpeg_path, cols=3) is True
+            jpeg_image = skia.Image.MakeFromEncoded(skia.Data.MakeWithCopy(jpeg_path.read_bytes()))
+            assert (jpeg_image.width(), jpeg_image.height()) == (png_image.width(), png_image.height())
+            pixel = jpeg_image.toarray(colorType=skia.kRGBA_8888_ColorType)[70, 70].tolist()
+            assert pixel[0] > 200 and pixel[1] < 60, f"JPEG grid cell not drawn: {pixel}"
+            print(f"✓ Grid with images saved as JPEG ({jpeg_image.width()}x{jpeg_image.height()})")
         
         print("\n✓ GridRenderer tests passed\n")
         return True
@@ -300,6 +438,24 @@ def test_pack_list_renderer():
         assert png_bytes[:8] == b'\x89PNG\r\n\x1a\n', "Invalid PNG header"
         print(f"✓ Help image rendered ({len(png_bytes)} bytes)")
         
+        # Test replaying the recorded help image
+        cache = PackListRenderer._picture_cache
+        cache_size = len(cache)
+        shared = PackListRenderer(renderer.font_collection)
+        replayed_bytes = shared.render_help_image(commands, "Meme Commands")
+        assert replayed_bytes == png_bytes, "Replayed help image differs"
+        assert len(cache) == cache_size, "Shared font collection re-recorded"
+        print(f"✓ Help image replayed from cached picture")
+        
+        # Renderers with their own font collection record their own picture
+        PackListRenderer().render_help_image(commands, "Meme Commands")
+        assert len(cache) == cache_size + 1, "Picture reused across font collections"
+        
+        # List rows work too
+        list_bytes = renderer.render_help_image([list(row) for row in commands], "Meme Commands")
+        assert list_bytes == png_bytes, "List rows render differently"
+        print(f"✓ Help image cache keyed by font collection and row contents")
+        
         # Test pack details rendering
         png_bytes = renderer.render_pack_details(
             "test_pack", "Test Pack", "A test pack", "1.0.0", "Author", 10
@@ -314,6 +470,19 @@ def test_pack_list_renderer():
         assert png_bytes[:8] == b'\x89PNG\r\n\x1a\n', "Invalid PNG header"
         print(f"✓ Help text image created ({len(png_bytes)} bytes)")
         
+        # Test description truncation keeps clusters whole
+        from meme_stickers.draw.pack_list import _truncate_text
+        assert _truncate_text("short", 50) == "short"
+        assert _truncate_text("a" * 60, 50) == "a" * 50
+        assert _truncate_text("a" * 49 + "e\u0301x", 50) == "a" * 49, "Combining mark split"
+        assert _truncate_text("a" * 48 + "\U0001F468\u200d\U0001F469", 50) == "a" * 48, "ZWJ sequence split"
+        print("✓ Description truncation works")
+        
+        # Test help text image with no text lines
+        png_bytes = create_help_text_image("", "Empty")
+        assert png_bytes[:8] == b'\x89PNG\r\n\x1a\n', "Invalid PNG header"
+        print(f"✓ Empty help text image created ({len(png_bytes)} bytes)")
+        
         print("\n✓ PackListRenderer tests passed\n")
         return True
     except Exception as e:
@@ -351,6 +520,13 @@ def test_create_simple_sticker():
         assert png_bytes[:8] == b'\x89PNG\r\n\x1a\n', "Invalid PNG header"
         print(f"✓ Simple sticker without text created ({len(png_bytes)} bytes)")
         
+        # Repeated calls are served from the cache, list colors included
+        assert create_simple_sticker(width=100, height=100,
+                                     background_color=[255, 255, 255, 255]) is png_bytes
+        create_simple_sticker.cache_clear()
+        assert create_simple_sticker.cache_info().currsize == 0, "Cache not cleared"
+        print(f"✓ Simple sticker cache works")
+        
         print("\n✓ create_simple_sticker tests passed\n")
         return True
     except Exception as e:
@@ -382,13 +558,36 @@ def test_image_io():
             # Test loading image
             image = load_image_from_path(image_path)
             assert image is not None, "Failed to load image"
+            assert (image.width(), image.height()) == (64, 64), "Wrong image size"
             print(f"✓ Image loaded successfully")
             
+            # Test loading a file that is not an image
+            corrupt_path = temp_dir / "corrupt.png"
+            corrupt_path.write_bytes(b"not an image")
+            assert load_image_from_path(corrupt_path) is None, "Should return None for corrupt image"
+            print(f"✓ Corrupt image handling works")
+            
             # Test loading non-existent image
             non_existent = temp_dir / "non_existent.png"
             image = load_image_from_path(non_existent)
             assert image is None, "Should return None for non-existent image"
             print(f"✓ Non-existent image handling works")
+            
+            # Test scaling with both sampling modes
+            from meme_stickers.draw.tools import scale_image
+            image = load_image_from_path(image_path)
+            for fast in (False, True):
+                scaled = scale_image(image, 24, 40, fast=fast)
+                assert (scaled.width(), scaled.height()) == (24, 40), "Wrong scaled size"
+            print(f"✓ Image scaled")
+            
+            # Test cached scaled loading
+            from meme_stickers.draw.tools import _load_scaled
+            mtime_ns = image_path.stat().st_mtime_ns
+            scaled = _load_scaled(str(image_path), mtime_ns, 32, 32)
+            assert scaled is not None and scaled.width() == 32, "Failed to load scaled image"
+            assert _load_scaled(str(image_path), mtime_ns, 32, 32) is scaled, "Scaled image not cached"
+            print(f"✓ Scaled image cached")
         
         print("\n✓ Image I/O tests passed\n")
         return True
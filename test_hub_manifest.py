@@ -5,11 +5,14 @@ import pytest
 from unittest.mock import AsyncMock, Mock, patch
 from meme_stickers.sticker_pack.hub import (
     GitHubSource,
+    HubClient,
     HubPackReference,
     HubIndex,
     fetch_hub_index,
     fetch_pack_manifest,
+    fetch_all_pack_manifests,
     construct_github_raw_url,
+    parse_checksum,
     HubError,
 )
 
@@ -66,6 +69,16 @@ class TestGitHubSource:
         assert source.owner == "lgc-NB2Dev"
         assert source.repo == "meme-stickers-hub"
         assert source.path == "pjsk"
+    
+    def test_github_source_frozen(self):
+        """Test GitHubSource is immutable and usable as a dict key."""
+        import dataclasses
+        source = GitHubSource(owner="owner", repo="repo", path="pjsk")
+        ref = HubPackReference(slug="pjsk", source=source)
+        
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            source.owner = "other"
+        assert {ref: 1}[HubPackReference(slug="pjsk", source=GitHubSource.from_dict(source.to_dict()))] == 1
 
 
 class TestHubPackReference:
@@ -194,6 +207,18 @@ class TestConstructGitHubRawUrl:
         assert "//some/path" not in url
         assert url == "https://raw.githubusercontent.com/owner/repo/main/some/path/file.json"
     
+    def test_construct_url_collapses_repeated_slashes(self):
+        """Test URL construction collapses repeated slashes inside the path."""
+        url = construct_github_raw_url(
+            owner="owner",
+            repo="repo",
+            ref="main",
+            path="a//b/",
+            filename="file.json",
+            template="https://raw.githubusercontent.com/{owner}/{repo}/{ref}/{path}"
+        )
+        assert url == "https://raw.githubusercontent.com/owner/repo/main/a/b/file.json"
+    
     def test_construct_url_with_custom_template(self):
         """Test URL construction with custom template."""
         url = construct_github_raw_url(
@@ -206,6 +231,280 @@ class TestConstructGitHubRawUrl:
         )
         assert url.startswith("https://mirror.example.com/")
         assert "owner/repo/main/path/file.json" in url
+    
+    def test_construct_url_template_fallbacks(self):
+        """Test templates with escaped braces or format specs still work."""
+        url = construct_github_raw_url(
+            owner="owner",
+            repo="repo",
+            ref="main",
+            path="",
+            filename="file.json",
+            template="https://mirror.example.com/{{raw}}/{owner!s}/{repo:>4}/{ref}/{path}"
+        )
+        assert url == "https://mirror.example.com/{raw}/owner/repo/main/file.json"
+        
+        url = construct_github_raw_url(
+            owner="owner",
+            repo="repo",
+            ref="v1",
+            path="pack",
+            filename="file.json",
+            template="https://mirror.example.com/{{raw}}/{owner}/{repo}@{ref}/{path}"
+        )
+        assert url == "https://mirror.example.com/{raw}/owner/repo@v1/pack/file.json"
+
+
+class TestHubClientChecksum:
+    """Test HubClient.calculate_checksum."""
+    
+    def test_checksum_algorithms(self, tmp_path):
+        """Test file checksums match hashlib for every supported algorithm."""
+        import hashlib
+        data = b"meme-stickers" * 100000
+        file_path = tmp_path / "pack.zip"
+        file_path.write_bytes(data)
+        client = HubClient("https://hub.example.com")
+        
+        for algorithm in ("md5", "sha1", "sha256", "blake2b"):
+            expected = hashlib.new(algorithm, data).hexdigest()
+            assert client.calculate_checksum(str(file_path), algorithm) == expected
+    
+    def test_checksum_without_file_digest(self, tmp_path, monkeypatch):
+        """Test the chunked fallback used before Python 3.11."""
+        import hashlib
+        data = b"x" * ((1 << 20) + 7)
+        file_path = tmp_path / "pack.zip"
+        file_path.write_bytes(data)
+        client = HubClient("https://hub.example.com")
+        
+        monkeypatch.delattr(hashlib, "file_digest", raising=False)
+        assert client.calculate_checksum(str(file_path)) == hashlib.md5(data).hexdigest()
+    
+    @pytest.mark.asyncio
+    async def test_checksum_async(self, tmp_path):
+        """Test the threaded checksum matches the synchronous one."""
+        file_path = tmp_path / "pack.zip"
+        file_path.write_bytes(b"meme-stickers" * 1000)
+        client = HubClient("https://hub.example.com")
+        
+        expected = client.calculate_checksum(str(file_path), "sha256")
+        assert await client.calculate_checksum_async(str(file_path), "sha256") == expected
+    
+    def test_checksum_unsupported_algorithm(self, tmp_path):
+        """Test unsupported algorithms raise ValueError."""
+        file_path = tmp_path / "pack.zip"
+        file_path.write_bytes(b"data")
+        client = HubClient("https://hub.example.com")
+        
+        with pytest.raises(ValueError):
+            client.calculate_checksum(str(file_path), "crc32")
+    
+    def test_checksum_blake3(self, tmp_path, monkeypatch):
+        """Test blake3 is used when installed and rejected otherwise."""
+        from meme_stickers import _hashing
+        file_path = tmp_path / "pack.zip"
+        file_path.write_bytes(b"data")
+        client = HubClient("https://hub.example.com")
+        
+        if _hashing._blake3 is not None:
+            expected = _hashing._blake3.blake3(b"data").hexdigest()
+            assert client.calculate_checksum(str(file_path), "blake3") == expected
+        
+        monkeypatch.setattr(_hashing, "_blake3", None)
+        with pytest.raises(ValueError, match="blake3"):
+            client.calculate_checksum(str(file_path), "blake3")
+    
+    @pytest.mark.parametrize("checksum, expected", [
+        ("ABCDEF", ("md5", "abcdef")),
+        ("sha256:ABCDEF", ("sha256", "abcdef")),
+        ("blake3: abcdef ", ("blake3", "abcdef")),
+    ])
+    def test_parse_checksum(self, checksum, expected):
+        """Test prefixed and legacy checksum formats."""
+        assert parse_checksum(checksum) == expected
+    
+    @pytest.mark.asyncio
+    async def test_updater_verifies_prefixed_checksum(self, tmp_path):
+        """Test PackUpdater verifies downloads with the prefixed algorithm."""
+        import hashlib
+        import httpx
+        from meme_stickers.sticker_pack import HubPackInfo, PackUpdater, UpdateError
+        data = b"pack archive" * 1000
+        
+        hub = HubClient("https://hub.example.com")
+        hub._client = httpx.AsyncClient(
+            transport=httpx.MockTransport(lambda request: httpx.Response(200, stream=httpx.ByteStream(data)))
+        )
+        updater = PackUpdater(hub)
+        pack_info = HubPackInfo(
+            name="pack",
+            display_name="Pack",
+            description="",
+            url="https://hub.example.com/pack.zip",
+            version="1.0.0",
+            author="Test",
+            checksum=f"sha256:{hashlib.sha256(data).hexdigest()}",
+        )
+        
+        async with hub:
+            output = await updater.download_pack(pack_info, tmp_path)
+            assert output.read_bytes() == data
+            
+            pack_info.checksum = f"sha256:{'0' * 64}"
+            with pytest.raises(UpdateError, match="Checksum mismatch"):
+                await updater.download_pack(pack_info, tmp_path)
+            assert not output.exists()
+
+
+class TestHubClientSession:
+    """Test HubClient reuses one HTTP client across calls."""
+    
+    @pytest.mark.asyncio
+    async def test_client_reused(self):
+        """Test get_client returns the same client until closed."""
+        async with HubClient("https://hub.example.com") as hub:
+            client = hub.get_client()
+            assert hub.get_client() is client
+        
+        assert client.is_closed
+        assert hub._client is None
+    
+    @pytest.mark.asyncio
+    async def test_fetch_packs_uses_shared_client(self):
+        """Test fetch_packs and fetch_remote_manifest share the client."""
+        hub = HubClient("https://hub.example.com")
+        mock_response = Mock()
+        mock_response.content = json.dumps({"status": "success", "packs": []}).encode()
+        mock_response.raise_for_status = Mock()
+        mock_client = AsyncMock()
+        mock_client.is_closed = False
+        mock_client.get.return_value = mock_response
+        hub._client = mock_client
+        
+        assert await hub.fetch_packs() == []
+        await hub.fetch_remote_manifest("https://hub.example.com/manifest.json")
+        
+        assert mock_client.get.call_count == 2
+        mock_client.aclose.assert_not_called()
+        
+        await hub.aclose()
+        mock_client.aclose.assert_awaited_once()
+    
+    @pytest.mark.asyncio
+    async def test_fetch_packs_cache_ttl(self):
+        """Test fetch_packs serves the cache until the TTL expires."""
+        hub = HubClient("https://hub.example.com", cache_ttl=60)
+        mock_response = Mock()
+        mock_response.content = json.dumps({"status": "success", "packs": []}).encode()
+        mock_response.raise_for_status = Mock()
+        mock_client = AsyncMock()
+        mock_client.is_closed = False
+        mock_client.get.return_value = mock_response
+        hub._client = mock_client
+        
+        with patch("meme_stickers.sticker_pack.hub.time.monotonic", return_value=1000.0):
+            await hub.fetch_packs()
+            await hub.fetch_packs()
+        assert mock_client.get.call_count == 1
+        
+        with patch("meme_stickers.sticker_pack.hub.time.monotonic", return_value=1061.0):
+            await hub.fetch_packs()
+        assert mock_client.get.call_count == 2
+
+
+    @pytest.mark.asyncio
+    async def test_fetch_pack_info_lookup(self):
+        """Test fetch_pack_info resolves names from the cached index."""
+        hub = HubClient("https://hub.example.com")
+        mock_response = Mock()
+        mock_response.content = json.dumps({
+            "status": "success",
+            "packs": [
+                {"name": "pjsk", "version": "1.0.0"},
+                {"name": "arcaea", "version": "2.0.0"},
+                {"name": "pjsk", "version": "9.9.9"},
+            ],
+        }).encode()
+        mock_response.raise_for_status = Mock()
+        mock_client = AsyncMock()
+        mock_client.is_closed = False
+        mock_client.get.return_value = mock_response
+        hub._client = mock_client
+        
+        assert (await hub.fetch_pack_info("arcaea")).version == "2.0.0"
+        assert (await hub.fetch_pack_info("pjsk")).version == "1.0.0"
+        assert await hub.fetch_pack_info("missing") is None
+        assert mock_client.get.call_count == 1
+        
+        hub.clear_cache()
+        assert hub._pack_index == {}
+
+
+class TestHubClientDownload:
+    """Test HubClient.download_pack."""
+    
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("encoding", [None, "gzip"])
+    async def test_download_pack(self, tmp_path, encoding):
+        """Test downloads are written intact with and without content encoding."""
+        import gzip
+        import httpx
+        data = bytes(range(256)) * 8192
+        
+        def handler(request):
+            if encoding == "gzip":
+                return httpx.Response(
+                    200,
+                    stream=httpx.ByteStream(gzip.compress(data)),
+                    headers={"Content-Encoding": "gzip"},
+                )
+            return httpx.Response(200, stream=httpx.ByteStream(data))
+        
+        hub = HubClient("https://hub.example.com")
+        hub._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        output_path = tmp_path / "pack.zip"
+        output_path.write_bytes(b"stale contents that are longer than nothing")
+        
+        async with hub:
+            result = await hub.download_pack("https://hub.example.com/pack.zip", str(output_path))
+        
+        assert result == str(output_path)
+        assert output_path.read_bytes() == data
+    
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("encoding", [None, "gzip"])
+    async def test_download_and_hash(self, tmp_path, encoding):
+        """Test the streamed digest matches hashing the written file."""
+        import gzip
+        import hashlib
+        import httpx
+        data = bytes(range(256)) * 8192
+        
+        def handler(request):
+            if encoding == "gzip":
+                return httpx.Response(
+                    200,
+                    stream=httpx.ByteStream(gzip.compress(data)),
+                    headers={"Content-Encoding": "gzip"},
+                )
+            return httpx.Response(200, stream=httpx.ByteStream(data))
+        
+        hub = HubClient("https://hub.example.com")
+        hub._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        output_path = tmp_path / "pack.zip"
+        
+        async with hub:
+            result, digest = await hub.download_and_hash(
+                "https://hub.example.com/pack.zip", str(output_path), "sha256"
+            )
+        
+        assert result == str(output_path)
+        assert digest == hashlib.sha256(data).hexdigest()
+        assert digest == hub.calculate_checksum(str(output_path), "sha256")
+        
+        with pytest.raises(ValueError, match="Unsupported algorithm"):
+            await hub.download_and_hash("https://hub.example.com/pack.zip", str(output_path), "nope")
 
 
 class TestFetchHubIndex:
@@ -216,7 +515,7 @@ class TestFetchHubIndex:
         """Test successful hub index fetch."""
         mock_client = AsyncMock()
         mock_response = Mock()
-        mock_response.json.return_value = [
+        mock_response.content = json.dumps([
             {
                 "slug": "pjsk",
                 "source": {
@@ -227,7 +526,7 @@ class TestFetchHubIndex:
                     "path": "pjsk"
                 }
             }
-        ]
+        ]).encode()
         mock_client.get.return_value = mock_response
         
         result = await fetch_hub_index("http://example.com/manifest.json", mock_client)
@@ -251,7 +550,7 @@ class TestFetchHubIndex:
         """Test hub index fetch with invalid JSON."""
         mock_client = AsyncMock()
         mock_response = Mock()
-        mock_response.json.side_effect = ValueError("Invalid JSON")
+        mock_response.content = b"not json"
         mock_client.get.return_value = mock_response
         
         with pytest.raises(HubError, match="Invalid JSON"):
@@ -264,7 +563,7 @@ class TestFetchHubIndex:
             mock_client = AsyncMock()
             mock_client_class.return_value = mock_client
             mock_response = Mock()
-            mock_response.json.return_value = [
+            mock_response.content = json.dumps([
                 {
                     "slug": "pjsk",
                     "source": {
@@ -275,7 +574,7 @@ class TestFetchHubIndex:
                         "path": "pjsk"
                     }
                 }
-            ]
+            ]).encode()
             mock_client.get.return_value = mock_response
             
             result = await fetch_hub_index("http://example.com/manifest.json", None)
@@ -299,13 +598,13 @@ class TestFetchPackManifest:
         
         mock_client = AsyncMock()
         mock_response = Mock()
-        mock_response.json.return_value = {
+        mock_response.content = json.dumps({
             "name": "pjsk",
             "display_name": "Project SEKAI",
             "description": "Project SEKAI stickers",
             "version": "1.0.0",
             "author": "lgc"
-        }
+        }).encode()
         mock_client.get.return_value = mock_response
         
         result = await fetch_pack_manifest(
@@ -351,7 +650,7 @@ class TestFetchPackManifest:
         
         mock_client = AsyncMock()
         mock_response = Mock()
-        mock_response.json.side_effect = ValueError("Invalid JSON")
+        mock_response.content = b"not json"
         mock_client.get.return_value = mock_response
         
         with pytest.raises(HubError, match="Invalid JSON"):
@@ -362,6 +661,88 @@ class TestFetchPackManifest:
             )
 
 
+class TestFetchAllPackManifests:
+    """Test fetch_all_pack_manifests function."""
+    
+    @pytest.mark.asyncio
+    async def test_fetch_all_preserves_order(self):
+        """Test manifests come back in source order over one client."""
+        sources = [
+            GitHubSource(owner="owner", repo="repo", path=f"pack{i}")
+            for i in range(5)
+        ]
+        
+        async def get(url):
+            response = Mock()
+            response.raise_for_status = Mock()
+            response.content = json.dumps({"url": url}).encode()
+            return response
+        
+        mock_client = AsyncMock()
+        mock_client.get.side_effect = get
+        
+        result = await fetch_all_pack_manifests(
+            sources,
+            "https://raw.githubusercontent.com/{owner}/{repo}/{ref}/{path}",
+            mock_client,
+            max_concurrent=2,
+        )
+        
+        assert [m["url"].split("/")[-2] for m in result] == [f"pack{i}" for i in range(5)]
+        assert mock_client.get.call_count == 5
+        mock_client.aclose.assert_not_called()
+    
+    @pytest.mark.asyncio
+    async def test_fetch_all_error(self):
+        """Test a failing manifest raises HubError."""
+        import httpx
+        mock_client = AsyncMock()
+        mock_client.get.side_effect = httpx.HTTPError("Network error")
+        
+        with pytest.raises(HubError, match="Failed to fetch pack manifest"):
+            await fetch_all_pack_manifests(
+                [GitHubSource(owner="owner", repo="repo", path="pack")],
+                "https://raw.githubusercontent.com/{owner}/{repo}/{ref}/{path}",
+                mock_client,
+            )
+    
+    @pytest.mark.asyncio
+    async def test_fetch_all_error_cancels_siblings(self):
+        """Test remaining requests are cancelled before the client closes."""
+        import asyncio
+        import httpx
+        events = []
+        
+        async def get(url):
+            if url.endswith("/bad/metadata.json"):
+                raise httpx.HTTPError("Network error")
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                events.append("cancelled")
+                raise
+        
+        async def aclose():
+            events.append("closed")
+        
+        mock_client = AsyncMock()
+        mock_client.get.side_effect = get
+        mock_client.aclose.side_effect = aclose
+        sources = [
+            GitHubSource(owner="owner", repo="repo", path=path)
+            for path in ("slow1", "bad", "slow2")
+        ]
+        
+        with patch("meme_stickers.sticker_pack.hub.httpx.AsyncClient", return_value=mock_client):
+            with pytest.raises(HubError):
+                await fetch_all_pack_manifests(
+                    sources,
+                    "https://raw.githubusercontent.com/{owner}/{repo}/{ref}/{path}",
+                )
+        
+        assert events == ["cancelled", "cancelled", "closed"]
+
+
 class TestManagerGetHubPacks:
     """Test StickerPackManager.get_hub_packs method."""
     
@@ -405,6 +786,53 @@ class TestManagerGetHubPacks:
                 
                 with pytest.raises(ManagerError):
                     await manager.get_hub_packs()
+    
+    @pytest.mark.asyncio
+    async def test_get_hub_packs_cached(self):
+        """Test the hub index is reused within the TTL."""
+        import tempfile
+        from pathlib import Path
+        from meme_stickers.sticker_pack.manager import StickerPackManager, ManagerError
+        
+        with tempfile.TemporaryDirectory() as tmpdir:
+            manager = StickerPackManager(Path(tmpdir))
+            source = GitHubSource(owner="o", repo="r", branch="main", path="p")
+            
+            with patch("meme_stickers.sticker_pack.manager.fetch_hub_index") as mock_fetch:
+                mock_fetch.return_value = [HubPackReference(slug="pjsk", source=source)]
+                
+                await manager.get_hub_packs()
+                result = await manager.get_hub_packs()
+                assert [ref.slug for ref in result] == ["pjsk"]
+                assert mock_fetch.call_count == 1
+                
+                await manager.get_hub_packs(refresh=True)
+                assert mock_fetch.call_count == 2
+                
+                # Errors drop the cached index
+                mock_fetch.side_effect = HubError("Network error")
+                with pytest.raises(ManagerError):
+                    await manager.get_hub_packs(refresh=True)
+                assert manager._hub_index_cache is None
+
+
+class TestManagerClose:
+    """Test StickerPackManager releases its hub client."""
+    
+    @pytest.mark.asyncio
+    async def test_aclose_closes_hub_client(self, tmp_path):
+        """Test aclose and the async context manager close the HTTP client."""
+        from meme_stickers.sticker_pack.manager import StickerPackManager
+        
+        manager = StickerPackManager(tmp_path)
+        client = manager.hub_client.get_client()
+        await manager.aclose()
+        assert client.is_closed
+        assert manager.hub_client._client is None
+        
+        async with StickerPackManager(tmp_path) as manager:
+            client = manager.hub_client.get_client()
+        assert client.is_closed
 
 
 class TestManagerInstallFromHub:
@@ -4,6 +4,7 @@ Integration tests for sticker pack manager.
 Tests loading, installing, updating, and deleting packs using temporary directories.
 """
 
+import os
 import sys
 import asyncio
 import json
@@ -24,6 +25,7 @@ from meme_stickers.sticker_pack import (
     PackState,
     PackEvent,
     Pack,
+    PackUpdater,
 )
 
 
@@ -146,9 +148,16 @@ class MockHubClient:
             shutil.copy(url, output_path)
         return output_path
     
+    async def download_and_hash(self, url: str, output_path: str, algorithm: str = "md5"):
+        await self.download_pack(url, output_path)
+        return output_path, self.calculate_checksum(output_path, algorithm)
+    
     def calculate_checksum(self, file_path: str, algorithm: str = "md5") -> str:
         return "test_checksum"
     
+    async def calculate_checksum_async(self, file_path: str, algorithm: str = "md5") -> str:
+        return self.calculate_checksum(file_path, algorithm)
+    
     def clear_cache(self) -> None:
         pass
 
@@ -187,6 +196,21 @@ async def test_pack_loading():
         print("✓ Packs loaded successfully")
         print(f"  - Found {len(packs)} packs: {', '.join(packs)}")
         print(f"  - pack1: {len(manifest1.stickers)} stickers")
+        
+        # A broken pack does not stop the others from loading
+        broken_dir = temp_path / "packs" / "broken"
+        broken_dir.mkdir()
+        (broken_dir / "metadata.json").write_text("{not json")
+        (temp_path / "packs" / ".hidden").mkdir()
+        await manager.reload()
+        assert manager.list_packs() == ["pack1", "pack2"], f"Unexpected packs: {manager.list_packs()}"
+        print("✓ Broken and hidden packs skipped")
+        
+        # Packs beyond one batch are all loaded
+        manager.RELOAD_BATCH_SIZE = 1
+        await manager.reload()
+        assert manager.list_packs() == ["pack1", "pack2"], "Batched reload missed packs"
+        print("✓ Packs loaded in batches")
 
 
 async def test_pack_validation():
@@ -215,7 +239,112 @@ async def test_pack_validation():
         invalid_pack = Pack(invalid_dir)
         is_valid = await invalid_pack.validate()
         assert not is_valid, "Invalid pack passed validation"
+        
+        # Stickers directory with only non-sticker files
+        (invalid_dir / "stickers").mkdir()
+        (invalid_dir / "stickers" / "readme.txt").write_text("no stickers here")
+        assert not await invalid_pack.validate(), "Pack without stickers passed validation"
         print("✓ Invalid pack failed validation as expected")
+        
+        # A fresh discovery result is reused instead of rescanning
+        await pack.discover_stickers()
+        with patch("meme_stickers.sticker_pack.pack.os.scandir", side_effect=AssertionError("rescanned")):
+            assert await pack.validate()
+        print("✓ Validation reuses the sticker scan")
+
+
+async def test_manifest_cache():
+    """Test manifests are reused until the file changes"""
+    print("=" * 60)
+    print("Test: Manifest Cache")
+    print("=" * 60)
+    
+    with tempfile.TemporaryDirectory() as temp_dir:
+        temp_path = Path(temp_dir)
+        pack_dir = create_test_pack_directory(temp_path, "cached_pack", 1)
+        
+        first = await Pack(pack_dir).load_manifest()
+        first.stickers = ["replaced"]
+        with patch("meme_stickers.sticker_pack.pack._json.loads", side_effect=AssertionError("reparsed")):
+            second = await Pack(pack_dir).load_manifest()
+        assert second is not first and second.stickers == [], "Cached manifest was modified"
+        print("✓ Unchanged manifest served from cache")
+        
+        manifest_data = create_test_manifest(name="cached_pack", version="2.0.0")
+        (pack_dir / "metadata.json").write_text(json.dumps(manifest_data, indent=4))
+        third = await Pack(pack_dir).load_manifest()
+        assert third.version == "2.0.0", "Changed manifest not reloaded"
+        print("✓ Changed manifest reloaded")
+        
+        # Saved manifests keep the indented, non-ASCII-preserving format
+        pack = Pack(pack_dir)
+        pack.manifest = third
+        pack.manifest.display_name = "表情包"
+        await pack.save_manifest()
+        saved = (pack_dir / "metadata.json").read_text(encoding="utf-8")
+        assert saved == json.dumps(pack.manifest.to_dict(), ensure_ascii=False, indent=2)
+        assert (await Pack(pack_dir).load_manifest()).display_name == "表情包"
+        print("✓ Manifest saved and reloaded")
+        
+        from meme_stickers.sticker_pack import pack as pack_module
+        assert str(pack_dir / "metadata.json") in pack_module._MANIFEST_CACHE
+        await pack.save_manifest()
+        assert str(pack_dir / "metadata.json") not in pack_module._MANIFEST_CACHE
+        print("✓ Saving drops the cached manifest")
+        
+        with patch.object(pack_module, "_MANIFEST_CACHE_SIZE", 2):
+            for i in range(3):
+                extra_dir = create_test_pack_directory(temp_path, f"extra_{i}", 1)
+                await Pack(extra_dir).load_manifest()
+            assert len(pack_module._MANIFEST_CACHE) == 2
+            assert str(temp_path / "extra_0" / "metadata.json") not in pack_module._MANIFEST_CACHE
+        print("✓ Manifest cache stays bounded")
+
+
+async def test_sticker_discovery():
+    """Test sticker discovery and lookup"""
+    print("=" * 60)
+    print("Test: Sticker Discovery")
+    print("=" * 60)
+    
+    with tempfile.TemporaryDirectory() as temp_dir:
+        temp_path = Path(temp_dir)
+        pack_dir = create_test_pack_directory(temp_path, "discovery_pack", 3)
+        stickers_dir = pack_dir / "stickers"
+        (stickers_dir / "notes.txt").write_text("not a sticker")
+        (stickers_dir / "LOUD.PNG").write_bytes(b"fake image data")
+        (stickers_dir / "nested.png").mkdir()
+        (stickers_dir / ".png").write_bytes(b"no stem")
+        
+        pack = Pack(pack_dir)
+        stickers = await pack.discover_stickers()
+        names = [sticker.name for sticker in stickers]
+        assert names == ["LOUD", "sticker_0", "sticker_1", "sticker_2"], f"Unexpected stickers: {names}"
+        assert stickers[1].path == str(Path("stickers") / "sticker_0.png")
+        print(f"✓ Discovered {len(stickers)} stickers")
+        
+        # Unchanged directory is served from the cache
+        with patch("meme_stickers.sticker_pack.pack.os.scandir", side_effect=AssertionError("rescanned")):
+            assert [sticker.name for sticker in await pack.discover_stickers()] == names
+        
+        # Adding a file changes the directory mtime and triggers a rescan
+        (stickers_dir / "sticker_3.webp").write_bytes(b"fake image data")
+        mtime_ns = os.stat(stickers_dir).st_mtime_ns
+        os.utime(stickers_dir, ns=(mtime_ns, mtime_ns + 1_000_000_000))
+        assert "sticker_3" in await pack.list_stickers(), "New sticker not discovered"
+        print("✓ Sticker scan cached until the directory changes")
+        
+        assert pack.get_sticker_path("LOUD") == stickers_dir / "LOUD.PNG"
+        assert pack.get_sticker_path("notes") is None
+        assert pack.get_sticker_bytes("sticker_2") == b"fake image data"
+        with patch("meme_stickers.sticker_pack.pack.os.scandir", side_effect=AssertionError("rescanned")):
+            assert pack.get_sticker_path("sticker_3") == stickers_dir / "sticker_3.webp"
+        
+        # Removing a file drops it from the index on the next lookup
+        (stickers_dir / "sticker_0.png").unlink()
+        os.utime(stickers_dir, ns=(mtime_ns, mtime_ns + 2_000_000_000))
+        assert pack.get_sticker_path("sticker_0") is None
+        print("✓ Sticker lookup works")
 
 
 async def test_pack_event_callbacks():
@@ -253,6 +382,19 @@ async def test_pack_event_callbacks():
         print("✓ Pack events captured successfully")
         print(f"  - Total events: {len(events_captured)}")
         print(f"  - Event states: {set(s.value for s in states)}")
+        
+        # Duplicate registrations fire once; removed callbacks stop firing
+        manager.on_pack_state_change(capture_event)
+        events_captured.clear()
+        await manager.reload()
+        assert len(events_captured) == 2, f"Expected 2 events, got {len(events_captured)}"
+        
+        manager.off_pack_state_change(capture_event)
+        manager.off_pack_state_change(capture_event)
+        events_captured.clear()
+        await manager.reload()
+        assert events_captured == [], "Removed callback still called"
+        print("✓ Callbacks de-duplicated and removable")
 
 
 async def test_manifest_serialization():
@@ -376,7 +518,19 @@ async def test_install_pack():
             assert manifest.name == "new_pack"
             assert len(manifest.stickers) == 3
             
+            leftovers = [p.name for p in temp_path.iterdir() if p.name.startswith(".tmp-")]
+            assert not leftovers, f"Temp directories left behind: {leftovers}"
+            
             print("✓ Pack installed successfully")
+            
+            # Reinstalling replaces the existing pack in place
+            pack_zip = create_test_pack_zip(temp_path, "new_pack", 5)
+            await manager.install_pack(hub_pack)
+            assert len(manager.get_manifest("new_pack").stickers) == 5
+            packs_dir = temp_path / "packs"
+            assert sorted(p.name for p in packs_dir.iterdir()) == ["new_pack"]
+            
+            print("✓ Pack reinstalled over the existing copy")
         except Exception as e:
             import traceback
             print(f"✗ Install failed: {e}")
@@ -384,6 +538,106 @@ async def test_install_pack():
             raise
 
 
+async def test_update_pack_failure_keeps_old_pack():
+    """Test a failed update leaves the installed pack in place"""
+    print("=" * 60)
+    print("Test: Failed Update")
+    print("=" * 60)
+    
+    with tempfile.TemporaryDirectory() as temp_dir:
+        temp_path = Path(temp_dir)
+        manifest_data = create_test_manifest(name="old_pack")
+        manifest_data["url"] = "https://example.com/old_pack.zip"
+        create_test_pack_directory(temp_path / "packs", "old_pack", 2, manifest_data)
+        
+        # Archive without metadata.json fails validation
+        bad_zip = temp_path / "bad.zip"
+        with zipfile.ZipFile(bad_zip, "w") as zf:
+            zf.writestr("old_pack/stickers/sticker_0.png", b"new image data")
+        
+        hub_client = MockHubClient()
+        hub_client.packs["old_pack"] = HubPackInfo(
+            name="old_pack",
+            display_name="Old Pack",
+            description="",
+            url=str(bad_zip),
+            version="2.0.0",
+            author="Test",
+        )
+        
+        manager = StickerPackManager(temp_path)
+        manager.hub_client = hub_client
+        manager.updater.hub_client = hub_client
+        await manager.reload()
+        
+        try:
+            await manager.update_pack("old_pack")
+        except Exception:
+            pass
+        else:
+            raise AssertionError("Update with a bad archive succeeded")
+        
+        pack_dir = temp_path / "packs" / "old_pack"
+        assert (pack_dir / "metadata.json").exists(), "Old pack removed by failed update"
+        assert (pack_dir / "stickers" / "sticker_0.png").read_bytes() == b"fake image data"
+        assert sorted(p.name for p in (temp_path / "packs").iterdir()) == ["old_pack"]
+        print("✓ Old pack survives a failed update")
+
+
+async def test_extract_pack():
+    """Test pack zip extraction"""
+    print("=" * 60)
+    print("Test: Pack Extraction")
+    print("=" * 60)
+    
+    updater = PackUpdater(MockHubClient())
+    
+    with tempfile.TemporaryDirectory() as temp_dir:
+        temp_path = Path(temp_dir)
+        
+        # Enough members for the parallel path, including a nested directory
+        pack_zip = create_test_pack_zip(temp_path, "big_pack", 40)
+        with zipfile.ZipFile(pack_zip, "a") as zf:
+            zf.writestr("big_pack/stickers/extra/", "")
+            zf.writestr("big_pack/stickers/extra/deep.png", b"deep")
+        
+        with patch("meme_stickers.sticker_pack.update._EXTRACT_WORKERS", 4):
+            pack_dir = await updater.extract_pack(pack_zip, temp_path / "out")
+        assert pack_dir == temp_path / "out" / "big_pack"
+        sticker_files = sorted(p.name for p in (pack_dir / "stickers").glob("*.png"))
+        assert len(sticker_files) == 40, f"Extracted {len(sticker_files)} stickers"
+        assert (pack_dir / "stickers" / "extra" / "deep.png").read_bytes() == b"deep"
+        assert json.loads((pack_dir / "metadata.json").read_text())["name"] == "big_pack"
+        print("✓ Large pack extracted in parallel")
+        
+        # Names zipfile sanitizes go through extractall and stay inside the target
+        unsafe_zip = temp_path / "unsafe.zip"
+        with zipfile.ZipFile(unsafe_zip, "w") as zf:
+            for i in range(20):
+                zf.writestr(f"pack/s{i}.png", b"x")
+            zf.writestr("../escape.png", b"x")
+        with patch("meme_stickers.sticker_pack.update._EXTRACT_WORKERS", 4):
+            await updater.extract_pack(unsafe_zip, temp_path / "unsafe_out")
+        assert not (temp_path / "escape.png").exists()
+        assert (temp_path / "unsafe_out" / "escape.png").exists()
+        print("✓ Unsafe member names are sanitized")
+
+
+async def test_compare_versions():
+    """Test update version comparison"""
+    print("=" * 60)
+    print("Test: Version Comparison")
+    print("=" * 60)
+    
+    updater = PackUpdater(MockHubClient())
+    assert updater._compare_versions("1.10.0", "1.9.9") == 1
+    assert updater._compare_versions("1.0.0", "1.0.1") == -1
+    assert updater._compare_versions("2.0", "2.0") == 0
+    assert updater._compare_versions("1.0.0", "1.0") == 1
+    assert updater._compare_versions("beta", "0.1") == -1
+    print("✓ Versions compare numerically")
+
+
 async def test_delete_pack():
     """Test pack deletion"""
     print("=" * 60)
@@ -409,6 +663,13 @@ async def test_delete_pack():
         # Verify pack deleted
         assert "delete_me" not in manager.list_packs()
         assert not (temp_path / "packs" / "delete_me").exists()
+        config_file = temp_path / "config.json"
+        assert config_file.exists(), "Config not saved after delete"
+        assert not [p.name for p in temp_path.iterdir() if p.name.endswith(".tmp")]
+        
+        # Saving an unchanged config does not rewrite the file
+        with patch("meme_stickers.sticker_pack.manager.os.replace", side_effect=AssertionError("rewritten")):
+            await manager._save_config()
         
         print("✓ Pack deleted successfully")
 
@@ -468,10 +729,15 @@ async def run_all_tests():
         ("Manifest Serialization", test_manifest_serialization),
         ("Config Serialization", test_config_serialization),
         ("Pack Validation", test_pack_validation),
+        ("Manifest Cache", test_manifest_cache),
+        ("Sticker Discovery", test_sticker_discovery),
         ("Pack Loading", test_pack_loading),
         ("Pack Event Callbacks", test_pack_event_callbacks),
         ("Hub Pack Listing", test_hub_pack_listing),
         ("Pack Installation", test_install_pack),
+        ("Failed Update", test_update_pack_failure_keeps_old_pack),
+        ("Pack Extraction", test_extract_pack),
+        ("Version Comparison", test_compare_versions),
         ("Pack Deletion", test_delete_pack),
     ]
     
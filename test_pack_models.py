@@ -54,6 +54,18 @@ def test_sticker_info_model():
     assert sticker.file_source == FileSource.LOCAL
     assert sticker.created_at == "2024-01-01T00:00:00"
     
+    # Fields stay mutable; slotted instances reject unknown attributes
+    sticker.path = "stickers/renamed.png"
+    assert sticker.path == "stickers/renamed.png"
+    if sys.version_info >= (3, 10):
+        assert not hasattr(sticker, "__dict__")
+        try:
+            sticker.extra = 1
+        except AttributeError:
+            pass
+        else:
+            raise AssertionError("StickerInfo accepted an undeclared attribute")
+    
     print("✓ StickerInfo model works correctly")
 
 
@@ -162,6 +174,12 @@ def test_pack_manifest_serialization():
     assert output_data["version"] == "2.0.0"
     assert len(output_data["stickers"]) == 1
     assert output_data["stickers"][0]["name"] == "sticker1"
+    assert type(output_data["stickers"][0]["file_source"]) is str
+    assert output_data["stickers"][0]["file_source"] == "local"
+    
+    # Plain strings assigned to file_source serialize as well
+    manifest.stickers[0].file_source = "remote"
+    assert manifest.to_dict()["stickers"][0]["file_source"] == "remote"
     
     print("✓ PackManifest serialization round-trip successful")
 
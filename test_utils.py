@@ -173,6 +173,36 @@ def test_calculate_file_checksum():
         Path(temp_path).unlink()
 
 
+def test_calculate_file_checksum_chunked():
+    """Test file checksum is independent of the read chunk size"""
+    import hashlib
+    import tempfile
+
+    data = bytes(range(256)) * 1000
+    with tempfile.NamedTemporaryFile(delete=False) as f:
+        f.write(data)
+        temp_path = f.name
+
+    try:
+        expected = hashlib.sha256(data).hexdigest()
+        assert calculate_file_checksum(temp_path, algorithm="sha256") == expected
+        assert calculate_file_checksum(temp_path, "sha256", chunk_size=1000) == expected
+    finally:
+        Path(temp_path).unlink()
+
+
+def test_calculate_checksum_blake3_unavailable():
+    """Test blake3 is rejected when the package is not installed"""
+    import meme_stickers._hashing as hashing
+
+    with patch.object(hashing, "_blake3", None):
+        try:
+            calculate_checksum(b"data", algorithm="blake3")
+            assert False, "Should have raised ValueError"
+        except ValueError:
+            pass
+
+
 def test_calculate_file_checksum_not_found():
     """Test file checksum with non-existent file"""
     try:
@@ -282,6 +312,52 @@ def test_json_dumps_sort_keys():
     assert a_line < z_line
 
 
+def test_json_dumps_matches_stdlib():
+    """Test default output is identical to json.dumps with the same settings"""
+    data = {"name": "测试", "items": [1, 2.5, None, True], "nested": {"empty": {}}}
+    for sort_keys in (False, True):
+        expected = json.dumps(data, ensure_ascii=False, indent=2, sort_keys=sort_keys)
+        assert json_dumps(data, sort_keys=sort_keys) == expected
+    assert json_dumps({1: "a"}) == json.dumps({1: "a"}, indent=2)
+    assert json_dumps({"big": 1 << 70}) == json.dumps({"big": 1 << 70}, indent=2)
+
+    # Floats keep json.dumps formatting
+    floats = {"nan": float("nan"), "small": 1e-07, "large": 1e16, "half": 2.5}
+    assert json_dumps(floats) == json.dumps(floats, ensure_ascii=False, indent=2)
+
+
+def test_json_dumps_rejects_non_json_types():
+    """Test values json.dumps cannot encode still raise TypeError"""
+    import dataclasses
+    import datetime
+    import enum
+    import uuid
+
+    @dataclasses.dataclass
+    class Point:
+        x: int
+
+    class Color(enum.Enum):
+        RED = "red"
+
+    values = [datetime.date(2024, 1, 1), Point(1), uuid.uuid4(), Color.RED]
+    for value in values:
+        try:
+            json_dumps({"value": value})
+            assert False, f"Should have raised TypeError for {value!r}"
+        except TypeError:
+            pass
+
+    # Circular references raise the same error as json.dumps
+    data = []
+    data.append(data)
+    try:
+        json_dumps(data)
+        assert False, "Should have raised ValueError"
+    except ValueError:
+        pass
+
+
 # ============================================================================
 # Tests for exception_notify context manager
 # ============================================================================
@@ -491,6 +567,8 @@ if __name__ == "__main__":
         test_calculate_checksum_bytes,
         test_calculate_checksum_invalid_algorithm,
         test_calculate_file_checksum,
+        test_calculate_file_checksum_chunked,
+        test_calculate_checksum_blake3_unavailable,
         test_calculate_file_checksum_not_found,
         # Number parsing tests
         test_parse_relative_number_plain,
@@ -505,6 +583,8 @@ if __name__ == "__main__":
         test_json_dumps_ensure_ascii_false,
         test_json_dumps_with_indent,
         test_json_dumps_sort_keys,
+        test_json_dumps_matches_stdlib,
+        test_json_dumps_rejects_non_json_types,
         # exception_notify tests
         test_exception_notify_no_error,
         test_exception_notify_with_reraise,